@@ -0,0 +1,91 @@
+"""
+startup-time benchmark for main.py.
+
+measures the cold-start wall clock of a few cli invocations (fresh interpreter every run)
+and the import time per module reported by python -X importtime.
+
+usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --top 25
+"""
+import argparse
+import os.path
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> argv passed to main.py
+SCENARIOS: dict = {
+    'help': ['--help'],
+    'argument error': ['someone@school.org', 'teacher'],
+    'import role cli': None
+}
+
+
+def scenario_command(argv: list or None) -> list:
+    if argv is None:
+        return [sys.executable, '-c', 'import src.cli.gcc_teacher_cli']
+    return [sys.executable, 'main.py', *argv]
+
+
+def wall_clock(command: list, runs: int) -> list[float]:
+    """
+    this func defines the wall_clock function, runs command in a fresh interpreter runs times.
+
+    :param command: argv 'list'
+    :param runs: number of runs 'int'
+    :return: list of durations in seconds
+    """
+    durations: list = list()
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def import_times(command: list) -> list[tuple]:
+    """
+    this func defines the import_times function, parses python -X importtime output of command.
+
+    :param command: argv 'list'
+    :return: list of (module, self us, cumulative us) sorted by cumulative time
+    """
+    command = [command[0], '-X', 'importtime', *command[1:]]
+    result = subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    modules: list = list()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        modules.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return sorted(modules, key=lambda module: module[2], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='cold-start benchmark of the google classroom cli')
+    parser.add_argument('--runs', type=int, default=10, help='runs per scenario')
+    parser.add_argument('--top', type=int, default=15, help='number of modules listed per scenario')
+    args = parser.parse_args()
+
+    for name, argv in SCENARIOS.items():
+        command: list = scenario_command(argv)
+        durations: list = wall_clock(command, args.runs)
+        print(f'{name}: median {statistics.median(durations) * 1000:.1f} ms, '
+              f'min {min(durations) * 1000:.1f} ms over {args.runs} runs')
+
+        modules: list = import_times(command)
+        total: int = sum(self_us for _, self_us, _ in modules)
+        print(f'  imports: {len(modules)} modules, {total / 1000:.1f} ms')
+        for module, self_us, cumulative_us in modules[:args.top]:
+            print(f'    {cumulative_us / 1000:8.1f} ms cumulative {self_us / 1000:8.1f} ms self  {module}')
+        print()
+
+
+if __name__ == '__main__':
+    main()
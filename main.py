@@ -2,4 +2,7 @@ from src.cli.gcc_main_cli import main
 
 if __name__ == "__main__":
     # import pdb; pdb.set_trace()
-    print(main())
\ No newline at end of file
+    result = main()
+    # --batch streams its results itself
+    if result is not None:
+        print(result)
\ No newline at end of file
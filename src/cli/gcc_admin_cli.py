@@ -28,13 +28,16 @@ class AdminCli:
         return self.__service
 
 
-    def method_nav(self, email=None, work_space=None, ref_cache_month=12):
-        admin_user: Admin = Admin(
-            role='admin',
-            ref_cache_month=ref_cache_month,
-            email=email,
-            work_space=work_space
-        )
+    def method_nav(self, email=None, work_space=None, ref_cache_month=12, user: Admin = None):
+        if user is not None:
+            admin_user: Admin = user
+        else:
+            admin_user: Admin = Admin(
+                role='admin',
+                ref_cache_month=ref_cache_month,
+                email=email,
+                work_space=work_space
+            )
         if self.service == 'courses':
             if self.method == 'd_create':
                 return admin_user.detailed_create_course(
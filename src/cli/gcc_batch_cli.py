@@ -0,0 +1,106 @@
+"""
+bulk mode of main.py, runs a file of commands on one shared client.
+
+    python main.py someone@school.org teacher --batch commands.jsonl --jobs 8
+
+every line is either a json object of the options, keyed by the argparse destinations
+(or "service" / "method" for -s / -m):
+    {"s": "course_work", "m": "get", "c_id": 1, "c_w_id": "2"}
+or the options as typed on the command line:
+    -s course_work -m get --c_id 1 --c_w_id 2
+blank lines and lines starting with # are skipped, the account and role always come from the command line.
+one json object per input line is written to the output, in input order:
+    {"line": 1, "ok": true, "result": {...}} / {"line": 2, "ok": false, "type": "...", "error": "..."}
+"""
+import argparse
+import json
+import shlex
+import sys
+
+from src.cli.gcc_main_cli import build_sort, build_user, run
+
+__all__ = [
+    'read_commands',
+    'run_batch'
+]
+
+# json keys accepted for the short argparse destinations
+key_aliases = {
+    'service': 's',
+    'method': 'm'
+}
+
+
+def parse_command(parser: argparse.ArgumentParser, line: str, base: dict) -> dict:
+    """
+    this func defines the parse_command function, turns a batch line into a main.py namespace dict.
+
+    :param parser: the main.py argument parser
+    :param line: json object or command line options 'string'
+    :param base: the namespace of the batch invocation, supplies the account, role and defaults 'dict'
+    :return: namespace dict
+    """
+    if line.startswith('{'):
+        args: dict = dict(base)
+        for key, value in json.loads(line).items():
+            args[key_aliases.get(key, key)] = value
+    else:
+        try:
+            args: dict = vars(parser.parse_args([base['a'], base['r'], *shlex.split(line)]))
+        except SystemExit:
+            raise ValueError(f'Invalid command line: {line}')
+
+    args['a'], args['r'] = base['a'], base['r']
+    args['batch'] = args['daemon'] = None
+    if not args.get('s') or not args.get('m'):
+        raise ValueError('service (s) and method (m) are required')
+    return args
+
+
+def read_commands(stream) -> list[tuple]:
+    """
+    :param stream: file object of batch lines
+    :return: list of (line number, line) of the lines to run
+    """
+    commands: list = list()
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if line and not line.startswith('#'):
+            commands.append((number, line))
+    return commands
+
+
+def run_batch(parser: argparse.ArgumentParser, base: dict, output=None) -> None:
+    """
+    this func defines the run_batch function, runs every line of base['batch'] on one client
+    and writes a json line per result to output.
+    with jobs > 1 lines run on a thread pool, every worker thread has its own classroom service.
+
+    :param parser: the main.py argument parser
+    :param base: the namespace of the batch invocation 'dict'
+    :param output: file object the results are written to, defaults to stdout
+    """
+    output = output or sys.stdout
+    if base['batch'] == '-':
+        commands: list = read_commands(sys.stdin)
+    else:
+        with open(base['batch'], 'r', encoding='utf-8') as file:
+            commands: list = read_commands(file)
+
+    user = build_user(build_sort(base))
+
+    def run_command(number: int, line: str) -> dict:
+        try:
+            result = run(parse_command(parser, line, base), user=user)
+            return {'line': number, 'ok': True, 'result': result}
+        except Exception as error:
+            return {'line': number, 'ok': False, 'type': type(error).__name__, 'error': str(error)}
+
+    if base.get('jobs', 1) > 1:
+        results = (result for _, result in user.map_concurrent(run_command, commands, max_workers=base['jobs']))
+    else:
+        results = (run_command(number, line) for number, line in commands)
+
+    for result in results:
+        output.write(json.dumps(result, default=str) + '\n')
+        output.flush()
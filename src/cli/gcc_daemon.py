@@ -0,0 +1,215 @@
+"""
+long-lived local daemon that keeps warm Admin / Teacher / Student clients per account.
+
+start it once:
+    python -m src.cli.gcc_daemon
+then forward calls to it:
+    python main.py someone@school.org teacher -s course_work -m get --c_id 1 --c_w_id 2 --daemon
+
+the protocol is one json object per line over a unix socket, both ways:
+    request  {"op": "call", "args": {<the argparse namespace of main.py>}}
+             {"op": "ping"} / {"op": "shutdown"}
+    response {"ok": true, "result": ...} / {"ok": false, "type": "<exception class>", "error": "<message>"}
+
+this module only imports the standard library at import time, the thin client stays cheap to start.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+
+from src import gcc_exceptions
+
+__all__ = [
+    'DEFAULT_SOCKET',
+    'GccDaemon',
+    'forward',
+    'ping',
+    'shutdown'
+]
+
+DEFAULT_SOCKET: str = os.environ.get('GCC_DAEMON_SOCKET') or os.path.join(
+    tempfile.gettempdir(), f'gcc-daemon-{os.getuid() if hasattr(os, "getuid") else "user"}.sock')
+
+class _WarmClient:
+    """
+    a client with the lock that serializes its calls, httplib2 is not thread-safe.
+    the client gets a classroom service of its own, accounts falling back to the same token file would
+    otherwise share one service and http object across handler threads.
+    """
+
+    def __init__(self, user):
+        user.use_private_service()
+        self.user = user
+        self.lock = threading.Lock()
+
+
+class GccDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    unix socket server running main.py command lines on warm clients, one per (role, account, ref_cache).
+    calls of different accounts run in parallel, calls of the same account one at a time.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        if os.path.exists(socket_path):
+            probe: socket.socket = _connect(socket_path)
+            if probe is not None:
+                probe.close()
+                raise OSError(f'a gcc daemon is already listening on {socket_path}')
+            os.unlink(socket_path)
+
+        self.__socket_path: str = socket_path
+        self.__clients: dict = dict()
+        self.__clients_lock = threading.Lock()
+
+        # the socket carries calls made with the user's tokens, keep it private to the user
+        umask: int = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(umask)
+
+    @property
+    def socket_path(self):
+        return self.__socket_path
+
+    @property
+    def clients(self):
+        return dict(self.__clients)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.__socket_path):
+            os.unlink(self.__socket_path)
+
+    def warm_client(self, args: dict) -> _WarmClient:
+        """
+        this func defines the warm_client method, returns the cached client of the command line's account,
+        constructing it on first use.
+
+        :param args: the parsed argparse namespace as a dict 'dict'
+        :return: _WarmClient
+        """
+        from src.cli.gcc_main_cli import build_sort, build_user
+
+        sorting = build_sort(args)
+        key: tuple = (sorting.role, sorting.email, sorting.work_space, sorting.ref_cache)
+        with self.__clients_lock:
+            client: _WarmClient = self.__clients.get(key)
+            if client is None:
+                client = _WarmClient(build_user(sorting))
+                self.__clients[key] = client
+        return client
+
+    def call(self, args: dict):
+        from src.cli.gcc_main_cli import run
+
+        client: _WarmClient = self.warm_client(args)
+        with client.lock:
+            return run(args, user=client.user)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request: dict = json.loads(line)
+                op: str = request.get('op', 'call')
+                if op == 'ping':
+                    response: dict = {'ok': True, 'result': 'pong'}
+                elif op == 'shutdown':
+                    self.__send({'ok': True, 'result': None})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                elif op == 'call':
+                    response: dict = {'ok': True, 'result': self.server.call(request['args'])}
+                else:
+                    raise ValueError(f'Invalid op: {op}')
+            except Exception as error:
+                response: dict = {'ok': False, 'type': type(error).__name__, 'error': str(error)}
+            self.__send(response)
+
+    def __send(self, response: dict):
+        self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+
+def _connect(socket_path: str) -> socket.socket or None:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def _request(message: dict, socket_path: str = None) -> dict:
+    client: socket.socket = _connect(socket_path or DEFAULT_SOCKET)
+    if client is None:
+        raise gcc_exceptions.DaemonUnavailable()
+    # once connected the daemon may have run the call, a lost response must not be retried locally
+    try:
+        with client, client.makefile('rwb') as stream:
+            stream.write(json.dumps(message, default=str).encode('utf-8') + b'\n')
+            stream.flush()
+            line: bytes = stream.readline()
+    except OSError:
+        raise gcc_exceptions.DaemonNoResponse()
+    if not line:
+        raise gcc_exceptions.DaemonNoResponse()
+    return json.loads(line)
+
+
+def forward(args: dict, socket_path: str = None):
+    """
+    this func defines the forward function, runs a main.py command line on the daemon.
+
+    :param args: the parsed argparse namespace as a dict 'dict'
+    :param socket_path: unix socket of the daemon, defaults to DEFAULT_SOCKET 'string'
+    :return: the result of the called method, raises DaemonUnavailable when no daemon listens
+    and DaemonNoResponse when the connection is lost after the call was sent
+    """
+    response: dict = _request({'op': 'call', 'args': args}, socket_path)
+    if not response['ok']:
+        raise gcc_exceptions.DaemonError(f"{response['type']}: {response['error']}")
+    return response['result']
+
+
+def ping(socket_path: str = None) -> bool:
+    try:
+        return _request({'op': 'ping'}, socket_path)['ok']
+    except (gcc_exceptions.DaemonUnavailable, gcc_exceptions.DaemonNoResponse):
+        return False
+
+
+def shutdown(socket_path: str = None):
+    _request({'op': 'shutdown'}, socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gcc daemon, keeps warm classroom clients for main.py --daemon')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET, help='unix socket to listen on')
+    parser.add_argument('--stop', action='store_true', help='stop the daemon listening on --socket')
+    args = parser.parse_args()
+
+    if args.stop:
+        shutdown(args.socket)
+        return
+
+    with GccDaemon(args.socket) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
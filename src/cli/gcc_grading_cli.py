@@ -0,0 +1,49 @@
+"""
+bulk grading mode of main.py, applies a csv of grades to the student submissions of a teacher's courses.
+
+    python main.py teacher@school.org teacher --grades grades.csv --c_id 123 --return_graded
+
+the csv is either long (courseId, courseWorkId, userId or email, assignedGrade, draftGrade)
+or wide (userId, then a column per course work id, as written by Gradebook.to_csv),
+see gcc_grading.read_grades. --c_id is the course of rows without a courseId.
+with --dry_run only the plan is printed. a json summary of the run is printed when it finishes.
+"""
+import json
+import sys
+
+from src import gcc_exceptions
+from src.cli.gcc_main_cli import build_sort, build_user
+from src.gcc_grading import BulkGrader, read_grades
+
+__all__ = [
+    'run_grading'
+]
+
+
+def run_grading(base: dict) -> str:
+    """
+    this func defines the run_grading function, plans and applies the grades of base['grades'].
+
+    :param base: the namespace of the grading invocation 'dict'
+    :return: the json summary of the run 'string'
+    """
+    sorting = build_sort(base)
+    if sorting.role != 'teacher':
+        raise gcc_exceptions.UserError()
+    course_id: str or None = str(base['c_id']) if base.get('c_id') is not None else None
+
+    grader = BulkGrader(build_user(sorting), max_workers=max(1, base.get('jobs') or 1))
+    if base['grades'] == '-':
+        plan: dict = grader.plan(read_grades(sys.stdin, course_id=course_id))
+    else:
+        with open(base['grades'], 'r', encoding='utf-8', newline='') as file:
+            plan: dict = grader.plan(read_grades(file, course_id=course_id))
+
+    summary: dict = {'changes': sum(len(grades) for grades in plan['patches'].values()),
+                     'unchanged': plan['unchanged'],
+                     'missing': [change._asdict() for change in plan['missing']]}
+    if base.get('dry_run'):
+        summary['patches'] = plan['patches']
+    else:
+        summary.update(grader.apply(plan, return_submissions=bool(base.get('return_graded'))))
+    return json.dumps(summary)
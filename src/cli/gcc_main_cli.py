@@ -1,8 +1,7 @@
 import argparse
+import importlib
 import json
-from src.cli.gcc_admin_cli import AdminCli
-from src.cli.gcc_student_cli import StudentCli
-from src.cli.gcc_teacher_cli import TeacherCli
+from src import gcc_exceptions
 from src.gcc_validators import is_email
 
 possible_methods = [
@@ -35,6 +34,36 @@ possible_services = [
 ]
 
 
+# role -> (module, class), imported on dispatch so that --help and argument errors
+# never load googleapiclient / google-auth
+role_clis = {
+    'admin': ('src.cli.gcc_admin_cli', 'AdminCli'),
+    'teacher': ('src.cli.gcc_teacher_cli', 'TeacherCli'),
+    'student': ('src.cli.gcc_student_cli', 'StudentCli')
+}
+
+
+# role -> (module, class) of the classroom clients
+role_users = {
+    'admin': ('src.gcc_admin', 'Admin'),
+    'teacher': ('src.gcc_teacher', 'Teacher'),
+    'student': ('src.gcc_student', 'Student')
+}
+
+
+def load_role_cli(role: str):
+    """
+    this func defines the load_role_cli function, imports the cli class of a role.
+
+    :param role: admin / teacher / student 'string'
+    :return: AdminCli / TeacherCli / StudentCli class
+    """
+    if role not in role_clis:
+        raise ValueError(f"Invalid scan role: {role}")
+    module_name, class_name = role_clis[role]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class Sort:
     """
     orders the terminal command line.
@@ -62,25 +91,58 @@ class Sort:
     def role(self):
         return self.__role
 
-    def cli_nav(self, service, method, **kwargs):
+    def cli_nav(self, service, method, user=None, **kwargs):
+        """
+        :param user: an already constructed Admin / Teacher / Student to run the call on,
+        a new one is constructed if None
+        """
+        role_cli_class = load_role_cli(self.role)
+        role_cli = role_cli_class(service=service.lower(), method=method.lower(), **kwargs)
+        return role_cli.method_nav(email=self.email, work_space=self.work_space, ref_cache_month=self.ref_cache,
+                                   user=user)
 
-        if self.role == 'admin':
-            admin_cli = AdminCli(service=service.lower(), method=method.lower(), **kwargs)
-            return admin_cli.method_nav(email=self.email, work_space=self.work_space, ref_cache_month=self.ref_cache)
 
-        elif self.role == 'teacher':
-            teacher_cli = TeacherCli(service=service.lower(), method=method.lower(), **kwargs)
-            return teacher_cli.method_nav(email=self.email, work_space=self.work_space, ref_cache_month=self.ref_cache)
+# argparse destinations that are not forwarded to the role clis as params
+nav_excluded = ('a', 'r', 's', 'm', 'daemon', 'socket', 'batch', 'jobs', 'snapshot', 'resources', 'parquet',
+                'grades', 'return_graded', 'dry_run', 'roster')
 
-        elif self.role == 'student':
-            student_cli = StudentCli(service=service.lower(), method=method.lower(), **kwargs)
-            return student_cli.method_nav(email=self.email, work_space=self.work_space, ref_cache_month=self.ref_cache)
 
-        else:
-            raise ValueError(f"Invalid scan role: {self.role}")
+def build_sort(args: dict) -> Sort:
+    if is_email(args['a']):
+        return Sort(email=args['a'], role=args['r'], ref_cache=args.get('ref_cache'))
+    return Sort(work_space=args['a'], role=args['r'], ref_cache=args.get('ref_cache'))
 
 
-def main():
+def build_user(sorting: Sort):
+    """
+    this func defines the build_user function, constructs the Admin / Teacher / Student of a command line,
+    to share one client across several calls (see gcc_daemon, gcc_batch_cli).
+
+    :param sorting: Sort
+    :return: Admin / Teacher / Student
+    """
+    if sorting.role not in role_users:
+        raise gcc_exceptions.UserError()
+    module_name, class_name = role_users[sorting.role]
+    user_class = getattr(importlib.import_module(module_name), class_name)
+    return user_class(role=sorting.role, ref_cache_month=sorting.ref_cache,
+                      email=sorting.email, work_space=sorting.work_space)
+
+
+def run(args: dict, user=None):
+    """
+    this func defines the run function, dispatches a parsed command line to its role cli.
+
+    :param args: the parsed argparse namespace as a dict 'dict'
+    :param user: an already constructed Admin / Teacher / Student, a new one is constructed if None
+    :return: the result of the called method
+    """
+    sorting: Sort = build_sort(args)
+    params: dict = {key: value for key, value in args.items() if key not in nav_excluded}
+    return sorting.cli_nav(service=args['s'], method=args['m'], user=user, **params)
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description='Google Classroom CLI is a command-line interface tool'
                                                  'that allows users to interact with Google Classroom without leaving the terminal.'
                                                  'This project is currently under construction and is still a work in progress.'
@@ -146,60 +208,64 @@ def main():
     parser.add_argument('--alias', type=str, help='The alias')
     parser.add_argument('--t_email', type=str, help='teacher email')
     parser.add_argument('--inv_role', type=str, help='role for invitation')
+    parser.add_argument('--daemon', action='store_true',
+                        help='run the call on a running gcc daemon (python -m src.cli.gcc_daemon), '
+                             'runs locally when none is listening')
+    parser.add_argument('--socket', type=str, help='unix socket of the gcc daemon')
+    parser.add_argument('--batch', type=str, metavar='FILE',
+                        help='run every line of FILE (- for stdin) on one client, a line is either '
+                             'a json object of the options ({"s": "courses", "m": "get", "c_id": 1}) '
+                             'or the options as typed on the command line (-s courses -m get --c_id 1), '
+                             'results are written as json lines')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of batch lines run / snapshot, grading or roster listings fetched in parallel, '
+                             'default 1')
+    parser.add_argument('--snapshot', type=str, metavar='DIR',
+                        help='dump every course and its sub-collections into DIR, one json lines file per resource, '
+                             'running it again resumes an interrupted snapshot')
+    parser.add_argument('--resources', type=str,
+                        help='comma separated sub-collections of a snapshot, default teachers,students,topics,courseWork '
+                             '(also announcements, courseWorkMaterials, studentSubmissions)')
+    parser.add_argument('--parquet', action='store_true', help='also write the snapshot as parquet files, needs pyarrow')
+    parser.add_argument('--grades', type=str, metavar='FILE',
+                        help='set the grades of a csv (- for stdin) as a teacher, a row per grade '
+                             '(courseId, courseWorkId, userId or email, assignedGrade, draftGrade) or a row per student '
+                             '(userId, a column per course work id), --c_id is the course of rows without a courseId')
+    parser.add_argument('--return_graded', action='store_true', help='return the submissions --grades regraded')
+    parser.add_argument('--roster', type=str, metavar='FILE',
+                        help='make the course rosters match FILE (- for stdin), json {"course id": {"students": [...], '
+                             '"teachers": [...]}} or a csv of courseId, userId or email, role, '
+                             'a teacher syncs students, an admin syncs teachers')
+    parser.add_argument('--dry_run', action='store_true', help='only print the changes --grades / --roster would make')
+    return parser
+
 
+def main():
+    parser = build_parser()
     args = parser.parse_args()
-    if is_email(args.a):
-        sorting: Sort = Sort(email=args.a, role=args.r, ref_cache=args.ref_cache)
-    else:
-        sorting: Sort = Sort(work_space=args.a, role=args.r, ref_cache=args.ref_cache)
-
-
-    return sorting.cli_nav(
-        service=args.s, method=args.m, ref_cache=args.ref_cache,
-        d_json=args.d_json,
-        ann_text=args.ann_text,
-        ann_id=args.ann_id,
-        materials=args.materials,
-        state=args.state,
-        states=args.states,
-        s_time=args.s_time,
-        u_time=args.u_time,
-        assi_mode=args.assi_mode,
-        s_options=args.s_options,
-        p_size=args.p_size,
-        o_by=args.o_by,
-        p_token=args.p_token,
-        a_s_ids=args.a_s_ids,
-        r_s_ids=args.r_s_ids,
-        title=args.title,
-        desc=args.desc,
-        w_type=args.w_type,
-        c_w_id=args.c_w_id,
-        due_date=args.due_date,
-        due_time=args.due_time,
-        u_id=args.u_id,
-        sub_states=args.sub_states,
-        late=args.late,
-        assi_grade=args.assi_grade,
-        s_answer=args.s_answer,
-        alt_link=args.alt_link,
-        assi_sub=args.assi_sub,
-        c_w_m_id=args.c_w_m_id,
-        m_link=args.m_link,
-        m_drive_id=args.m_drive_id,
-        i_s_options=args.i_s_options,
-        enr_code=args.enr_code,
-        t_name=args.t_name,
-        top_id=args.top_id,
-        inv_id=args.inv_id,
-        name=args.name,
-        section=args.section,
-        room=args.room,
-        o_id=args.o_id,
-        desc_h=args.desc_h,
-        sub_id=args.sub_id,
-        t_id=args.t_id,
-        alias=args.alias,
-        t_email=args.t_email,
-        inv_role=args.inv_role
-    )
+    if args.batch:
+        from src.cli import gcc_batch_cli
+        return gcc_batch_cli.run_batch(parser, vars(args))
+    if args.grades:
+        from src.cli import gcc_grading_cli
+        return gcc_grading_cli.run_grading(vars(args))
+
+    if args.roster:
+        from src.cli import gcc_roster_cli
+        return gcc_roster_cli.run_roster(vars(args))
+
+    if args.snapshot:
+        from src.cli import gcc_snapshot_cli
+        return gcc_snapshot_cli.run_snapshot(vars(args))
+
+    if not args.s or not args.m:
+        parser.error('the following arguments are required: -s, -m')
+
+    if args.daemon:
+        from src.cli import gcc_daemon
+        try:
+            return gcc_daemon.forward(vars(args), socket_path=args.socket)
+        except gcc_exceptions.DaemonUnavailable:
+            pass
+
+    return run(vars(args))
@@ -0,0 +1,42 @@
+"""
+roster sync mode of main.py, makes the rosters of courses match a desired roster file.
+
+    python main.py teacher@school.org teacher --roster roster.json --dry_run
+    python main.py admin@school.org admin --roster teachers.csv --c_id 123
+
+the roster is either json ({"course id": {"students": [...], "teachers": [...]}}) or a csv with
+courseId (optional), userId or email and role columns, see gcc_roster.read_roster.
+a teacher syncs students, an admin syncs teachers. --c_id is the course of csv rows without a courseId.
+with --dry_run only the plan is printed. a json summary of the run is printed when it finishes.
+"""
+import json
+import sys
+
+from src.cli.gcc_main_cli import build_sort, build_user
+from src.gcc_roster import RosterSync, read_roster
+
+__all__ = [
+    'run_roster'
+]
+
+
+def run_roster(base: dict) -> str:
+    """
+    this func defines the run_roster function, plans and applies the roster of base['roster'].
+
+    :param base: the namespace of the roster invocation 'dict'
+    :return: the json summary of the run 'string'
+    """
+    course_id: str or None = str(base['c_id']) if base.get('c_id') is not None else None
+    if base['roster'] == '-':
+        roster: dict = read_roster(sys.stdin, course_id=course_id)
+    else:
+        with open(base['roster'], 'r', encoding='utf-8', newline='') as file:
+            roster: dict = read_roster(file, course_id=course_id)
+
+    sync = RosterSync(build_user(build_sort(base)), max_workers=max(1, base.get('jobs') or 1))
+    plan: dict = sync.plan(roster)
+    summary: dict = {'plan': plan}
+    if not base.get('dry_run'):
+        summary.update(sync.apply(plan))
+    return json.dumps(summary)
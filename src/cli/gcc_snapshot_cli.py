@@ -0,0 +1,39 @@
+"""
+snapshot mode of main.py, dumps every course the account can list and their sub-collections.
+
+    python main.py admin@school.org admin --snapshot snapshots/2024-01-01 --jobs 16
+
+the output directory gets one {resource}.jsonl file per resource type and a checkpoint.jsonl,
+running the same command again after an interruption resumes the snapshot (see gcc_snapshot.Snapshot).
+a json summary of the run is printed when it finishes.
+"""
+import json
+
+from src.cli.gcc_main_cli import build_sort, build_user
+from src.gcc_snapshot import Snapshot, DEFAULT_RESOURCES
+
+__all__ = [
+    'run_snapshot'
+]
+
+# role -> courses.list query parameters, an admin lists every course of the domain
+course_params = {
+    'admin': {},
+    'teacher': {'teacherId': 'me'},
+    'student': {'studentId': 'me'}
+}
+
+
+def run_snapshot(base: dict) -> str:
+    """
+    this func defines the run_snapshot function, crawls the snapshot of base['snapshot'].
+
+    :param base: the namespace of the snapshot invocation 'dict'
+    :return: the json summary of the run 'string'
+    """
+    sorting = build_sort(base)
+    resources = tuple(base['resources'].split(',')) if base.get('resources') else DEFAULT_RESOURCES
+    snapshot = Snapshot(build_user(sorting), base['snapshot'], resources=resources,
+                        max_workers=max(1, base.get('jobs') or 1), page_size=base.get('p_size'),
+                        course_params=course_params.get(sorting.role))
+    return json.dumps(snapshot.run(parquet=bool(base.get('parquet'))))
@@ -27,12 +27,15 @@ class StudentCli:
     def service(self):
         return self.__service
 
-    def method_nav(self, email=None, work_space=None, ref_cache_month=12):
-        student_user: Student = Student(
-            role='student',
-            ref_cache_month=ref_cache_month,
-            email=email,
-            work_space=work_space)
+    def method_nav(self, email=None, work_space=None, ref_cache_month=12, user: Student = None):
+        if user is not None:
+            student_user: Student = user
+        else:
+            student_user: Student = Student(
+                role='student',
+                ref_cache_month=ref_cache_month,
+                email=email,
+                work_space=work_space)
 
         if self.service == 'student_submissions':
             if self.method == 'turn_in':
@@ -27,12 +27,15 @@ class TeacherCli:
     def service(self):
         return self.__service
 
-    def method_nav(self, email=None, work_space=None, ref_cache_month=12):
-        teacher_user: Teacher = Teacher(
-            role='teacher',
-            ref_cache_month=ref_cache_month,
-            email=email,
-            work_space=work_space)
+    def method_nav(self, email=None, work_space=None, ref_cache_month=12, user: Teacher = None):
+        if user is not None:
+            teacher_user: Teacher = user
+        else:
+            teacher_user: Teacher = Teacher(
+                role='teacher',
+                ref_cache_month=ref_cache_month,
+                email=email,
+                work_space=work_space)
 
         if self.service == 'announcements':
             if self.method == 'd_create':
@@ -65,7 +68,8 @@ class TeacherCli:
                     states=self.params.get('states'),
                     page_size=self.params.get('p_size'),
                     order_by=self.params.get('o_by'),
-                    page_token=self.params.get('p_token')
+                    page_token=self.params.get('p_token'),
+                    course_id=self.params.get('c_id')
                 )
             elif self.method == 'modify':
                 return teacher_user.modify_announcement_assignees(
@@ -1,6 +1,8 @@
 import json
+from datetime import timedelta
 
 from src import gcc_validators
+from src.gcc_fields import field_mask
 from googleapiclient.errors import HttpError
 
 __all__ = [
@@ -14,11 +16,12 @@ from src.gcc_base import GccBase
 class Admin(GccBase):
 
     def __init__(self, role: str = 'admin', email: str = None,
-                 work_space: str = None, ref_cache_month: int = 12):
+                 work_space: str = None, ref_cache_month: int = 12,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000):
 
         if role != 'admin':
             raise gcc_exceptions.InvalidRole()
-        super().__init__(role, ref_cache_month, work_space, email)
+        super().__init__(role, ref_cache_month, work_space, email, cache_ttl, cache_max_entries)
 
     def detailed_create_course(self, detailed_json: bool = False) -> tuple:
         """
@@ -35,7 +38,7 @@ class Admin(GccBase):
             course_json = json.load(fh)
         try:
             response: dict = self.classroom.courses().create(body=course_json).execute()
-            self._update_cache()
+            self._update_cache(course=response)
             return response['id'], response["name"]
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -72,7 +75,7 @@ class Admin(GccBase):
         }
         try:
             response: dict = self.classroom.courses().create(body=body).execute()
-            self._update_cache()
+            self._update_cache(course=response)
             return {'course_id': response['id'], 'course_name': response["name"],
                     'enrollment code': response["enrollmentCode"], 'user': self.check}
         except HttpError as error:
@@ -90,11 +93,11 @@ class Admin(GccBase):
         :return: True | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            request = self.classroom.courses().delete(id=course_id).execute()
-            self._update_cache()
+            self.classroom.courses().delete(id=course_id).execute()
+            self._update_cache(deleted_course_id=course_id)
             return True
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -116,7 +119,7 @@ class Admin(GccBase):
             body = json.load(fh)
         try:
             response: dict = self.classroom.courses().patch(**body).execute()
-            self._update_cache()
+            self._update_cache(course=response)
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -177,12 +180,12 @@ class Admin(GccBase):
         update_mask = ','.join(body.keys())
 
         try:
-            self.classroom.courses().patch(
+            response: dict = self.classroom.courses().patch(
                 id=course_id,
                 updateMask=update_mask,
                 body=body
             ).execute()
-            self._update_cache()
+            self._update_cache(course=response)
             return True
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -204,34 +207,36 @@ class Admin(GccBase):
             body = json.load(fh)
         try:
             response: dict = self.classroom.courses().update(**body).execute()
-            self._update_cache()
+            self._update_cache(course=response)
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def get_course(self, course_id: str) -> dict or False:
+    def get_course(self, course_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_course method, returns a course..
         see https://developers.google.com/classroom/reference/rest/v1/courses/get
         for more info
 
         :param course_id: either identifier of the course or assigned alias. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: request | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response: dict = self.classroom.courses().get(courseId=str(course_id)).execute()
+            response: dict = self._execute_cached(
+                self.classroom.courses().get(id=str(course_id), fields=field_mask('courses', fields)))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     def list_courses(self, student_id: str = 'me', teacher_id: str = 'me', states: list[str] = None,
-                     page_size: int = 10, page_token: str = None) -> tuple[str, str] or bool:
+                     page_size: int = 10, page_token: str = None, fields: str = None) -> tuple[str, str] or bool:
         """
         this func defines the list_courses method, returns a list of courses that the requesting user is permitted to view,
         restricted to those that match the request. Returned courses are ordered by creation time,
@@ -254,10 +259,46 @@ class Admin(GccBase):
         :param states: https://developers.google.com/classroom/reference/rest/v1/courses#CourseState
         :param page_size: Maximum number of items to return. Zero or unspecified indicates that the server may assign a maximum.
         :param page_token: Token identifying the next page of results to return. If empty, no further results are available
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return tuple[the courses, the next page token] | False
         """
         # validation
+        query_params: dict = self._courses_query(student_id, teacher_id, states, page_size, page_token)
+        query_params['fields'] = field_mask('courses', fields, listing=True)
 
+        try:
+            request: dict = self.classroom.courses().list(**query_params).execute()
+            courses = request.get("courses", [])
+            next_page_token = request.get("nextPageToken", None)
+            return courses, next_page_token
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    def iter_courses(self, student_id: str = 'me', teacher_id: str = 'me', states: list[str] = None,
+                     page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_courses method, yields every course the requesting user is permitted to view
+        across all pages. the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses/list
+        for more info
+
+        :param student_id: Restricts returned courses to those having a student with the specified identifier.
+        :param teacher_id: Restricts returned courses to those having a teacher with the specified identifier.
+        :param states: https://developers.google.com/classroom/reference/rest/v1/courses#CourseState
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of course dicts
+        """
+        query_params: dict = self._courses_query(student_id, teacher_id, states, page_size)
+        query_params['fields'] = field_mask('courses', fields, listing=True)
+        collection = self.classroom.courses()
+        return self._iter_pages(collection.list(**query_params), collection, 'courses', prefetch)
+
+    @staticmethod
+    def _courses_query(student_id: str = None, teacher_id: str = None, states: list[str] = None,
+                       page_size: int = None, page_token: str = None) -> dict:
         query_params: dict = dict()
 
         if student_id:
@@ -282,14 +323,8 @@ class Admin(GccBase):
         if page_token:
             gcc_validators.are_params_string(page_token)
             query_params['pageToken'] = page_token
-        try:
-            request: dict = self.classroom.courses().list(**query_params).execute()
-            courses = request.get("courses", [])
-            next_page_token = request.get("nextPageToken", None)
-            return courses, next_page_token
-        except HttpError as error:
-            self.logger.error('An error occurred: %s' % error)
-            return False
+
+        return query_params
 
     @gcc_validators.validate_params(str, str)
     def create_alias(self, course_id: str, alias: str) -> dict or bool:
@@ -303,13 +338,14 @@ class Admin(GccBase):
         :return: request dict | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = {
             "alias": alias
         }
         try:
             response: dict = self.classroom.courses().aliases().create(courseId=course_id, body=body).execute()
+            self.cache.add_alias(self.check, course_id, alias)
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -326,18 +362,19 @@ class Admin(GccBase):
         :param alias: alias 'string'
         :return: True | False
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().aliases().delete(courseId=course_id,
-                                                      aliasId=alias).execute()
+                                                      alias=alias).execute()
+            self.cache.delete_alias(self.check, alias)
             return True
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def list_alias(self, course_id: str, page_size: int = 10, page_token: str = None) -> tuple or bool:
+    def list_alias(self, course_id: str, page_size: int = 10, page_token: str = None, fields: str = None) -> tuple or bool:
         """
         this func defines the list_alias method, returns a list of aliases for a course..
         see https://developers.google.com/classroom/reference/rest/v1/courses.aliases/list
@@ -346,20 +383,20 @@ class Admin(GccBase):
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param page_size: Page size 'int'
         :param page_token: Next page token 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: request | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
         gcc_validators.are_params_int(page_size)
 
+        query_params: dict = self._page_query(page_size, page_token)
+        query_params['fields'] = field_mask('aliases', fields, listing=True)
+
         try:
-            response = self.classroom.courses().aliases().list(courseId=course_id,
-                                                               pageSize=page_size)
-            if page_token:
-                gcc_validators.are_params_string(page_token)
-                response.pageToken = page_token
-            teacher = response.execute()
-            next_page_token = teacher.get("nextPageToken", None)
+            response: dict = self.classroom.courses().aliases().list(courseId=course_id,
+                                                                     **query_params).execute()
+            next_page_token = response.get("nextPageToken", None)
 
             return response, next_page_token
         except HttpError as error:
@@ -378,7 +415,7 @@ class Admin(GccBase):
         :return: True | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
         gcc_validators.is_email(teacher_email)
 
         data: dict = {
@@ -397,6 +434,38 @@ class Admin(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str, list)
+    def batch_add_teachers(self, course_id: str, teacher_emails: list[str]) -> dict or False:
+        """
+        this func defines the batch_add_teachers method, creates many teachers of a course
+        with one batch http request per 50 teachers.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.teachers/create
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param teacher_emails: Teachers' emails 'list[string]'
+        :return: {"responses": {email: response}, "errors": {email: HttpError}} | False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+        for teacher_email in teacher_emails:
+            if not gcc_validators.is_email(teacher_email):
+                raise gcc_exceptions.InvalidEmail()
+
+        batch = self.batch()
+        for teacher_email in teacher_emails:
+            batch.add(self.classroom.courses().teachers().create(
+                courseId=course_id,
+                body={"userId": teacher_email}
+            ), request_id=teacher_email)
+        try:
+            results: dict = self._execute_batch(batch)
+            self._update_cache()
+            return results
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
     @gcc_validators.validate_params(str, str)
     def delete_teacher(self, course_id: str, teacher_email: str) -> tuple[str, str] or bool:
         """
@@ -410,7 +479,7 @@ class Admin(GccBase):
 
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
         gcc_validators.is_email(teacher_email)
 
         try:
@@ -422,8 +491,37 @@ class Admin(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str, list)
+    def batch_delete_teachers(self, course_id: str, user_ids: list[str]) -> dict or False:
+        """
+        this func defines the batch_delete_teachers method, removes many teachers from a course
+        with one batch http request per 50 teachers.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.teachers/delete
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param user_ids: numeric identifiers or email addresses of the teachers. 'list[string]'
+        :return: {"responses": {user_id: response}, "errors": {user_id: HttpError}} | False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        batch = self.batch()
+        for user_id in user_ids:
+            batch.add(self.classroom.courses().teachers().delete(
+                courseId=course_id,
+                userId=user_id
+            ), request_id=user_id)
+        try:
+            results: dict = self._execute_batch(batch)
+            self._update_cache()
+            return results
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
     @gcc_validators.validate_params(str, str)
-    def get_teacher(self, course_id: str, teacher_email: str) -> dict or False:
+    def get_teacher(self, course_id: str, teacher_email: str, fields: str = None) -> dict or False:
         """
         this func defines the delete_teacher method, removes the specified teacher from the specified course.
         see https://developers.google.com/classroom/reference/rest/v1/courses.teachers/get
@@ -431,24 +529,28 @@ class Admin(GccBase):
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param teacher_email: Teacher's email
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: request dict | False
 
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if not gcc_validators.is_email(teacher_email):
             raise gcc_exceptions.InvalidEmail()
         try:
-            response: dict = self.classroom.courses().teachers().get(courseId=course_id,
-                                                                     userId=teacher_email).execute()
+            response: dict = self._execute_cached(self.classroom.courses().teachers().get(
+                courseId=course_id,
+                userId=teacher_email,
+                fields=field_mask('teachers', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def list_teachers(self, course_id: str, page_size: int = 10, page_token: str = None) -> tuple[dict, str] or bool:
+    def list_teachers(self, course_id: str, page_size: int = 10, page_token: str = None, fields: str = None) -> tuple[dict, str] or bool:
         """
         this func defines the list_teachers method, returns a list of teachers of this course that the requester is permitted to view.
         see https://developers.google.com/classroom/reference/rest/v1/courses.teachers/list
@@ -457,39 +559,50 @@ class Admin(GccBase):
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param page_size: page size 'int'
         :param page_token: next page token 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: tuple[dict, str]
 
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
-
-        query_params: dict = dict()
-
-        if page_size:
-            gcc_validators.are_params_int(page_size)
-            if page_size >= 100:
-                raise ValueError("Page size cannot be more than 100.")
-            query_params['pageSize'] = page_size
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
-        if page_token:
-            gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+        query_params: dict = self._page_query(page_size, page_token)
+        query_params['fields'] = field_mask('teachers', fields, listing=True)
 
         try:
-            response = self.classroom.courses().teachers().list(courseId=course_id,
-                                                                pageSize=page_size)
-            if page_token:
-                gcc_validators.are_params_string(page_token)
-                response.pageToken = page_token
-            response.execute()
+            response: dict = self.classroom.courses().teachers().list(courseId=course_id,
+                                                                      **query_params).execute()
             teacher = response.get("teachers", [])
-            next_page_token = teacher.get("nextPageToken", None)
+            next_page_token = response.get("nextPageToken", None)
 
             return teacher, next_page_token
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str)
+    def iter_teachers(self, course_id: str, page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_teachers method, yields every teacher of a course across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.teachers/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of teacher dicts
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._page_query(page_size)
+        query_params['fields'] = field_mask('teachers', fields, listing=True)
+        collection = self.classroom.courses().teachers()
+        return self._iter_pages(collection.list(courseId=course_id, **query_params), collection,
+                                'teachers', prefetch)
+
     def accept_invitation(self, invitation_id: str):
         return self._accept_invitation(invitation_id=invitation_id)
 
@@ -513,7 +626,7 @@ class Admin(GccBase):
         :return: response dict or False
 
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if role not in ["STUDENT", "TEACHER", "OWNER"]:
             raise gcc_exceptions.RoleError()
@@ -524,7 +637,7 @@ class Admin(GccBase):
             "role": role
         }
         try:
-            response = self.classroom.courses().invitations().create(body=body).execute()
+            response = self.classroom.invitations().create(body=body).execute()
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -542,25 +655,27 @@ class Admin(GccBase):
 
         """
         try:
-            self.classroom.courses().invitations().delete(id=invitation_id).execute()
+            self.classroom.invitations().delete(id=invitation_id).execute()
             return True
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def get_invitation(self, invitation_id: str) -> dict or False:
+    def get_invitation(self, invitation_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_invitation method, gets an invitation.
         see https://developers.google.com/classroom/reference/rest/v1/invitations/get
         for more info
 
         :param invitation_id: identifier of the invitation to delete.
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: bool
 
         """
         try:
-            response = self.classroom.courses().invitations().get(id=invitation_id).execute()
+            response = self._execute_cached(
+                self.classroom.invitations().get(id=invitation_id, fields=field_mask('invitations', fields)))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -568,7 +683,7 @@ class Admin(GccBase):
 
     @gcc_validators.validate_params(str, str)
     def list_invitation(self, course_id: str, user_id: str, page_size: int = 10,
-                        page_token: str = None) -> dict or False:
+                        page_token: str = None, fields: str = None) -> dict or False:
         """
         this func defines the get_invitation method, gets an invitation.
         see https://developers.google.com/classroom/reference/rest/v1/invitations/get
@@ -584,26 +699,18 @@ class Admin(GccBase):
                           The server may return fewer than the specified number of results.
         :param page_token: nextPageToken value returned from a previous list call, indicating that the subsequent
                           page of results should be returned. The list request must be otherwise identical to the one that resulted in this token.
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict | False
         """
-        gcc_validators.are_params_in_cache(course_id)
-
-        query_params: dict = dict()
-
-        if page_size:
-            gcc_validators.are_params_int(page_size)
-            if page_size >= 100:
-                raise ValueError("Page size cannot be more than 100.")
-            query_params['pageSize'] = page_size
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
-        if page_token:
-            gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+        query_params: dict = self._page_query(page_size, page_token)
+        query_params['fields'] = field_mask('invitations', fields, listing=True)
 
         try:
-            response = self.classroom.courses().invitations().list(
+            response = self.classroom.invitations().list(
                 courseId=course_id,
-                id=user_id,
+                userId=user_id,
                 **query_params
             ).execute()
 
@@ -614,37 +721,31 @@ class Admin(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
-    # def create_registration(self, course_id: str, cloud_pubsub_topic: str, feed_url: str) -> dict or False:
-    #     """
-    #     Creates a Google Classroom registration for a feed URL and a Cloud Pub/Sub topic.
-    #
-    #     :param course_id: either identifier of the course or assigned alias. 'string'
-    #     :param cloud_pubsub_topic: The Cloud Pub/Sub topic to which notifications will be sent.
-    #     :param feed_url: The URL of the feed to monitor for changes.
-    #     :return: A dictionary representing the newly created registration, or False if an error occurs.
-    #     """
-    #     try:
-    #         topic_name = f'projects/{self.project_id}/topics/{cloud_pubsub_topic}'
-    #         cloud_pubsub_topic = {'topicName': topic_name}
-    #
-    #
-    #         body = {
-    #             'feed': {
-    #                 'feedType': 'COURSE_WORK_CHANGES',
-    #                 'courseWorkChangesInfo': {'courseId': course_id}
-    #             },
-    #             'cloudPubsubTopic': cloud_pubsub_topic,
-    #             'feedUrl': feed_url
-    #         }
-    #
-    #         response = self.classroom.registrations().create(body=body).execute()
-    #         return response
-    #     except HttpError as error:
-    #         self.logger.error('An error occurred: %s' % error)
-    #         return False
+    @gcc_validators.validate_params(str, str)
+    def iter_invitations(self, course_id: str, user_id: str, page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_invitations method, yields every invitation across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/invitations/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param user_id: restricts returned invitations to those for a specific user.
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of invitation dicts
+        """
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._page_query(page_size)
+        query_params['fields'] = field_mask('invitations', fields, listing=True)
+        collection = self.classroom.invitations()
+        return self._iter_pages(collection.list(courseId=course_id, userId=user_id, **query_params),
+                                collection, 'invitations', prefetch)
 
     @gcc_validators.validate_params(str)
-    def get_user(self, user_id: str) -> dict or False:
+    def get_user(self, user_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_user method, returns a user profile.
         see https://developers.google.com/classroom/reference/rest/v1/userProfiles/get
@@ -654,10 +755,12 @@ class Admin(GccBase):
                         the numeric identifier for the user
                         the email address of the user
                         the string literal "me", indicating the requesting user
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict or False
         """
         try:
-            response = self.classroom.userProfiles().get(userId=user_id).execute()
+            response = self._execute_cached(
+                self.classroom.userProfiles().get(userId=user_id, fields=field_mask('userProfiles', fields)))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -0,0 +1,294 @@
+import asyncio
+import inspect
+from datetime import timedelta
+
+import aiohttp
+import httplib2
+from google.auth.transport.requests import Request
+from googleapiclient.errors import HttpError
+
+from src import gcc_http
+from src.gcc_admin import Admin
+from src.gcc_base import GccBase
+from src.gcc_pagination import PageRequest
+from src.gcc_student import Student
+from src.gcc_teacher import Teacher
+
+__all__ = [
+    'AsyncGccBase',
+    'AsyncAdmin',
+    'AsyncTeacher',
+    'AsyncStudent'
+]
+
+
+class _Deferred(BaseException):
+    """
+    raised out of a sync method at the first request that has no recorded response yet.
+    derives from BaseException so the methods' own error handling never swallows it.
+    """
+
+    def __init__(self, request):
+        super().__init__()
+        self.request = request
+
+
+class _Blocking(BaseException):
+    """
+    raised out of a sync method at a call the replay can not defer: a mutation, a batch or worker threads.
+    """
+
+
+def _request_key(request) -> tuple:
+    return request.method, request.uri, request.body
+
+
+class _Replay:
+    """
+    execute hook that answers requests with already awaited results.
+    results are matched by method, uri and body, in call order per key, so a request that a later replay skips
+    (e.g. a course cache refresh that is not due anymore) does not shift the answers of the others.
+    without forward a new get request is deferred and anything else raises _Blocking,
+    with forward (a method running on an executor thread) new requests are sent through forward(request).
+    """
+
+    def __init__(self, results: dict, forward=None):
+        self.__results: dict = results
+        self.__positions: dict = dict()
+        self.__forward = forward
+
+    @property
+    def defers(self):
+        return self.__forward is None
+
+    def blocking(self):
+        if self.__forward is None:
+            raise _Blocking()
+
+    def __call__(self, request, http=None, num_retries: int = 0):
+        key: tuple = _request_key(request)
+        position: int = self.__positions.get(key, 0)
+        recorded: list = self.__results.get(key, [])
+        if position < len(recorded):
+            self.__positions[key] = position + 1
+            response, error = recorded[position]
+            if error is not None:
+                raise error
+            return response
+        if self.__forward is not None:
+            return self.__forward(request)
+        if request.method != 'GET':
+            # a mutation is sent once, from a thread, instead of having its side effects replayed
+            raise _Blocking()
+        raise _Deferred(request)
+
+
+class AsyncGccBase:
+    """
+    asyncio surface over a Teacher / Admin / Student client.
+    every public method of the wrapped client is exposed as a coroutine with the same signature and return value,
+    its requests are sent through a pooled aiohttp session instead of blocking httplib2 calls.
+    iter_* methods return async generators.
+
+    a read is run as a sequence of replays: the sync method runs until its first get request that has no response
+    yet, that request is awaited on the event loop, and the method is replayed with the recorded responses
+    until it returns. no thread is used per request.
+    a method that mutates, sends a batch or fans out on worker threads (batch_*, map_concurrent) is run once
+    on an executor thread instead, its requests are still sent over the aiohttp pool and awaited on the loop,
+    the batches and worker threads block that thread only.
+
+    usage:
+        async with AsyncTeacher(email='teacher@school.org') as teacher:
+            results = await asyncio.gather(*(teacher.get_course_work(c_id, c_w_id) for c_w_id in ids))
+    """
+
+    def __init__(self, client: GccBase, pool_size: int = 100):
+        self.__client: GccBase = client
+        self.__pool_size: int = pool_size
+        self.__session = None
+        self.__refresh_lock = None
+
+    @property
+    def client(self):
+        return self.__client
+
+    @property
+    def pool_size(self):
+        return self.__pool_size
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.__pool_size)
+            self.__session = aiohttp.ClientSession(connector=connector)
+        return self.__session
+
+    async def __authorize(self, headers: dict):
+        creds = self.__client.creds
+        if not creds.valid:
+            if self.__refresh_lock is None:
+                self.__refresh_lock = asyncio.Lock()
+            async with self.__refresh_lock:
+                if not creds.valid:
+                    await asyncio.get_running_loop().run_in_executor(None, creds.refresh, Request())
+        creds.apply(headers)
+
+    async def execute(self, request) -> dict:
+        """
+        this func defines the execute method, sends a built googleapiclient request over the aiohttp pool.
+        transient failures are retried as the retry policy allows (see gcc_retry).
+
+        :param request: googleapiclient HttpRequest
+        :return: the deserialized response, raises HttpError like request.execute()
+        """
+        policy = gcc_http.get_retry_policy()
+        if policy is not None:
+            policy = policy.for_method(getattr(request, 'methodId', None))
+        if policy is None:
+            return await self.__send(request)
+
+        policy.budget.deposit()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                return await self.__send(request)
+            except (HttpError, aiohttp.ClientConnectionError, ConnectionError, TimeoutError) as error:
+                if isinstance(error, aiohttp.ClientConnectionError):
+                    error = ConnectionError(str(error))
+                wait: float or None = policy.delay(request, error, attempt)
+                if wait is None:
+                    raise
+                await asyncio.sleep(wait)
+
+    async def __send(self, request) -> dict:
+        wait: float = gcc_http.reserve(request)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        headers: dict = {key: value for key, value in request.headers.items() if key.lower() != 'content-length'}
+        await self.__authorize(headers)
+
+        async with self.__get_session().request(request.method, request.uri,
+                                                data=request.body, headers=headers) as response:
+            content: bytes = await response.read()
+            info: dict = {key.lower(): value for key, value in response.headers.items()}
+            info['status'] = str(response.status)
+
+        return request.postproc(httplib2.Response(info), content)
+
+    async def _call(self, method, *args, **kwargs):
+        results: dict = dict()
+        while True:
+            token = gcc_http.set_execute_hook(_Replay(results))
+            try:
+                return method(*args, **kwargs)
+            except _Deferred as deferred:
+                request = deferred.request
+            except _Blocking:
+                return await self.__call_blocking(results, method, *args, **kwargs)
+            finally:
+                gcc_http.reset_execute_hook(token)
+
+            try:
+                recorded: tuple = (await self.execute(request), None)
+            except Exception as error:
+                recorded = (None, error)
+            results.setdefault(_request_key(request), list()).append(recorded)
+
+    async def __call_blocking(self, results: dict, method, *args, **kwargs):
+        """
+        runs a method on an executor thread, the requests recorded by its replays are answered again
+        and the new ones are sent over the aiohttp pool.
+        """
+        loop = asyncio.get_running_loop()
+
+        def forward(request):
+            return asyncio.run_coroutine_threadsafe(self.execute(request), loop).result()
+
+        def run():
+            # a classroom service of the thread's own, httplib2 is not thread-safe
+            self.__client._ensure_worker()
+            token = gcc_http.set_execute_hook(_Replay(results, forward=forward))
+            try:
+                return method(*args, **kwargs)
+            finally:
+                gcc_http.reset_execute_hook(token)
+
+        return await loop.run_in_executor(None, run)
+
+    def _iter(self, method, *args, **kwargs):
+        return self._iter_pages(method, *args, **kwargs)
+
+    async def _iter_pages(self, method, *args, **kwargs):
+        page_request = await self._call(method, *args, **kwargs)
+        if not isinstance(page_request, PageRequest):
+            # the method ran on an executor thread and returned a sync generator
+            for item in await asyncio.get_running_loop().run_in_executor(None, list, page_request):
+                yield item
+            return
+
+        request, collection, items_key = page_request
+        task = asyncio.ensure_future(self.execute(request))
+        try:
+            while task is not None:
+                response: dict = await task
+                request = collection.list_next(request, response)
+                task = asyncio.ensure_future(self.execute(request)) if request is not None else None
+                for item in response.get(items_key, []):
+                    yield item
+        finally:
+            if task is not None:
+                task.cancel()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.__client, name)
+        if name.startswith('_') or not inspect.ismethod(attribute):
+            return attribute
+
+        if name.startswith('iter_'):
+            def iter_method(*args, **kwargs):
+                return self._iter(attribute, *args, **kwargs)
+            iter_method.__name__ = name
+            iter_method.__doc__ = attribute.__doc__
+            return iter_method
+
+        async def method(*args, **kwargs):
+            return await self._call(attribute, *args, **kwargs)
+        method.__name__ = name
+        method.__doc__ = attribute.__doc__
+        return method
+
+
+class AsyncAdmin(AsyncGccBase):
+
+    def __init__(self, role: str = 'admin', email: str = None,
+                 work_space: str = None, ref_cache_month: int = 12,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000, pool_size: int = 100):
+        super().__init__(Admin(role, email, work_space, ref_cache_month, cache_ttl, cache_max_entries), pool_size)
+
+
+class AsyncTeacher(AsyncGccBase):
+
+    def __init__(self, role: str = 'teacher', ref_cache_month: int = 12,
+                 email: str = None, work_space: str = None,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000, pool_size: int = 100):
+        super().__init__(Teacher(role, ref_cache_month, email, work_space, cache_ttl, cache_max_entries), pool_size)
+
+
+class AsyncStudent(AsyncGccBase):
+
+    def __init__(self, role: str = 'student', ref_cache_month: int = 12,
+                 email: str = None, work_space: str = None,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000, pool_size: int = 100):
+        super().__init__(Student(role, ref_cache_month, email, work_space, cache_ttl, cache_max_entries), pool_size)
@@ -1,16 +1,23 @@
-import json
-
 import os.path
-from datetime import timedelta, date
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from datetime import timedelta
 
 from src import gcc_exceptions
 
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
 
 from src import gcc_validators
+from src import gcc_http
+from src import gcc_discovery
+from src import gcc_credentials
+from src import gcc_pagination
+from src.gcc_batch import GccBatch
+from src.gcc_cache import GccCache, CourseKeys, ResponseCache, get_cache
+from src.gcc_rate_limit import RateLimiter
+from src.gcc_transport import PooledHttp
 
 import logging
 
@@ -23,9 +30,14 @@ class GccBase:
     # ___Main_EndPoints___ #
     __SERVICE_ENDPOINT: str = r'https://classroom.googleapis.com'
 
+    # ___course cache refresh backoff, seconds___ #
+    __REFRESH_BACKOFF: float = 30
+    __REFRESH_BACKOFF_MAX: float = 15 * 60
+
     # ___Scopes ___ #
     __ADMIN_SCOPES: dict[str, str] = {
         "courses": r"https://www.googleapis.com/auth/classroom.courses",
+        "push_notifications": r"https://www.googleapis.com/auth/classroom.push-notifications",
         # "class_rosters": "https://www.googleapis.com/auth/classroom.rosters",
         # "profile_emails": r"https://www.googleapis.com/auth/classroom.profile.emails",
         # "profile_photos": r"https://www.googleapis.com/auth/classroom.profile.photos",
@@ -57,7 +69,8 @@ class GccBase:
     }
 
     def __init__(self, role: str, ref_cache_month: int = 12,
-                 work_space: str = None, email: str = None):
+                 work_space: str = None, email: str = None,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000):
 
         self.__logger = logging.getLogger(__name__)
 
@@ -80,10 +93,13 @@ class GccBase:
         if not email and not work_space:
             raise gcc_exceptions.InvalidParams()
 
-        if ref_cache_month < 1:
-            ref_cache_month = 1
-        ref_date = date.today() + timedelta(weeks=4 * ref_cache_month)
-        self.__ref_cache_month: date.month = ref_date.month
+        if not ref_cache_month or ref_cache_month < 1:
+            ref_cache_month = 12 if ref_cache_month is None else 1
+        self.__ref_cache_month: int = ref_cache_month
+        if cache_ttl is not None:
+            self.__ref_cache_ttl: timedelta = cache_ttl
+        else:
+            self.__ref_cache_ttl: timedelta = timedelta(weeks=4 * ref_cache_month)
 
         self.__role: str = role.lower()
         if self.__role not in ['student', 'teacher', 'admin']:
@@ -98,43 +114,22 @@ class GccBase:
             else:
                 raise gcc_exceptions.ScopeError()
 
-        self.__creds = None
-        if os.path.exists(f'data_endpoint/{self.__role}_token.json'):
-            self.__creds = Credentials.from_authorized_user_file(f'data_endpoint/{self.__role}_token.json',
-                                                                 scopes=list(scopes))
-
-        if not self.__creds or not self.__creds.valid:
-            if self.__creds and self.__creds.expired and self.__creds.refresh_token:
-                self.__creds.refresh(Request())
-            else:
-                credentials_account_file = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
-                flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file=credentials_account_file,
-                                                                 scopes=list(scopes))
-                self.__creds = flow.run_local_server(port=0)
-            with open(f'data_endpoint/{self.__role}_token.json', 'w', encoding='utf-8') as token:
-                token.write(self.__creds.to_json())
+        self.__creds = gcc_credentials.get_credential_manager().get(self.__role, list(scopes),
+                                                                    account=self.__workspace or self.__email)
 
         # ___limitations___ #
         self.__limits: dict = dict()
+        if gcc_http.get_rate_limiter() is None:
+            self.set_limits()
 
         # ___ cache ___ #
-        self.__cache: dict = dict()
+        self.__cache: GccCache = get_cache(max_entries=cache_max_entries)
+        self.__response_cache: ResponseCache or None = None
 
         # ___classroom___#
-        self.__classroom = build('classroom', 'v1', credentials=self.creds)
-
-        try:
-            if not os.path.exists('data_endpoint/gcc_cache.json'):
-                with open('data_endpoint/gcc_cache.json', 'a', encoding='utf-8') as fh:
-                    data: dict = dict()
-                    json.dump(data, fh)
-            else:
-                with open('data_endpoint/gcc_cache.json', 'r', encoding='utf-8') as fh1:
-                    data = json.load(fh1)
-                    if isinstance(data, dict):
-                        self.__cache = data
-        except FileNotFoundError:
-            self.__cache: dict = dict()
+        self.__classroom = gcc_discovery.get_service(self.creds)
+        self.__transport: PooledHttp or None = None
+        self.__local = threading.local()
 
         if self.__workspace:
             check = self.__workspace
@@ -142,6 +137,9 @@ class GccBase:
             check = self.__email
 
         self.__check = check
+        self.__course_keys: CourseKeys = CourseKeys(self.__cache, check, self.__ref_cache_ttl.total_seconds())
+        self.__refresh_backoff: float = 0
+        self.__refresh_retry_at: float = 0
 
     @property
     def check(self):
@@ -149,7 +147,7 @@ class GccBase:
 
     @property
     def classroom(self):
-        return self.__classroom
+        return getattr(self.__local, 'classroom', self.__classroom)
 
     @property
     def creds(self):
@@ -171,16 +169,234 @@ class GccBase:
     def ref_cache_month(self):
         return self.__ref_cache_month
 
+    @property
+    def ref_cache_ttl(self):
+        return self.__ref_cache_ttl
+
     @property
     def cache(self):
         return self.__cache
 
+    @property
+    def response_cache(self):
+        return self.__response_cache
+
+    @property
+    def course_keys(self):
+        if time.time() >= self.__refresh_retry_at and self._cache_expired():
+            try:
+                self.refresh_cache()
+                self.__refresh_backoff = 0
+            except HttpError as error:
+                self.logger.error('An error occurred: %s' % error)
+                # a failing refresh is retried after a growing delay instead of on every validated call
+                self.__refresh_backoff = min(max(self.__refresh_backoff * 2, self.__REFRESH_BACKOFF),
+                                             self.__REFRESH_BACKOFF_MAX)
+                self.__refresh_retry_at = time.time() + self.__refresh_backoff
+        return self.__course_keys
+
     @property
     def logger(self):
         return self.__logger
 
-    def set_limits(self):
-        self.__limits = ini_config.get_config(filename='conf/personal_config.ini', section='usage_limits')
+    @property
+    def limits(self):
+        return self.__limits
+
+    def set_limits(self, filename: str = None) -> dict:
+        """
+        this func defines the set_limits method, loads the usage_limits ini section and installs the
+        process-wide rate limiter built from it, every request of every client waits for it (see gcc_rate_limit).
+
+        :param filename: the ini file, defaults to conf/workspace_or_school_config.ini for workspace accounts
+        and conf/personal_config.ini otherwise 'string'
+        :return: the usage limits dict
+        """
+        if filename is None:
+            name: str = 'workspace_or_school_config.ini' if self.__workspace else 'personal_config.ini'
+            filename = os.path.join(os.path.dirname(ini_config.__file__), name)
+        self.__limits = ini_config.get_config(filename=filename, section='usage_limits')
+        gcc_http.set_rate_limiter(RateLimiter.from_limits(self.__limits))
+        return self.__limits
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    def use_pooled_transport(self, pool_size: int = 10, http2: bool = False) -> PooledHttp:
+        """
+        this func defines the use_pooled_transport method, sends this client's requests over a pooled keep-alive
+        session shared by all its threads (map_concurrent, page prefetch) instead of one httplib2 object each.
+
+        :param pool_size: maximum number of kept-alive connections 'int'
+        :param http2: use http/2 when httpx[http2] is installed 'bool'
+        :return: PooledHttp
+        """
+        if self.__transport is not None:
+            self.__transport.close()
+        self.__transport = PooledHttp(self.creds, pool_size=pool_size, http2=http2)
+        self.__classroom = gcc_discovery.build_service(http=self.__transport)
+        return self.__transport
+
+    def use_private_service(self):
+        """
+        this func defines the use_private_service method, gives this client a classroom service and http object
+        of its own instead of the process-wide one shared by every client of the same credentials
+        (see gcc_discovery.get_service), for clients whose calls are serialized by a lock of their own.
+
+        :return: classroom Resource
+        """
+        self.__classroom = gcc_discovery.build_service(http=self._new_http())
+        return self.__classroom
+
+    def _new_http(self):
+        """
+        returns an authorized http object for a new thread, a fresh one as httplib2 is not thread-safe,
+        or the shared pooled transport when enabled.
+
+        :return: AuthorizedHttp or PooledHttp
+        """
+        if self.__transport is not None:
+            return self.__transport
+        return AuthorizedHttp(self.creds, http=build_http())
+
+    def enable_response_cache(self, max_age: float = 60, maxsize: int = 1024) -> ResponseCache:
+        """
+        this func defines the enable_response_cache method, serves the get_* methods from a read-through cache.
+        responses younger than max_age are returned without a request, older ones are revalidated
+        with their ETag when the server sent one, mutations made through any client drop the affected entries.
+
+        :param max_age: seconds a response is served without contacting the server 'float'
+        :param maxsize: maximum number of cached responses 'int'
+        :return: ResponseCache
+        """
+        self.__response_cache = ResponseCache(max_age=max_age, maxsize=maxsize)
+        return self.__response_cache
+
+    def disable_response_cache(self):
+        self.__response_cache = None
+
+    def _execute_cached(self, request) -> dict:
+        """
+        executes a get request through the response cache when it is enabled.
+
+        :param request: googleapiclient HttpRequest
+        :return: response dict
+        """
+        # replayed requests bypass the cache, a hit on a replay would answer a request the first pass deferred
+        if self.__response_cache is None or gcc_http.execute_hook_defers():
+            return request.execute()
+        return self.__response_cache.execute(request)
+
+    def _iter_pages(self, request, collection, items_key: str, prefetch: int = 1):
+        """
+        this func defines the _iter_pages method, streams the items of a list request across all pages.
+        pages are prefetched on a background thread with its own http object.
+
+        :param request: the first list request
+        :param collection: the resource collection the request was made from
+        :param items_key: the response key holding the page items
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :return: generator of items, or a PageRequest when called from an async client
+        """
+        if gcc_http.execute_hook_defers():
+            return gcc_pagination.PageRequest(request, collection, items_key)
+
+        http = self._new_http()
+        return gcc_pagination.iter_pages(request, collection, items_key,
+                                         execute=lambda req: req.execute(http=http),
+                                         prefetch=prefetch)
+
+    def _init_worker(self):
+        self.__local.classroom = gcc_discovery.build_service(http=self._new_http())
+
+    def _ensure_worker(self):
+        if not hasattr(self.__local, 'classroom'):
+            self._init_worker()
+
+    def map_concurrent(self, func, items, max_workers: int = 8, ordered: bool = True):
+        """
+        this func defines the map_concurrent method, runs func for every item on a thread pool.
+        every worker thread gets its own classroom service and authorized http object,
+        so func should be a method of this instance (or its name), e.g.
+            for course_id, course in admin.map_concurrent(admin.get_course, course_ids):
+                ...
+        meant for fan-out reads, mutations still rewrite the shared cache file.
+
+        :param func: method of this instance or its name 'string'
+        :param items: iterable of arguments, a tuple is passed as *args, a dict as **kwargs
+        :param max_workers: number of worker threads 'int'
+        :param ordered: yield results in input order if True, as they complete if False 'bool'
+        :return: generator of (item, result) tuples
+        """
+        gcc_http.blocking_call()
+        if isinstance(func, str):
+            func = getattr(self, func)
+
+        def call(item):
+            if isinstance(item, tuple):
+                return func(*item)
+            if isinstance(item, dict):
+                return func(**item)
+            return func(item)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=self._init_worker,
+                                      thread_name_prefix='gcc-worker')
+        try:
+            futures: dict = {executor.submit(call, item): item for item in items}
+            for future in (futures if ordered else as_completed(futures)):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def batch(self, callback=None, batch_size: int = GccBatch.MAX_BATCH_SIZE) -> GccBatch:
+        """
+        this func defines the batch method, returns a batch that groups requests into multipart http requests.
+        usage:
+            batch = teacher.batch()
+            batch.add(teacher.classroom.courses().get(id=course_id), request_id=course_id)
+            results = batch.execute()
+
+        :param callback: called as callback(request_id, response, exception) for every item
+        :param batch_size: number of calls per batch request, at most 50 'int'
+        :return: GccBatch
+        """
+        return GccBatch(self.classroom, callback=callback, batch_size=batch_size)
+
+    def _execute_batch(self, batch: GccBatch) -> dict:
+        """
+        this func defines the _execute_batch method, executes a batch and splits its per-item results.
+
+        :param batch: GccBatch with queued requests
+        :return: {"responses": {request_id: response}, "errors": {request_id: HttpError}}
+        """
+        responses: dict = dict()
+        errors: dict = dict()
+
+        for request_id, result in batch.execute().items():
+            if isinstance(result, HttpError):
+                self.logger.error('An error occurred: %s' % result)
+                errors[request_id] = result
+            else:
+                responses[request_id] = result
+
+        return {"responses": responses, "errors": errors}
+
+    @staticmethod
+    def _page_query(page_size: int = None, page_token: str = None) -> dict:
+        query_params: dict = dict()
+
+        if page_size:
+            gcc_validators.are_params_int(page_size)
+            if page_size >= 100:
+                raise ValueError("Page size cannot be more than 100.")
+            query_params['pageSize'] = page_size
+
+        if page_token:
+            gcc_validators.are_params_string(page_token)
+            query_params['pageToken'] = page_token
+
+        return query_params
 
     @gcc_validators.validate_params(str)
     def _accept_invitation(self, invitation_id: str) -> bool:
@@ -202,22 +418,91 @@ class GccBase:
             self.logger.error('An error occurred: %s' % error)
             return False
 
-    @staticmethod
-    def save_cache(func):
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            finally:
-                with open('data_endpoint/gcc_cache.json', 'w', encoding='utf-8') as fh:
-                    json.dump(args[0].cache, fh)
+    def create_registration(self, feed_type: str, topic_name: str, course_id: str = None) -> dict or False:
+        """
+        this func defines the create_registration method, registers a Cloud Pub/Sub topic for the
+        notifications of a feed, a registration expires after a week and has to be created again.
+        see https://developers.google.com/classroom/reference/rest/v1/registrations/create
+        for more info
+
+        :param feed_type: DOMAIN_ROSTER_CHANGES / COURSE_ROSTER_CHANGES / COURSE_WORK_CHANGES 'string'
+        :param topic_name: the Pub/Sub topic, projects/{project}/topics/{topic} 'string'
+        :param course_id: the course of a COURSE_ROSTER_CHANGES / COURSE_WORK_CHANGES feed 'string'
+        :return: the registration dict (registrationId, expiryTime, ...) | False
+        """
+        if feed_type not in ['DOMAIN_ROSTER_CHANGES', 'COURSE_ROSTER_CHANGES', 'COURSE_WORK_CHANGES']:
+            raise ValueError(f"Invalid feed type: {feed_type}")
+        gcc_validators.are_params_string(topic_name)
+
+        feed: dict = {'feedType': feed_type}
+        if feed_type == 'COURSE_ROSTER_CHANGES':
+            feed['courseRosterChangesInfo'] = {'courseId': course_id}
+        elif feed_type == 'COURSE_WORK_CHANGES':
+            feed['courseWorkChangesInfo'] = {'courseId': course_id}
+        if feed_type != 'DOMAIN_ROSTER_CHANGES':
+            gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        body: dict = {
+            'feed': feed,
+            'cloudPubsubTopic': {'topicName': topic_name}
+        }
+        try:
+            return self.classroom.registrations().create(body=body).execute()
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    @gcc_validators.validate_params(str)
+    def delete_registration(self, registration_id: str) -> bool:
+        """
+        this func defines the delete_registration method, stops the notifications of a registration.
+        see https://developers.google.com/classroom/reference/rest/v1/registrations/delete
+        for more info
 
-        return wrapper
+        :param registration_id: the registrationId returned by create_registration 'string'
+        :return: bool
+        """
+        try:
+            self.classroom.registrations().delete(registrationId=registration_id).execute()
+            return True
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    def refresh_cache(self) -> list[dict]:
+        """
+        this func defines the refresh_cache method, re-lists every course of the account (all pages)
+        and replaces the cached courses with them.
 
-    @save_cache
-    def _update_cache(self):
+        :return: list of course dicts
+        """
+        courses: list = list()
+        collection = self.classroom.courses()
+        request = collection.list()
+        while request is not None:
+            response: dict = request.execute()
+            courses.extend(response.get('courses', []))
+            request = collection.list_next(request, response)
+
+        self.cache.replace_courses(self.check, courses)
+        return courses
+
+    def _cache_expired(self) -> bool:
+        refreshed_at = self.cache.refreshed_at(self.check, max_age=self.ref_cache_ttl.total_seconds())
+        return refreshed_at is None or time.time() - refreshed_at > self.ref_cache_ttl.total_seconds()
+
+    def _update_cache(self, course: dict = None, deleted_course_id: str = None):
+        """
+        this func defines the _update_cache method, applies a mutation to the cached courses.
+        the created / patched course response is upserted and a deleted course is dropped,
+        a full re-list only happens once ref_cache_month has passed since the last one.
 
-        with open('data_endpoint/gcc_cache.json', 'r', encoding='utf-8') as fh:
-            fh.read()
-            results = self.classroom.courses().list(pageSize=100).execute()
-            courses = results.get('courses', [])
-            self.__cache[self.check] = courses
+        :param course: course resource returned by a create / patch / update call
+        :param deleted_course_id: identifier or alias of a deleted course 'string'
+        """
+        if course:
+            self.cache.upsert_courses(self.check, [course])
+        if deleted_course_id:
+            self.cache.delete_course(self.check, deleted_course_id)
+        if self._cache_expired():
+            self.refresh_cache()
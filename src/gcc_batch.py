@@ -0,0 +1,135 @@
+import time
+
+from googleapiclient.errors import HttpError
+
+from src import gcc_http
+
+__all__ = [
+    'GccBatch'
+]
+
+
+class GccBatch:
+    """
+    groups classroom requests into multipart batch http requests.
+    the classroom api accepts at most 50 calls per batch, larger queues are split into several batches.
+    see https://developers.google.com/classroom/best-practices/batch
+    for more info
+    """
+    MAX_BATCH_SIZE: int = 50
+
+    def __init__(self, classroom, callback=None, batch_size: int = MAX_BATCH_SIZE, execute=None):
+        """
+        :param classroom: the classroom service resource
+        :param callback: called as callback(request_id, response, exception) for every item
+        :param batch_size: number of calls per batch request, capped at MAX_BATCH_SIZE 'int'
+        :param execute: callable executing a BatchHttpRequest, defaults to batch.execute()
+        """
+        if batch_size < 1 or batch_size > self.MAX_BATCH_SIZE:
+            batch_size = self.MAX_BATCH_SIZE
+
+        self.__classroom = classroom
+        self.__callback = callback
+        self.__batch_size: int = batch_size
+        self.__execute = execute
+        self.__queue: list = list()
+        self.__ids: set = set()
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+    def add(self, request, request_id: str = None, callback=None) -> str:
+        """
+        this func defines the add method, queues a request for the next execute().
+
+        :param request: googleapiclient HttpRequest, built but not executed
+        :param request_id: unique identifier of the item, defaults to its position in the queue 'string'
+        :param callback: per-item callback, overrides the batch callback
+        :return: the request id, raises ValueError when it is already queued
+        """
+        if request_id is None:
+            request_id = str(len(self.__queue))
+        # the results are keyed by request id, a duplicate would overwrite another item's result
+        if request_id in self.__ids:
+            raise ValueError(f'Duplicate batch request id: {request_id}')
+        self.__ids.add(request_id)
+        self.__queue.append((request_id, request, callback))
+        return request_id
+
+    def execute(self) -> dict:
+        """
+        this func defines the execute method, sends every queued request in batches of batch_size.
+        calls failing with a transient error are sent again in a later batch, as the retry policy allows.
+
+        :return: dict of request id -> response dict or HttpError
+        """
+        gcc_http.blocking_call()
+        results: dict = dict()
+        queued, self.__queue = self.__queue, list()
+        self.__ids = set()
+        attempt: int = 0
+
+        policy = gcc_http.get_retry_policy()
+        if policy is not None:
+            for _, request, _ in queued:
+                policy.budget.deposit()
+
+        while queued:
+            attempt += 1
+            retries: list = list()
+            for start in range(0, len(queued), self.__batch_size):
+                batch = self.__classroom.new_batch_http_request()
+                for item in queued[start:start + self.__batch_size]:
+                    request_id, request, callback = item
+                    # every call of a batch counts against the quota
+                    gcc_http.throttle(request)
+                    batch.add(request, callback=self.__item_callback(results, item, attempt, retries),
+                              request_id=request_id)
+                if self.__execute:
+                    self.__execute(batch)
+                else:
+                    batch.execute()
+
+            if retries:
+                time.sleep(max(wait for _, wait in retries))
+            queued = [item for item, _ in retries]
+
+        return results
+
+    def __item_callback(self, results: dict, item: tuple, attempt: int, retries: list):
+        request_id, request, callback = item
+        callback = callback or self.__callback
+
+        def item_callback(request_id: str, response: dict, exception: HttpError):
+            if exception is not None:
+                wait: float or None = self.__retry_delay(request, exception, attempt)
+                if wait is not None:
+                    retries.append((item, wait))
+                    return
+            results[request_id] = exception if exception is not None else response
+            if exception is None and request.method != 'GET':
+                gcc_http.notify_mutation(request.uri)
+            if callback:
+                callback(request_id, response, exception)
+
+        return item_callback
+
+    @staticmethod
+    def __retry_delay(request, exception: HttpError, attempt: int) -> float or None:
+        policy = gcc_http.get_retry_policy()
+        if policy is not None:
+            policy = policy.for_method(getattr(request, 'methodId', None))
+        if policy is None:
+            return None
+        return policy.delay(request, exception, attempt)
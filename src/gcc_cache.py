@@ -0,0 +1,460 @@
+import copy
+import json
+import os.path
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlsplit
+
+from googleapiclient.errors import HttpError
+
+from src import gcc_http
+
+__all__ = [
+    'GccCache',
+    'CourseKeys',
+    'TtlLruCache',
+    'ResponseCache',
+    'get_cache'
+]
+
+_MISSING = object()
+
+
+class TtlLruCache:
+    """
+    in-memory mapping bounded by size (least recently used entries are evicted first)
+    whose entries expire ttl seconds after they were set.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = None):
+        self.__maxsize: int = max(1, maxsize)
+        self.__ttl: float = ttl
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict = OrderedDict()
+
+    @property
+    def maxsize(self):
+        return self.__maxsize
+
+    @property
+    def ttl(self):
+        return self.__ttl
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self.__entries[key]
+                return default
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        """
+        :param ttl: seconds until the entry expires, defaults to the cache ttl, None never expires
+        """
+        ttl = self.__ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self.__lock:
+            self.__entries[key] = (value, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def keys(self) -> list:
+        with self.__lock:
+            return list(self.__entries.keys())
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def expire(self) -> int:
+        """
+        drops every expired entry.
+
+        :return: number of dropped entries
+        """
+        now: float = time.monotonic()
+        with self.__lock:
+            expired: list = [key for key, (_, expires_at) in self.__entries.items()
+                             if expires_at is not None and expires_at <= now]
+            for key in expired:
+                del self.__entries[key]
+        return len(expired)
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS courses (
+    account TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (account, course_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS aliases (
+    account TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    PRIMARY KEY (account, alias)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS aliases_course ON aliases (account, course_id);
+
+CREATE TABLE IF NOT EXISTS refreshes (
+    account TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class GccCache:
+    """
+    sqlite backed course cache, one row per (account, course id) plus an alias table.
+    membership checks and writes are point lookups / upserts on the primary keys,
+    nothing is re-read or rewritten as a whole.
+    in memory it keeps, for at most max_accounts accounts, the set of course keys and
+    an lru of at most max_entries course dicts per account.
+    """
+
+    def __init__(self, path: str = 'data_endpoint/gcc_cache.sqlite3',
+                 json_path: str = 'data_endpoint/gcc_cache.json',
+                 max_accounts: int = 64, max_entries: int = 1000):
+        self.__path: str = path
+        self.__lock = threading.RLock()
+        self.__max_entries: int = max_entries
+        self.__keys: TtlLruCache = TtlLruCache(maxsize=max_accounts)
+        self.__courses: TtlLruCache = TtlLruCache(maxsize=max_accounts)
+        # account -> time of its last full refresh, mirrors the refreshes table
+        self.__refreshed: dict = dict()
+        self.__conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__conn.execute('PRAGMA journal_mode=WAL')
+        self.__conn.execute('PRAGMA synchronous=NORMAL')
+        self.__conn.executescript(_SCHEMA)
+
+        if json_path and os.path.exists(json_path) and not self.accounts():
+            self.__import_json(json_path)
+
+    @property
+    def path(self):
+        return self.__path
+
+    def close(self):
+        with self.__lock:
+            self.__conn.close()
+
+    def __import_json(self, json_path: str):
+        try:
+            with open(json_path, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            for account, courses in data.items():
+                if isinstance(courses, list):
+                    self.replace_courses(account, courses)
+
+    @property
+    def max_entries(self):
+        return self.__max_entries
+
+    def keys(self, account: str, ttl: float = None) -> frozenset:
+        """
+        returns the account's course ids and aliases, built once from the database and kept in memory
+        until the account's cached courses or aliases change or ttl seconds have passed.
+
+        :param account: the account email / workspace 'string'
+        :param ttl: seconds the in-memory set stays valid, None until the next write
+        :return: frozenset of course ids and aliases
+        """
+        keys = self.__keys.get(account)
+        if keys is None:
+            with self.__lock:
+                rows = self.__conn.execute('SELECT course_id FROM courses WHERE account = ? '
+                                           'UNION SELECT alias FROM aliases WHERE account = ?',
+                                           (account, account)).fetchall()
+                keys = frozenset(row[0] for row in rows)
+                self.__keys.set(account, keys, ttl)
+        return keys
+
+    def invalidate(self, account: str = None):
+        with self.__lock:
+            if account is None:
+                self.__keys.clear()
+                self.__courses.clear()
+            else:
+                self.__keys.pop(account)
+                self.__courses.pop(account)
+
+    def refreshed_at(self, account: str, max_age: float = None) -> float or None:
+        """
+        returns the unix time of the account's last full refresh (replace_courses), None if it never happened.
+        a known refresh younger than max_age seconds is answered from memory, an older one is read again
+        as another process may have refreshed the account since.
+        """
+        refreshed_at: float or None = self.__refreshed.get(account)
+        if refreshed_at is not None and max_age is not None and time.time() - refreshed_at <= max_age:
+            return refreshed_at
+        with self.__lock:
+            row = self.__conn.execute('SELECT refreshed_at FROM refreshes WHERE account = ?', (account,)).fetchone()
+            if row:
+                self.__refreshed[account] = row[0]
+        return row[0] if row else None
+
+    def accounts(self) -> list[str]:
+        with self.__lock:
+            rows = self.__conn.execute('SELECT DISTINCT account FROM courses').fetchall()
+        return [row[0] for row in rows]
+
+    def course_id(self, account: str, key: str) -> str or None:
+        """
+        resolves a course id or alias to the cached course id.
+
+        :param account: the account email / workspace 'string'
+        :param key: course id or alias 'string'
+        :return: course id or None
+        """
+        key = str(key)
+        with self.__lock:
+            row = self.__conn.execute('SELECT course_id FROM courses WHERE account = ? AND course_id = ?',
+                                      (account, key)).fetchone()
+            if row is None:
+                row = self.__conn.execute('SELECT course_id FROM aliases WHERE account = ? AND alias = ?',
+                                          (account, key)).fetchone()
+        return row[0] if row else None
+
+    def contains(self, account: str, key: str) -> bool:
+        return self.course_id(account, key) is not None
+
+    def get_course(self, account: str, key: str, ttl: float = None) -> dict or None:
+        """
+        returns a cached course by id or alias, served from the account's in-memory lru when present.
+
+        :param account: the account email / workspace 'string'
+        :param key: course id or alias 'string'
+        :param ttl: seconds the course stays in the in-memory lru, None until the next write
+        :return: course dict or None
+        """
+        key = str(key)
+        with self.__lock:
+            courses: TtlLruCache = self.__courses.get(account)
+            if courses is None:
+                courses = TtlLruCache(maxsize=self.__max_entries)
+                self.__courses.set(account, courses)
+            course = courses.get(key)
+            if course is not None:
+                return course
+
+            course_id = self.course_id(account, key)
+            if course_id is None:
+                return None
+            row = self.__conn.execute('SELECT data FROM courses WHERE account = ? AND course_id = ?',
+                                      (account, course_id)).fetchone()
+            if row is None:
+                return None
+            course = json.loads(row[0])
+            courses.set(key, course, ttl)
+        return course
+
+    def get_courses(self, account: str) -> list[dict]:
+        with self.__lock:
+            rows = self.__conn.execute('SELECT data FROM courses WHERE account = ?', (account,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_aliases(self, account: str) -> dict:
+        with self.__lock:
+            rows = self.__conn.execute('SELECT alias, course_id FROM aliases WHERE account = ?',
+                                       (account,)).fetchall()
+        return dict(rows)
+
+    def upsert_courses(self, account: str, courses: list[dict]):
+        now: float = time.time()
+        rows: list = [(account, str(course['id']), json.dumps(course), now) for course in courses if 'id' in course]
+        with self.__lock:
+            self.__conn.executemany('INSERT INTO courses (account, course_id, data, updated_at) VALUES (?, ?, ?, ?) '
+                                    'ON CONFLICT (account, course_id) DO UPDATE SET '
+                                    'data = excluded.data, updated_at = excluded.updated_at', rows)
+            self.invalidate(account)
+
+    def replace_courses(self, account: str, courses: list[dict]):
+        """
+        replaces every cached course of the account, aliases of courses that are gone are dropped.
+        """
+        now: float = time.time()
+        rows: list = [(account, str(course['id']), json.dumps(course), now) for course in courses if 'id' in course]
+        with self.__lock:
+            self.__conn.execute('BEGIN')
+            try:
+                self.__conn.execute('DELETE FROM courses WHERE account = ?', (account,))
+                self.__conn.executemany('INSERT INTO courses (account, course_id, data, updated_at) '
+                                        'VALUES (?, ?, ?, ?)', rows)
+                self.__conn.execute('DELETE FROM aliases WHERE account = ? AND course_id NOT IN '
+                                    '(SELECT course_id FROM courses WHERE account = ?)', (account, account))
+                self.__conn.execute('INSERT OR REPLACE INTO refreshes (account, refreshed_at) VALUES (?, ?)',
+                                    (account, now))
+                self.__conn.execute('COMMIT')
+            except BaseException:
+                self.__conn.execute('ROLLBACK')
+                raise
+            self.__refreshed[account] = now
+            self.invalidate(account)
+
+    def delete_course(self, account: str, key: str):
+        course_id = self.course_id(account, key)
+        if course_id is None:
+            return
+        with self.__lock:
+            self.__conn.execute('DELETE FROM courses WHERE account = ? AND course_id = ?', (account, course_id))
+            self.__conn.execute('DELETE FROM aliases WHERE account = ? AND course_id = ?', (account, course_id))
+            self.invalidate(account)
+
+    def add_alias(self, account: str, key: str, alias: str):
+        course_id = self.course_id(account, key) or str(key)
+        with self.__lock:
+            self.__conn.execute('INSERT OR REPLACE INTO aliases (account, alias, course_id) VALUES (?, ?, ?)',
+                                (account, alias, course_id))
+            self.invalidate(account)
+
+    def delete_alias(self, account: str, alias: str):
+        with self.__lock:
+            self.__conn.execute('DELETE FROM aliases WHERE account = ? AND alias = ?', (account, alias))
+            self.invalidate(account)
+
+
+class CourseKeys:
+    """
+    container view of one account's cached course ids and aliases, for gcc_validators.are_params_in_cache.
+    membership is a hash lookup in GccCache.keys(), no file or database access once the index is built.
+    """
+
+    def __init__(self, cache: GccCache, account: str, ttl: float = None):
+        self.__cache = cache
+        self.__account = account
+        self.__ttl = ttl
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self.__cache.keys(self.__account, self.__ttl)
+
+
+_caches: dict[str, GccCache] = dict()
+_caches_lock = threading.Lock()
+
+
+def get_cache(path: str = 'data_endpoint/gcc_cache.sqlite3',
+              json_path: str = 'data_endpoint/gcc_cache.json',
+              max_accounts: int = 64, max_entries: int = 1000) -> GccCache:
+    """
+    returns the process-wide GccCache of a database file, so every client shares one connection and one index.
+    max_accounts and max_entries only apply when the cache is first opened.
+    """
+    path = os.path.abspath(path)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = GccCache(path, json_path, max_accounts, max_entries)
+            _caches[path] = cache
+        return cache
+
+
+_CachedResponse = namedtuple('_CachedResponse', ['response', 'etag', 'fetched_at'])
+
+
+def _resource_path(uri: str) -> str:
+    path: str = urlsplit(uri).path
+    return path.split(':', 1)[0].rstrip('/')
+
+
+class ResponseCache:
+    """
+    read-through cache of get responses keyed by request uri.
+    a response younger than max_age seconds is served locally, an older one is revalidated with
+    If-None-Match when it came with an ETag (a 304 keeps the cached copy) and refetched otherwise.
+    a successful mutation drops every cached response at or below the mutated resource path.
+    """
+
+    def __init__(self, max_age: float = 60, maxsize: int = 1024):
+        self.__max_age: float = max_age
+        self.__entries: TtlLruCache = TtlLruCache(maxsize=maxsize)
+        self.__hits: int = 0
+        self.__revalidations: int = 0
+        self.__misses: int = 0
+        gcc_http.add_mutation_listener(self)
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.__hits, 'revalidations': self.__revalidations, 'misses': self.__misses,
+                'size': len(self.__entries)}
+
+    def execute(self, request) -> dict:
+        """
+        this func defines the execute method, executes a get request through the cache.
+
+        :param request: googleapiclient HttpRequest
+        :return: the response dict
+        """
+        key: str = request.uri
+        entry: _CachedResponse = self.__entries.get(key)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.__max_age:
+            self.__hits += 1
+            return copy.deepcopy(entry.response)
+
+        headers: dict = dict()
+        postproc = request.postproc
+
+        def capture_headers(resp, content):
+            headers.update(resp)
+            return postproc(resp, content)
+
+        request.postproc = capture_headers
+        if entry is not None and entry.etag:
+            request.headers['If-None-Match'] = entry.etag
+
+        try:
+            response: dict = request.execute()
+        except HttpError as error:
+            if entry is not None and error.resp.status == 304:
+                self.__revalidations += 1
+                self.__entries.set(key, entry._replace(fetched_at=time.monotonic()))
+                return copy.deepcopy(entry.response)
+            raise
+
+        self.__misses += 1
+        etag = headers.get('etag') or (response.get('etag') if isinstance(response, dict) else None)
+        self.__entries.set(key, _CachedResponse(copy.deepcopy(response), etag, time.monotonic()))
+        return response
+
+    def invalidate(self, uri: str = None):
+        """
+        drops the cached responses at or below the resource path of uri, every response if uri is None.
+        """
+        if uri is None:
+            self.__entries.clear()
+            return
+        path: str = _resource_path(uri)
+        for key in self.__entries.keys():
+            key_path: str = _resource_path(key)
+            if key_path == path or key_path.startswith(path + '/'):
+                self.__entries.pop(key)
+
+    def on_mutation(self, uri: str):
+        self.invalidate(uri)
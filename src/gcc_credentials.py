@@ -0,0 +1,239 @@
+import datetime
+import os
+import os.path
+import threading
+
+from google.auth.exceptions import RefreshError, TransportError
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+__all__ = [
+    'CredentialManager',
+    'get_credential_manager',
+    'token_path'
+]
+
+
+def token_path(role: str, account: str = None) -> str:
+    """
+    the token file of a role's account, data_endpoint/{role}_{account}_token.json.
+    the single per-role file data_endpoint/{role}_token.json is still used while no per-account file exists.
+
+    :param role: student / teacher / admin 'string'
+    :param account: email or work_space 'string'
+    :return: path 'string'
+    """
+    role_path: str = f'data_endpoint/{role}_token.json'
+    if account:
+        account_path: str = f'data_endpoint/{role}_{account}_token.json'
+        if os.path.exists(account_path) or not os.path.exists(role_path):
+            return account_path
+    return role_path
+
+
+class _ManagedCredentials:
+    """
+    one credential set and the state the manager keeps around it.
+    """
+
+    def __init__(self, creds, path: str or None):
+        self.creds = creds
+        # None for service account credentials, there is nothing to persist
+        self.path: str or None = path
+        self.lock = threading.Lock()
+        self.timer: threading.Timer or None = None
+        self.saved: str or None = None
+
+
+class CredentialManager:
+    """
+    keeps the oauth credentials of every role / account in memory for the whole process.
+    the token file is read once, the credentials are refreshed on a background timer refresh_margin before
+    they expire, so requests do not pay for a refresh, and the token file is rewritten (atomically)
+    only when the token actually changed.
+    with a service account (use_service_account or GCC_SERVICE_ACCOUNT_FILE), accounts are impersonated
+    through domain-wide delegation instead of reading token files.
+    """
+
+    def __init__(self, refresh_margin: datetime.timedelta = datetime.timedelta(minutes=5),
+                 retry_delay: float = 60):
+        """
+        :param refresh_margin: how long before expiry the credentials are refreshed 'timedelta'
+        :param retry_delay: seconds before a failed background refresh is retried 'float'
+        """
+        self.__refresh_margin: datetime.timedelta = refresh_margin
+        self.__retry_delay: float = retry_delay
+        self.__lock = threading.Lock()
+        self.__entries: dict = dict()
+        self.__service_account_file: str or None = os.environ.get('GCC_SERVICE_ACCOUNT_FILE')
+
+    @property
+    def refresh_margin(self):
+        return self.__refresh_margin
+
+    @property
+    def service_account_file(self):
+        return self.__service_account_file
+
+    def use_service_account(self, service_account_file: str or None):
+        """
+        this func defines the use_service_account method, impersonates accounts with a service account key
+        that has domain-wide delegation for the classroom scopes, None goes back to token files.
+
+        :param service_account_file: path of the service account json key 'string'
+        """
+        self.__service_account_file = service_account_file
+
+    def get(self, role: str, scopes: list, path: str = None, account: str = None) -> Credentials:
+        """
+        this func defines the get method, returns the credentials of a role's account.
+        the first call loads the token file, or runs the installed app flow when there is no usable token
+        (GOOGLE_APPLICATION_CREDENTIALS points to the client secrets), later calls return the same object.
+        expired credentials are refreshed in the background instead of in the caller.
+
+        :param role: student / teacher / admin 'string'
+        :param scopes: the oauth scopes of the role 'list'
+        :param path: the token file, defaults to token_path(role, account) 'string'
+        :param account: email or work_space of the account 'string'
+        :return: Credentials
+        """
+        with self.__lock:
+            key: tuple = self.__key(role, scopes, path, account)
+            entry: _ManagedCredentials = self.__entries.get(key)
+            if entry is None:
+                if key[0] == 'service_account':
+                    entry = self.__delegate(account, list(scopes))
+                else:
+                    entry = self.__load(key[0], list(scopes))
+                self.__entries[key] = entry
+                self.__schedule(entry)
+        return entry.creds
+
+    def __key(self, role: str, scopes: list, path: str = None, account: str = None) -> tuple:
+        if path is None and account and self.__service_account_file:
+            return 'service_account', os.path.abspath(self.__service_account_file), account, tuple(sorted(scopes))
+        return os.path.abspath(path or token_path(role, account)), tuple(sorted(scopes))
+
+    def __delegate(self, account: str, scopes: list) -> _ManagedCredentials:
+        creds = service_account.Credentials.from_service_account_file(self.__service_account_file, scopes=scopes)
+        return _ManagedCredentials(creds.with_subject(account), None)
+
+    def __load(self, path: str, scopes: list) -> _ManagedCredentials:
+        creds = None
+        if os.path.exists(path):
+            creds = Credentials.from_authorized_user_file(path, scopes=scopes)
+
+        if creds and (creds.valid or creds.refresh_token):
+            entry = _ManagedCredentials(creds, path)
+            with open(path, 'r', encoding='utf-8') as token:
+                entry.saved = token.read()
+            return entry
+
+        credentials_account_file = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+        flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file=credentials_account_file,
+                                                         scopes=scopes)
+        entry = _ManagedCredentials(flow.run_local_server(port=0), path)
+        self.save(entry)
+        return entry
+
+    def save(self, entry: _ManagedCredentials) -> bool:
+        """
+        this func defines the save method, writes the token file when the token changed since the last write.
+        the file is replaced atomically and readable by the owner only.
+
+        :param entry: _ManagedCredentials
+        :return: True if the file was written
+        """
+        if entry.path is None:
+            return False
+        token_json: str = entry.creds.to_json()
+        if token_json == entry.saved:
+            return False
+
+        directory: str = os.path.dirname(entry.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path: str = f'{entry.path}.tmp'
+        descriptor: int = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as token:
+            token.write(token_json)
+        os.replace(temp_path, entry.path)
+        entry.saved = token_json
+        return True
+
+    def __seconds_to_refresh(self, creds) -> float or None:
+        if creds.expiry is None:
+            return None if creds.valid else 0
+        # google-auth keeps expiry as a naive utc datetime
+        now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return max(0.0, (creds.expiry - self.__refresh_margin - now).total_seconds())
+
+    def __schedule(self, entry: _ManagedCredentials, delay: float = None):
+        if entry.timer is not None:
+            entry.timer.cancel()
+        if delay is None:
+            delay = self.__seconds_to_refresh(entry.creds)
+        if delay is None or (entry.path is not None and not entry.creds.refresh_token):
+            entry.timer = None
+            return
+        entry.timer = threading.Timer(delay, self.__refresh, args=(entry,))
+        entry.timer.daemon = True
+        entry.timer.start()
+
+    def __refresh(self, entry: _ManagedCredentials):
+        with entry.lock:
+            try:
+                # the request path may have refreshed them meanwhile (AuthorizedHttp on an expired token)
+                if self.__seconds_to_refresh(entry.creds) == 0:
+                    entry.creds.refresh(Request())
+                self.save(entry)
+            except (RefreshError, TransportError, OSError):
+                self.__schedule(entry, self.__retry_delay)
+                return
+            self.__schedule(entry)
+
+    def refresh(self, role: str, scopes: list, path: str = None, account: str = None) -> Credentials:
+        """
+        this func defines the refresh method, refreshes the credentials of a role's account now.
+
+        :param role: student / teacher / admin 'string'
+        :param scopes: the oauth scopes of the role 'list'
+        :param path: the token file, defaults to token_path(role, account) 'string'
+        :param account: email or work_space of the account 'string'
+        :return: Credentials
+        """
+        creds = self.get(role, scopes, path, account)
+        with self.__lock:
+            entry: _ManagedCredentials = self.__entries[self.__key(role, scopes, path, account)]
+        with entry.lock:
+            creds.refresh(Request())
+            self.save(entry)
+        self.__schedule(entry)
+        return creds
+
+    def close(self):
+        """
+        cancels the background refreshes.
+        """
+        with self.__lock:
+            for entry in self.__entries.values():
+                if entry.timer is not None:
+                    entry.timer.cancel()
+                    entry.timer = None
+
+
+_manager_lock = threading.Lock()
+_manager: CredentialManager or None = None
+
+
+def get_credential_manager() -> CredentialManager:
+    """
+    :return: the process-wide CredentialManager
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = CredentialManager()
+        return _manager
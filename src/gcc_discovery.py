@@ -0,0 +1,152 @@
+import json
+import os.path
+import threading
+import time
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import build_http
+
+from src import gcc_http
+
+__all__ = [
+    'DISCOVERY_URL',
+    'get_discovery_document',
+    'build_service',
+    'get_service',
+    'clear_services'
+]
+
+API_NAME: str = 'classroom'
+API_VERSION: str = 'v1'
+DISCOVERY_URL: str = f'https://{API_NAME}.googleapis.com/$discovery/rest?version={API_VERSION}'
+DISCOVERY_PATH: str = f'data_endpoint/{API_NAME}_{API_VERSION}_discovery.json'
+# bumped whenever the layout of the persisted file changes, older files are re-fetched
+DISCOVERY_FORMAT: int = 1
+DISCOVERY_MAX_AGE: float = 7 * 24 * 60 * 60
+DISCOVERY_TIMEOUT: float = 5
+
+_lock = threading.RLock()
+_documents: dict = dict()
+_services: dict = dict()
+
+
+def _read_document(path: str) -> dict or None:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            stored: dict = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if stored.get('format') != DISCOVERY_FORMAT or stored.get('version') != API_VERSION:
+        return None
+    document = stored.get('document')
+    if not isinstance(document, dict) or document.get('version') != API_VERSION:
+        return None
+    return stored
+
+
+def _write_document(path: str, document: dict) -> dict:
+    stored: dict = {
+        'format': DISCOVERY_FORMAT,
+        'version': API_VERSION,
+        'revision': document.get('revision'),
+        'fetched_at': time.time(),
+        'document': document
+    }
+    directory: str = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path: str = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(stored, file)
+    os.replace(temp_path, path)
+    return stored
+
+
+def _fetch_document() -> dict or None:
+    try:
+        response, content = httplib2.Http(timeout=DISCOVERY_TIMEOUT).request(DISCOVERY_URL)
+    except (OSError, httplib2.HttpLib2Error):
+        return None
+    if response.status != 200:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+def get_discovery_document(path: str = DISCOVERY_PATH, max_age: float = DISCOVERY_MAX_AGE) -> dict:
+    """
+    this func defines the get_discovery_document function, returns the parsed classroom discovery document.
+    the document is kept in memory for the process and persisted in path, a persisted copy older than
+    max_age seconds is re-fetched, when the fetch fails the stale copy is kept,
+    with no copy at all the document shipped with googleapiclient is used.
+    a file written by another format or api version is ignored.
+
+    :param path: file the document is persisted in 'string'
+    :param max_age: seconds before the persisted document is re-fetched 'float'
+    :return: discovery document dict
+    """
+    with _lock:
+        stored: dict = _documents.get(path)
+        if stored is None:
+            stored = _read_document(path)
+
+        if stored is None or time.time() - stored.get('fetched_at', 0) > max_age:
+            document: dict = _fetch_document()
+            if document is None:
+                # offline or failing, keep what there is and check again after max_age
+                document = stored['document'] if stored else json.loads(get_static_doc(API_NAME, API_VERSION))
+            stored = _write_document(path, document)
+
+        _documents[path] = stored
+        return stored['document']
+
+
+def build_service(credentials=None, http=None):
+    """
+    this func defines the build_service function, builds a classroom service from the cached discovery document.
+
+    :param credentials: google auth credentials, ignored when http is given
+    :param http: authorized http object
+    :return: classroom Resource
+    """
+    if http is None:
+        http = AuthorizedHttp(credentials, http=build_http())
+    return build_from_document(get_discovery_document(), http=http, requestBuilder=gcc_http.GccHttpRequest)
+
+
+def _credentials_key(credentials) -> tuple:
+    return (
+        type(credentials).__name__,
+        getattr(credentials, 'client_id', None),
+        getattr(credentials, 'refresh_token', None) or getattr(credentials, 'service_account_email', None),
+        getattr(credentials, '_subject', None),
+        tuple(sorted(getattr(credentials, 'scopes', None) or ()))
+    )
+
+
+def get_service(credentials):
+    """
+    this func defines the get_service function, returns the process-wide classroom service of a credential set.
+    the service is built once per credential set and shared by every client constructed with the same credentials.
+    httplib2 is not thread-safe, threads other than the main one should use build_service() instead.
+
+    :param credentials: google auth credentials
+    :return: classroom Resource
+    """
+    key: tuple = _credentials_key(credentials)
+    with _lock:
+        service = _services.get(key)
+        if service is None:
+            service = build_service(credentials)
+            _services[key] = service
+        return service
+
+
+def clear_services():
+    with _lock:
+        _services.clear()
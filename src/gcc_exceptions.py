@@ -146,3 +146,18 @@ class CourseWorkMaterialStateError(GccErrors):
 class CourseJsonEmpty(GccErrors):
     def __init__(self):
         super().__init__('Course json is not full.')
+
+
+class DaemonUnavailable(GccErrors):
+    def __init__(self):
+        super().__init__('No gcc daemon is listening on the socket.')
+
+
+class DaemonNoResponse(GccErrors):
+    def __init__(self):
+        super().__init__('The gcc daemon closed the connection without a response, the call may have run.')
+
+
+class DaemonError(GccErrors):
+    def __init__(self, message: str):
+        super().__init__(f'The gcc daemon failed the call: {message}')
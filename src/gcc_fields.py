@@ -0,0 +1,79 @@
+__all__ = [
+    'FIELD_PRESETS',
+    'field_mask'
+]
+
+# resource -> preset name -> fields of one resource
+# see https://developers.google.com/classroom/guides/performance#partial-response
+FIELD_PRESETS: dict = {
+    'courses': {
+        'ids': 'id',
+        'summary': 'id,name,section,courseState,ownerId,enrollmentCode,updateTime'
+    },
+    'aliases': {
+        'ids': 'alias'
+    },
+    'announcements': {
+        'ids': 'id',
+        'summary': 'id,text,state,creatorUserId,updateTime'
+    },
+    'courseWork': {
+        'ids': 'id',
+        'summary': 'id,title,state,workType,dueDate,dueTime,maxPoints,topicId,updateTime',
+        'grading': 'id,title,state,maxPoints,gradeCategory,gradingPeriodId'
+    },
+    'studentSubmissions': {
+        'ids': 'id',
+        'summary': 'id,userId,courseWorkId,state,late,updateTime',
+        'grading': 'id,userId,courseWorkId,state,assignedGrade,draftGrade,late,updateTime'
+    },
+    'courseWorkMaterial': {
+        'ids': 'id',
+        'summary': 'id,title,state,topicId,updateTime'
+    },
+    'students': {
+        'ids': 'userId',
+        'summary': 'userId,profile(name/fullName,emailAddress)'
+    },
+    'teachers': {
+        'ids': 'userId',
+        'summary': 'userId,profile(name/fullName,emailAddress)'
+    },
+    'topic': {
+        'ids': 'topicId',
+        'summary': 'topicId,name,updateTime'
+    },
+    'invitations': {
+        'ids': 'id',
+        'summary': 'id,userId,courseId,role'
+    },
+    'userProfiles': {
+        'ids': 'id',
+        'summary': 'id,name/fullName,emailAddress'
+    }
+}
+
+
+def field_mask(resource: str, fields: str, listing: bool = False) -> str or None:
+    """
+    this func defines the field_mask function, builds the fields= query parameter of a get or list request.
+    fields is either a preset name of the resource (see FIELD_PRESETS) or a field mask of one resource,
+    for a list request it is applied to every item and nextPageToken is always kept, a mask already
+    naming the items key ('courseWork(id,state)') is used as is.
+
+    :param resource: FIELD_PRESETS key of the resource, the items key of its list response 'string'
+    :param fields: preset name or field mask 'string'
+    :param listing: True for a list request 'bool'
+    :return: the fields query parameter, None when fields is empty
+    """
+    if not fields:
+        return None
+
+    fields = FIELD_PRESETS.get(resource, {}).get(fields, fields)
+    if not listing:
+        return fields
+    if not fields.startswith(f'{resource}(') and f',{resource}(' not in fields:
+        fields = f'{resource}({fields})'
+    if 'nextPageToken' not in fields:
+        fields = f'nextPageToken,{fields}'
+    return fields
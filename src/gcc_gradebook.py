@@ -0,0 +1,234 @@
+import array
+import csv
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+__all__ = [
+    'SUBMISSION_STATES',
+    'Gradebook'
+]
+
+# state code of a cell -> submission state, -1 when the student has no submission for the course work
+SUBMISSION_STATES: tuple = ('SUBMISSION_STATE_UNSPECIFIED', 'NEW', 'CREATED', 'TURNED_IN', 'RETURNED',
+                            'RECLAIMED_BY_STUDENT')
+
+_STATE_CODES: dict = {state: code for code, state in enumerate(SUBMISSION_STATES)}
+
+# the api keeps grades to two decimals, float32 cells are rounded back to them when exported
+_GRADE_DIGITS: int = 2
+
+# matrix name -> array typecode of its storage
+_MATRICES: dict = {
+    'assigned_grade': 'f',
+    'draft_grade': 'f',
+    'state': 'b',
+    'late': 'b'
+}
+
+
+class Gradebook:
+    """
+    students x course work matrix of a course, stored column-compact: one flat row-major array per value
+    (assignedGrade and draftGrade as float32, nan when not graded, state as an int8 code of
+    SUBMISSION_STATES, late as 0 / 1), 300 students x 200 course work take about 600kb.
+    with numpy installed assigned_grades, draft_grades, states and late are zero-copy 2d ndarray views.
+    """
+
+    def __init__(self, course_id: str, students: list[dict], course_work: list[dict]):
+        """
+        :param course_id: identifier of the course 'string'
+        :param students: the row students, dicts with userId and optionally profile 'list'
+        :param course_work: the column course work, dicts with id and optionally title and maxPoints 'list'
+        """
+        self.__course_id: str = course_id
+        self.__student_ids: list[str] = [student['userId'] for student in students]
+        self.__student_names: list[str] = [student.get('profile', {}).get('name', {}).get('fullName', '')
+                                           for student in students]
+        self.__course_work_ids: list[str] = [work['id'] for work in course_work]
+        self.__course_work_titles: list[str] = [work.get('title', '') for work in course_work]
+        self.__max_points = array.array('f', [work.get('maxPoints', math.nan) for work in course_work])
+        self.__rows: dict = {user_id: row for row, user_id in enumerate(self.__student_ids)}
+        self.__columns: dict = {work_id: column for column, work_id in enumerate(self.__course_work_ids)}
+
+        size: int = len(self.__student_ids) * len(self.__course_work_ids)
+        self.__data: dict = {
+            'assigned_grade': array.array('f', [math.nan]) * size,
+            'draft_grade': array.array('f', [math.nan]) * size,
+            'state': array.array('b', [-1]) * size,
+            'late': array.array('b', [0]) * size
+        }
+
+    @property
+    def course_id(self):
+        return self.__course_id
+
+    @property
+    def shape(self) -> tuple:
+        return len(self.__student_ids), len(self.__course_work_ids)
+
+    @property
+    def student_ids(self):
+        return list(self.__student_ids)
+
+    @property
+    def student_names(self):
+        return list(self.__student_names)
+
+    @property
+    def course_work_ids(self):
+        return list(self.__course_work_ids)
+
+    @property
+    def course_work_titles(self):
+        return list(self.__course_work_titles)
+
+    @property
+    def max_points(self):
+        return self.__vector(self.__max_points)
+
+    @property
+    def assigned_grades(self):
+        return self.matrix('assigned_grade')
+
+    @property
+    def draft_grades(self):
+        return self.matrix('draft_grade')
+
+    @property
+    def states(self):
+        return self.matrix('state')
+
+    @property
+    def late(self):
+        return self.matrix('late')
+
+    @staticmethod
+    def __vector(values: array.array):
+        if numpy is None:
+            return values
+        return numpy.frombuffer(values, dtype=numpy.float32)
+
+    def matrix(self, name: str):
+        """
+        this func defines the matrix method, returns one value of every cell as a 2d ndarray (requires numpy),
+        the view shares the gradebook's storage.
+
+        :param name: assigned_grade / draft_grade / state / late 'string'
+        :return: numpy.ndarray of shape (students, course work)
+        """
+        if numpy is None:
+            raise ImportError('Gradebook.matrix requires numpy, use Gradebook.value without it')
+        dtype = numpy.float32 if _MATRICES[name] == 'f' else numpy.int8
+        return numpy.frombuffer(self.__data[name], dtype=dtype).reshape(self.shape)
+
+    def value(self, user_id: str, course_work_id: str, name: str = 'assigned_grade'):
+        """
+        :param user_id: the student's userId 'string'
+        :param course_work_id: identifier of the course work 'string'
+        :param name: assigned_grade / draft_grade / state / late 'string'
+        :return: the cell value, a grade is nan when not graded, a state is its SUBMISSION_STATES name or None
+        """
+        value = self.__data[name][self.__rows[user_id] * len(self.__course_work_ids) + self.__columns[course_work_id]]
+        if name == 'state':
+            return SUBMISSION_STATES[value] if value >= 0 else None
+        if name == 'late':
+            return bool(value)
+        return value
+
+    def add_student(self, student: dict):
+        """
+        appends a row, for submissions of a student who is not on the roster (anymore).
+
+        :param student: dict with userId 'dict'
+        """
+        if student['userId'] in self.__rows:
+            return
+        self.__rows[student['userId']] = len(self.__student_ids)
+        self.__student_ids.append(student['userId'])
+        self.__student_names.append(student.get('profile', {}).get('name', {}).get('fullName', ''))
+        columns: int = len(self.__course_work_ids)
+        for name, values in self.__data.items():
+            empty = math.nan if values.typecode == 'f' else (-1 if name == 'state' else 0)
+            values.extend(array.array(values.typecode, [empty]) * columns)
+
+    def set_submission(self, submission: dict) -> bool:
+        """
+        this func defines the set_submission method, fills the cell of a student submission.
+
+        :param submission: student submission dict 'dict'
+        :return: False when the course work is not a column of the gradebook
+        """
+        column: int or None = self.__columns.get(submission.get('courseWorkId'))
+        if column is None:
+            return False
+        if submission['userId'] not in self.__rows:
+            self.add_student({'userId': submission['userId']})
+        cell: int = self.__rows[submission['userId']] * len(self.__course_work_ids) + column
+        self.__data['assigned_grade'][cell] = submission.get('assignedGrade', math.nan)
+        self.__data['draft_grade'][cell] = submission.get('draftGrade', math.nan)
+        self.__data['state'][cell] = _STATE_CODES.get(submission.get('state'), 0)
+        self.__data['late'][cell] = 1 if submission.get('late') else 0
+        return True
+
+    @staticmethod
+    def __grade(value: float) -> float or None:
+        return None if math.isnan(value) else round(value, _GRADE_DIGITS)
+
+    def to_csv(self, path: str, name: str = 'assigned_grade') -> str:
+        """
+        this func defines the to_csv method, writes one value of the gradebook as a wide csv,
+        a row per student and a column per course work id, ungraded cells are left empty.
+
+        :param path: the csv path 'string'
+        :param name: assigned_grade / draft_grade / state / late 'string'
+        :return: path 'string'
+        """
+        columns: int = len(self.__course_work_ids)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['userId', 'fullName'] + self.__course_work_ids)
+            for row, user_id in enumerate(self.__student_ids):
+                cells: list = list()
+                for column in range(columns):
+                    value = self.value(user_id, self.__course_work_ids[column], name)
+                    if isinstance(value, float):
+                        value = self.__grade(value)
+                    cells.append('' if value is None else value)
+                writer.writerow([user_id, self.__student_names[row]] + cells)
+        return path
+
+    def to_parquet(self, path: str) -> str:
+        """
+        this func defines the to_parquet method, writes the gradebook as a long parquet table (requires pyarrow),
+        a row per cell: userId, courseWorkId, assignedGrade, draftGrade, state, late.
+
+        :param path: the parquet path 'string'
+        :return: path 'string'
+        """
+        if pyarrow is None:
+            raise ImportError('Gradebook.to_parquet requires pyarrow')
+        students, columns = self.shape
+        table = pyarrow.table({
+            'userId': pyarrow.array([user_id for user_id in self.__student_ids for _ in range(columns)]),
+            'courseWorkId': pyarrow.array(self.__course_work_ids * students),
+            # nan grades are written as nulls, float64 so the rounded grades stay exact
+            'assignedGrade': pyarrow.array([self.__grade(grade) for grade in self.__data['assigned_grade']],
+                                           type=pyarrow.float64()),
+            'draftGrade': pyarrow.array([self.__grade(grade) for grade in self.__data['draft_grade']],
+                                        type=pyarrow.float64()),
+            'state': pyarrow.array([SUBMISSION_STATES[code] if code >= 0 else None for code in self.__data['state']],
+                                   type=pyarrow.string()).dictionary_encode(),
+            'late': pyarrow.array([bool(late) for late in self.__data['late']])
+        })
+        pyarrow.parquet.write_table(table, path)
+        return path
@@ -0,0 +1,209 @@
+import csv
+from collections import namedtuple
+
+from src import gcc_validators
+
+__all__ = [
+    'GradeChange',
+    'BulkGrader',
+    'read_grades'
+]
+
+# one csv grade, user_id is a userId or an email address, a grade is None when the csv leaves it empty
+GradeChange = namedtuple('GradeChange', ['course_id', 'course_work_id', 'user_id', 'assigned_grade', 'draft_grade'])
+
+# csv header -> GradeChange field
+_COLUMNS: dict = {
+    'courseId': 'course_id',
+    'course_id': 'course_id',
+    'courseWorkId': 'course_work_id',
+    'course_work_id': 'course_work_id',
+    'userId': 'user_id',
+    'user_id': 'user_id',
+    'student': 'user_id',
+    'email': 'user_id',
+    'assignedGrade': 'assigned_grade',
+    'assigned_grade': 'assigned_grade',
+    'grade': 'assigned_grade',
+    'draftGrade': 'draft_grade',
+    'draft_grade': 'draft_grade'
+}
+
+# columns of a wide csv (see Gradebook.to_csv) that are not course work ids
+_WIDE_LABELS: tuple = ('fullName', 'name')
+
+
+def _grade(value: str) -> float or None:
+    value = (value or '').strip()
+    return float(value) if value else None
+
+
+def read_grades(stream, course_id: str = None):
+    """
+    this func defines the read_grades generator, streams the grades of a csv with a header row, either
+        long: a row per grade, courseId (optional), courseWorkId, userId (or email), assignedGrade, draftGrade
+        wide: a row per student, userId then a column per course work id holding the assigned grade,
+              the layout Gradebook.to_csv writes
+    empty cells set nothing.
+
+    :param stream: text file object of the csv
+    :param course_id: the course of rows without a courseId column 'string'
+    :return: generator of GradeChange
+    """
+    reader = csv.DictReader(stream)
+    fields: dict = {header: _COLUMNS.get(header.strip(), header.strip()) for header in reader.fieldnames or []}
+    names: set = set(fields.values())
+    if 'user_id' not in names:
+        raise ValueError('the grades csv needs a userId (or email / student) column')
+
+    if 'course_work_id' in names:
+        for line, row in enumerate(reader, start=2):
+            values: dict = {fields[header]: value for header, value in row.items() if header in fields}
+            try:
+                change = GradeChange(course_id=values.get('course_id') or course_id,
+                                     course_work_id=values['course_work_id'].strip(),
+                                     user_id=values['user_id'].strip(),
+                                     assigned_grade=_grade(values.get('assigned_grade')),
+                                     draft_grade=_grade(values.get('draft_grade')))
+            except (AttributeError, ValueError):
+                raise ValueError(f'Invalid grades csv line {line}: {row}')
+            if not change.course_id:
+                raise ValueError(f'Invalid grades csv line {line}: no course id')
+            yield change
+        return
+
+    if not course_id:
+        raise ValueError('a wide grades csv needs the course id')
+    course_work_ids: list = [header for header, name in fields.items()
+                             if name not in ('user_id', 'course_id', 'draft_grade') + _WIDE_LABELS]
+    user_header: str = next(header for header, name in fields.items() if name == 'user_id')
+    for line, row in enumerate(reader, start=2):
+        for course_work_id in course_work_ids:
+            try:
+                grade: float or None = _grade(row.get(course_work_id))
+            except ValueError:
+                raise ValueError(f'Invalid grades csv line {line}: {row}')
+            if grade is not None:
+                yield GradeChange(course_id, course_work_id.strip(), row[user_header].strip(), grade, None)
+
+
+def _differs(current, target) -> bool:
+    # the api rounds grades to two decimals
+    return target is not None and (current is None or abs(float(current) - target) >= 0.005)
+
+
+class BulkGrader:
+    """
+    applies a csv of grades to the student submissions of a teacher's courses with as few requests as possible:
+    one submissions listing per course work (fetched concurrently), one roster listing per course only when
+    students are given by email, unchanged grades are skipped, and the changes are sent as batched patches,
+    optionally followed by batched returns of the regraded submissions.
+    usage:
+        grader = BulkGrader(teacher)
+        with open('grades.csv') as file:
+            plan = grader.plan(read_grades(file, course_id='123'))
+        result = grader.apply(plan, return_submissions=True)
+    """
+
+    def __init__(self, teacher, max_workers: int = 8):
+        """
+        :param teacher: the Teacher the grades are set with
+        :param max_workers: number of threads the listings are fetched on 'int'
+        """
+        self.__teacher = teacher
+        self.__max_workers: int = max_workers
+
+    def plan(self, changes) -> dict:
+        """
+        this func defines the plan method, resolves the submissions of the grades and diffs them against
+        the current grades, nothing is changed.
+
+        :param changes: iterable of GradeChange, see read_grades
+        :return: {'patches': {course_id: [grade dicts for Teacher.batch_patch_grades]},
+                  'unchanged': int, 'missing': [GradeChange without a submission]}
+        """
+        # (course_id, course_work_id) -> {user_id: GradeChange}, a later row of the same cell wins
+        grouped: dict = dict()
+        for change in changes:
+            if change.assigned_grade is None and change.draft_grade is None:
+                continue
+            if any(grade is not None and grade < 0 for grade in (change.assigned_grade, change.draft_grade)):
+                raise ValueError(f'Grades must be non-negative: {change}')
+            grouped.setdefault((str(change.course_id), change.course_work_id), dict())[change.user_id] = change
+
+        emails: dict = self.__resolve_emails({course_id for (course_id, _), cells in grouped.items()
+                                              if any(gcc_validators.is_email(user) for user in cells)})
+
+        plan: dict = {'patches': dict(), 'unchanged': 0, 'missing': list()}
+        listings = self.__teacher.map_concurrent(self.__submissions, list(grouped), max_workers=self.__max_workers,
+                                                 ordered=False)
+        for (course_id, course_work_id), submissions in listings:
+            by_user: dict = {submission['userId']: submission for submission in submissions}
+            for user, change in grouped[(course_id, course_work_id)].items():
+                submission: dict or None = by_user.get(emails.get(course_id, {}).get(user.lower(), user))
+                if submission is None:
+                    plan['missing'].append(change)
+                    continue
+                grade: dict = {'courseWorkId': course_work_id, 'id': submission['id']}
+                if _differs(submission.get('assignedGrade'), change.assigned_grade):
+                    grade['assignedGrade'] = change.assigned_grade
+                if _differs(submission.get('draftGrade'), change.draft_grade):
+                    grade['draftGrade'] = change.draft_grade
+                if len(grade) == 2:
+                    plan['unchanged'] += 1
+                else:
+                    plan['patches'].setdefault(course_id, list()).append(grade)
+        return plan
+
+    def apply(self, plan: dict, return_submissions: bool = False) -> dict:
+        """
+        this func defines the apply method, sends the patches of a plan.
+
+        :param plan: the result of plan() 'dict'
+        :param return_submissions: return the submissions whose assigned grade was patched 'bool'
+        :return: {'patched': int, 'returned': int, 'errors': {"courseWorkId/id": error message}}
+        """
+        result: dict = {'patched': 0, 'returned': 0, 'errors': dict()}
+        for course_id, grades in plan['patches'].items():
+            patched = self.__teacher.batch_patch_grades(course_id, grades)
+            if patched is False:
+                result['errors'].update({f"{grade['courseWorkId']}/{grade['id']}": 'batch failed' for grade in grades})
+                continue
+            result['patched'] += len(patched['responses'])
+            result['errors'].update({key: str(error) for key, error in patched['errors'].items()})
+            if not return_submissions:
+                continue
+
+            # course_work_id -> submission ids to return
+            to_return: dict = dict()
+            for grade in grades:
+                if 'assignedGrade' in grade and f"{grade['courseWorkId']}/{grade['id']}" in patched['responses']:
+                    to_return.setdefault(grade['courseWorkId'], list()).append(grade['id'])
+            for course_work_id, submission_ids in to_return.items():
+                returned = self.__teacher.batch_return_student_submissions(course_id, course_work_id, submission_ids)
+                if returned is False:
+                    result['errors'].update({f'{course_work_id}/{submission_id}': 'return failed'
+                                             for submission_id in submission_ids})
+                    continue
+                result['returned'] += len(returned['responses'])
+                result['errors'].update({f'{course_work_id}/{key}': str(error)
+                                         for key, error in returned['errors'].items()})
+        return result
+
+    def __submissions(self, course_id: str, course_work_id: str) -> list[dict]:
+        return list(self.__teacher.iter_student_submissions(course_id, course_work_id,
+                                                            fields='id,userId,assignedGrade,draftGrade'))
+
+    def __roster_emails(self, course_id: str) -> dict:
+        return {student['profile']['emailAddress'].lower(): student['userId']
+                for student in self.__teacher.iter_students(course_id, fields='summary')
+                if student.get('profile', {}).get('emailAddress')}
+
+    def __resolve_emails(self, course_ids: set) -> dict:
+        """
+        :return: {course_id: {lowercase email: userId}} of the courses whose csv rows use emails
+        """
+        if not course_ids:
+            return {}
+        return dict(self.__teacher.map_concurrent(self.__roster_emails, sorted(course_ids),
+                                                  max_workers=self.__max_workers))
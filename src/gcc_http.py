@@ -0,0 +1,148 @@
+import contextvars
+import time
+import weakref
+
+from googleapiclient.http import HttpRequest
+
+from src.gcc_retry import RetryPolicy
+
+__all__ = [
+    'GccHttpRequest',
+    'set_execute_hook',
+    'reset_execute_hook',
+    'execute_hook_active',
+    'execute_hook_defers',
+    'blocking_call',
+    'add_mutation_listener',
+    'notify_mutation',
+    'set_rate_limiter',
+    'get_rate_limiter',
+    'reserve',
+    'throttle',
+    'set_retry_policy',
+    'get_retry_policy'
+]
+
+_EXECUTE_HOOK: contextvars.ContextVar = contextvars.ContextVar('gcc_execute_hook', default=None)
+
+_MUTATION_LISTENERS: weakref.WeakSet = weakref.WeakSet()
+
+# process-wide limiter with reserve(request) -> seconds to wait, see gcc_rate_limit
+_RATE_LIMITER = None
+
+_RETRY_POLICY: RetryPolicy or None = RetryPolicy()
+
+
+def add_mutation_listener(listener):
+    """
+    registers an object whose on_mutation(uri) is called after every successful non-GET request.
+    listeners are held weakly.
+    """
+    _MUTATION_LISTENERS.add(listener)
+
+
+def notify_mutation(uri: str):
+    for listener in list(_MUTATION_LISTENERS):
+        listener.on_mutation(uri)
+
+
+def set_rate_limiter(limiter):
+    """
+    installs the limiter every request sent by this process waits for, None disables limiting.
+    """
+    global _RATE_LIMITER
+    _RATE_LIMITER = limiter
+
+
+def get_rate_limiter():
+    return _RATE_LIMITER
+
+
+def reserve(request) -> float:
+    """
+    :param request: googleapiclient HttpRequest about to be sent
+    :return: seconds to wait before sending it
+    """
+    limiter = _RATE_LIMITER
+    return limiter.reserve(request) if limiter is not None else 0
+
+
+def throttle(request):
+    """
+    blocks until the rate limiter lets request be sent.
+    """
+    wait: float = reserve(request)
+    if wait > 0:
+        time.sleep(wait)
+
+
+def set_retry_policy(policy: RetryPolicy or None):
+    """
+    installs the retry policy of every request sent by this process, None disables retries.
+    """
+    global _RETRY_POLICY
+    _RETRY_POLICY = policy
+
+
+def get_retry_policy() -> RetryPolicy or None:
+    return _RETRY_POLICY
+
+
+def set_execute_hook(hook) -> contextvars.Token:
+    """
+    routes every GccHttpRequest.execute() in the current context to hook(request, http, num_retries).
+
+    :param hook: callable or None
+    :return: token for reset_execute_hook
+    """
+    return _EXECUTE_HOOK.set(hook)
+
+
+def reset_execute_hook(token: contextvars.Token):
+    _EXECUTE_HOOK.reset(token)
+
+
+def execute_hook_active() -> bool:
+    return _EXECUTE_HOOK.get() is not None
+
+
+def execute_hook_defers() -> bool:
+    """
+    True when the hook of the current context answers requests later instead of right away (see gcc_async),
+    paged listings hand their first request to the caller then.
+    """
+    return getattr(_EXECUTE_HOOK.get(), 'defers', False)
+
+
+def blocking_call():
+    """
+    announces a call that does not go through GccHttpRequest.execute(), batch http requests and worker threads,
+    a hook that can not answer it defines blocking() to raise out of the caller.
+    """
+    hook = _EXECUTE_HOOK.get()
+    if hook is not None and hasattr(hook, 'blocking'):
+        hook.blocking()
+
+
+class GccHttpRequest(HttpRequest):
+    """
+    the request class the classroom service is built with (build(requestBuilder=...)).
+    it behaves like HttpRequest unless an execute hook is set for the current context,
+    requests sent by it wait for the rate limiter and are retried by the retry policy,
+    successful mutations are announced to the mutation listeners.
+    """
+
+    def execute(self, http=None, num_retries: int = 0):
+        hook = _EXECUTE_HOOK.get()
+        if hook is not None:
+            response = hook(self, http, num_retries)
+        else:
+            def send():
+                throttle(self)
+                return super(GccHttpRequest, self).execute(http=http, num_retries=num_retries)
+
+            policy: RetryPolicy or None = _RETRY_POLICY
+            response = policy.call(self, send) if policy is not None else send()
+        if self.method != 'GET':
+            notify_mutation(self.uri)
+        return response
@@ -0,0 +1,311 @@
+import itertools
+import json
+import queue
+import threading
+from collections import namedtuple
+
+from googleapiclient.errors import HttpError
+
+from src import gcc_http
+from src.gcc_cache import TtlLruCache
+
+try:
+    from google.cloud import pubsub_v1
+except ImportError:
+    pubsub_v1 = None
+
+__all__ = [
+    'ChangeEvent',
+    'ReceivedMessage',
+    'LocalSubscriber',
+    'PubSubSubscriber',
+    'ChangeFeedConsumer',
+    'parse_message'
+]
+
+# a classroom notification, see https://developers.google.com/classroom/best-practices/push-notifications
+ChangeEvent = namedtuple('ChangeEvent', ['collection', 'event_type', 'resource_id', 'registration_id'])
+
+# a pulled Pub/Sub message, acknowledged by ack_id, deduplicated by message_id
+ReceivedMessage = namedtuple('ReceivedMessage', ['ack_id', 'message_id', 'data', 'attributes'])
+
+# collection -> builds the get request of the changed resource from its resourceId
+_REFETCH: dict = {
+    'courses.courseWork': lambda classroom, resource_id: classroom.courses().courseWork().get(
+        courseId=resource_id['courseId'], id=resource_id['id']),
+    'courses.courseWork.studentSubmissions':
+        lambda classroom, resource_id: classroom.courses().courseWork().studentSubmissions().get(
+            courseId=resource_id['courseId'], courseWorkId=resource_id['courseWorkId'], id=resource_id['id']),
+    'courses.students': lambda classroom, resource_id: classroom.courses().students().get(
+        courseId=resource_id['courseId'], userId=resource_id['userId']),
+    'courses.teachers': lambda classroom, resource_id: classroom.courses().teachers().get(
+        courseId=resource_id['courseId'], userId=resource_id['userId'])
+}
+
+# collection -> the resourceId keys its refetch needs
+_RESOURCE_KEYS: dict = {
+    'courses.courseWork': ('courseId', 'id'),
+    'courses.courseWork.studentSubmissions': ('courseId', 'courseWorkId', 'id'),
+    'courses.students': ('courseId', 'userId'),
+    'courses.teachers': ('courseId', 'userId')
+}
+
+
+def parse_message(data: bytes or str, attributes: dict = None) -> ChangeEvent:
+    """
+    this func defines the parse_message function, decodes the data of a classroom notification.
+
+    :param data: the json message data 'bytes'
+    :param attributes: the message attributes 'dict'
+    :return: ChangeEvent, raises ValueError when the data is not a notification or its resourceId
+    lacks a key the collection's resource is fetched by
+    """
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    payload = json.loads(data)
+    if not isinstance(payload, dict) or not isinstance(payload.get('resourceId', {}), dict):
+        raise ValueError(f'Invalid notification: {data}')
+    event = ChangeEvent(collection=payload.get('collection'),
+                        event_type=payload.get('eventType'),
+                        resource_id=payload.get('resourceId', {}),
+                        registration_id=(attributes or {}).get('registrationId'))
+    missing: list = [key for key in _RESOURCE_KEYS.get(event.collection, ()) if key not in event.resource_id]
+    if missing:
+        raise ValueError(f'Invalid notification of {event.collection}, resourceId lacks {", ".join(missing)}')
+    return event
+
+
+class LocalSubscriber:
+    """
+    in-process stand-in of a Pub/Sub subscription, for tests and local runs.
+    published messages are pulled in order, a nacked message is delivered again.
+    """
+
+    def __init__(self):
+        self.__queue: queue.Queue = queue.Queue()
+        self.__pending: dict = dict()
+        self.__ids = itertools.count(1)
+        self.__lock = threading.Lock()
+
+    @property
+    def pending(self):
+        return len(self.__pending)
+
+    def publish(self, data: dict or bytes, attributes: dict = None, message_id: str = None) -> str:
+        """
+        :param data: the message data, a dict is json encoded 'bytes'
+        :param attributes: the message attributes 'dict'
+        :param message_id: defaults to a new id, pass an earlier one to simulate a redelivery 'string'
+        :return: the message id 'string'
+        """
+        if isinstance(data, dict):
+            data = json.dumps(data).encode('utf-8')
+        message_id = message_id or str(next(self.__ids))
+        self.__queue.put((message_id, data, dict(attributes or {})))
+        return message_id
+
+    def pull(self, max_messages: int = 100, timeout: float = None) -> list[ReceivedMessage]:
+        """
+        :param max_messages: maximum number of returned messages 'int'
+        :param timeout: seconds to wait for the first message, None returns right away 'float'
+        :return: list of ReceivedMessage
+        """
+        messages: list = list()
+        try:
+            messages.append(self.__queue.get(timeout=timeout) if timeout else self.__queue.get_nowait())
+            while len(messages) < max_messages:
+                messages.append(self.__queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        received: list = list()
+        with self.__lock:
+            for message_id, data, attributes in messages:
+                ack_id: str = f'{message_id}-{next(self.__ids)}'
+                self.__pending[ack_id] = (message_id, data, attributes)
+                received.append(ReceivedMessage(ack_id, message_id, data, attributes))
+        return received
+
+    def ack(self, ack_ids: list[str]):
+        with self.__lock:
+            for ack_id in ack_ids:
+                self.__pending.pop(ack_id, None)
+
+    def nack(self, ack_ids: list[str]):
+        with self.__lock:
+            for ack_id in ack_ids:
+                message = self.__pending.pop(ack_id, None)
+                if message is not None:
+                    self.__queue.put(message)
+
+
+class PubSubSubscriber:
+    """
+    a Cloud Pub/Sub pull subscription, requires google-cloud-pubsub.
+    """
+
+    def __init__(self, subscription: str, client=None):
+        """
+        :param subscription: projects/{project}/subscriptions/{subscription} 'string'
+        :param client: pubsub_v1.SubscriberClient, a new one if None
+        """
+        if client is None:
+            if pubsub_v1 is None:
+                raise ImportError('PubSubSubscriber requires google-cloud-pubsub')
+            client = pubsub_v1.SubscriberClient()
+        self.__subscription: str = subscription
+        self.__client = client
+
+    @property
+    def subscription(self):
+        return self.__subscription
+
+    def pull(self, max_messages: int = 100, timeout: float = None) -> list[ReceivedMessage]:
+        response = self.__client.pull(request={'subscription': self.__subscription, 'max_messages': max_messages},
+                                      timeout=timeout)
+        return [ReceivedMessage(received.ack_id, received.message.message_id, received.message.data,
+                                dict(received.message.attributes))
+                for received in response.received_messages]
+
+    def ack(self, ack_ids: list[str]):
+        if ack_ids:
+            self.__client.acknowledge(request={'subscription': self.__subscription, 'ack_ids': list(ack_ids)})
+
+    def nack(self, ack_ids: list[str]):
+        if ack_ids:
+            self.__client.modify_ack_deadline(request={'subscription': self.__subscription,
+                                                       'ack_ids': list(ack_ids), 'ack_deadline_seconds': 0})
+
+
+class ChangeFeedConsumer:
+    """
+    turns the classroom notifications of a subscription into targeted cache updates instead of polling.
+    for every changed resource the cached responses at or below its path are dropped (see
+    ResponseCache.invalidate) and, unless it was deleted, the resource is fetched again through the
+    client's response cache and handed to handler(event, resource), resource is None when it is gone.
+    the events of one pull are coalesced, a resource changed several times is fetched once, and
+    redelivered messages are skipped. when the refetch or the handler of a resource raises, only the
+    messages of that resource are nacked for redelivery (a subscription with a dead-letter policy moves
+    them aside after its maximum delivery attempts) and the failure is counted in stats.
+    usage:
+        consumer = ChangeFeedConsumer(teacher, PubSubSubscriber('projects/p/subscriptions/classroom'), handler)
+        consumer.run(stop_event)
+    """
+
+    def __init__(self, client, subscriber, handler=None, refetch: bool = True, max_workers: int = 1,
+                 dedupe_ttl: float = 600):
+        """
+        :param client: Admin / Teacher / Student the resources are fetched with
+        :param subscriber: LocalSubscriber / PubSubSubscriber, or any object with pull, ack and nack
+        :param handler: callable(ChangeEvent, resource dict | None), called once per changed resource
+        :param refetch: fetch the changed resources again, False only invalidates 'bool'
+        :param max_workers: number of threads the resources of a pull are fetched on 'int'
+        :param dedupe_ttl: seconds a handled message id is remembered 'float'
+        """
+        self.__client = client
+        self.__subscriber = subscriber
+        self.__handler = handler
+        self.__refetch: bool = refetch
+        self.__max_workers: int = max_workers
+        self.__seen: TtlLruCache = TtlLruCache(maxsize=10000, ttl=dedupe_ttl)
+        self.__stats: dict = {'messages': 0, 'duplicates': 0, 'invalid': 0, 'refetches': 0, 'failures': 0}
+
+    @property
+    def stats(self):
+        return dict(self.__stats)
+
+    def poll(self, max_messages: int = 100, timeout: float = None) -> list[tuple]:
+        """
+        this func defines the poll method, pulls and handles one batch of notifications.
+        the messages of a resource are acknowledged once it is handled, and nacked for redelivery
+        when handling it raised, invalid and duplicate messages are acknowledged.
+
+        :param max_messages: maximum number of messages pulled 'int'
+        :param timeout: seconds to wait for a message 'float'
+        :return: list of (ChangeEvent, resource dict | None) that were handled
+        """
+        messages: list = self.__subscriber.pull(max_messages=max_messages, timeout=timeout)
+        if not messages:
+            return []
+
+        # resource key -> latest event of the resource, and the messages coalesced into it
+        events: dict = dict()
+        grouped: dict = dict()
+        done: list = list()
+        for message in messages:
+            self.__stats['messages'] += 1
+            if message.message_id in self.__seen:
+                self.__stats['duplicates'] += 1
+                done.append(message)
+                continue
+            try:
+                event: ChangeEvent = parse_message(message.data, message.attributes)
+            except ValueError:
+                event = None
+            if event is None or event.collection not in _REFETCH:
+                self.__stats['invalid'] += 1
+                done.append(message)
+                continue
+            key: tuple = (event.collection, tuple(sorted(event.resource_id.items())))
+            events.pop(key, None)
+            events[key] = event
+            grouped.setdefault(key, list()).append(message)
+
+        if self.__max_workers > 1 and len(events) > 1:
+            results: list = [result for _, result in self.__client.map_concurrent(
+                self.__try_apply, list(events.values()), max_workers=self.__max_workers)]
+        else:
+            results: list = [self.__try_apply(event) for event in events.values()]
+
+        handled: list = list()
+        failed: list = list()
+        for key, (event, resource, failure) in zip(events, results):
+            if failure is not None:
+                self.__stats['failures'] += 1
+                failed.extend(grouped[key])
+                continue
+            if self.__refetch and event.event_type != 'DELETED':
+                self.__stats['refetches'] += 1
+            handled.append((event, resource))
+            done.extend(grouped[key])
+
+        for message in done:
+            self.__seen.set(message.message_id, True)
+        self.__subscriber.ack([message.ack_id for message in done])
+        if failed:
+            self.__subscriber.nack([message.ack_id for message in failed])
+        return handled
+
+    def __try_apply(self, event: ChangeEvent) -> tuple:
+        try:
+            return self.__apply(event) + (None,)
+        except Exception as error:
+            return event, None, error
+
+    def __apply(self, event: ChangeEvent) -> tuple:
+        request = _REFETCH[event.collection](self.__client.classroom, event.resource_id)
+        # drops the cached responses of the resource (and below it) from every response cache
+        gcc_http.notify_mutation(request.uri)
+
+        resource = None
+        if self.__refetch and event.event_type != 'DELETED':
+            try:
+                resource = self.__client._execute_cached(request)
+            except HttpError as error:
+                if error.resp.status != 404:
+                    raise
+        if self.__handler is not None:
+            self.__handler(event, resource)
+        return event, resource
+
+    def run(self, stop: threading.Event = None, max_messages: int = 100, timeout: float = 10):
+        """
+        this func defines the run method, handles notifications until stop is set.
+
+        :param stop: threading.Event ending the loop, runs forever if None
+        :param max_messages: maximum number of messages per pull 'int'
+        :param timeout: seconds a pull waits for messages 'float'
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll(max_messages=max_messages, timeout=timeout)
@@ -0,0 +1,78 @@
+import queue
+import threading
+from collections import namedtuple
+
+__all__ = [
+    'iter_pages',
+    'PageRequest'
+]
+
+# the first request of a paged listing, handed to callers that drive the paging themselves (see gcc_async)
+PageRequest = namedtuple('PageRequest', ['request', 'collection', 'items_key'])
+
+_END = object()
+
+
+class _PageError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def iter_pages(request, collection, items_key: str, execute=None, prefetch: int = 1):
+    """
+    this func defines the iter_pages generator, yields every item of a paged list request lazily,
+    following nextPageToken until the last page.
+    the next page is fetched on a background thread while the current page is consumed,
+    no more than prefetch pages are held in memory at a time.
+
+    :param request: the first list request (googleapiclient HttpRequest)
+    :param collection: the resource collection the request was made from, used for list_next()
+    :param items_key: the response key holding the page items, e.g. 'courseWork'
+    :param execute: callable executing a request and returning the response dict, defaults to request.execute()
+    :param prefetch: number of pages fetched ahead of the consumer 'int'
+    :return: generator of items
+    """
+    if execute is None:
+        def execute(req):
+            return req.execute()
+
+    if prefetch < 1:
+        prefetch = 1
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        next_request = request
+        try:
+            while next_request is not None and not stop.is_set():
+                response: dict = execute(next_request)
+                if not put(response.get(items_key, [])):
+                    return
+                next_request = collection.list_next(next_request, response)
+        except BaseException as error:
+            put(_PageError(error))
+            return
+        put(_END)
+
+    producer = threading.Thread(target=produce, name=f'gcc-prefetch-{items_key}', daemon=True)
+    producer.start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _END:
+                return
+            if isinstance(page, _PageError):
+                raise page.error
+            yield from page
+    finally:
+        stop.set()
@@ -0,0 +1,128 @@
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src import gcc_validators
+from src.gcc_base import GccBase
+from src.gcc_credentials import get_credential_manager
+
+__all__ = [
+    'GccPool'
+]
+
+
+class GccPool:
+    """
+    runs work for many accounts of one role in parallel, e.g. a district admin going over every teacher.
+    every account gets its own client and credentials, from its token file
+    data_endpoint/{role}_{account}_token.json or impersonated with a service account key.
+    at most per_account calls of an account run at a time so no account's per-user quota is exhausted
+    by the pool, the work is interleaved across accounts so the workers are not stuck behind one account.
+
+    usage:
+        pool = GccPool(Teacher, teacher_emails, service_account_file='sa.json')
+        for account, course_id, course_work in pool.map('list_course_work', work):
+            ...
+    """
+
+    def __init__(self, client_class, accounts, max_workers: int = 16, per_account: int = 2,
+                 service_account_file: str = None, **client_kwargs):
+        """
+        :param client_class: Admin / Teacher / Student
+        :param accounts: iterable of emails or work_space accounts
+        :param max_workers: number of worker threads 'int'
+        :param per_account: maximum number of concurrent calls per account 'int'
+        :param service_account_file: service account key with domain-wide delegation, impersonates the accounts
+        :param client_kwargs: passed to every client_class(...), e.g. ref_cache_month
+        """
+        if service_account_file:
+            get_credential_manager().use_service_account(service_account_file)
+
+        self.__client_class = client_class
+        self.__accounts: list = list(dict.fromkeys(accounts))
+        self.__max_workers: int = max_workers
+        self.__per_account: int = max(1, per_account)
+        self.__client_kwargs: dict = client_kwargs
+        self.__clients: dict = dict()
+        self.__locks: dict = dict()
+        self.__lock = threading.Lock()
+
+    @property
+    def accounts(self):
+        return list(self.__accounts)
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+    @property
+    def per_account(self):
+        return self.__per_account
+
+    def client(self, account: str) -> GccBase:
+        """
+        this func defines the client method, returns the client of an account, constructing it on first use.
+
+        :param account: email or work_space 'string'
+        :return: Admin / Teacher / Student
+        """
+        with self.__lock:
+            client: GccBase = self.__clients.get(account)
+            if client is None:
+                if gcc_validators.is_email(account):
+                    client = self.__client_class(email=account, **self.__client_kwargs)
+                else:
+                    client = self.__client_class(work_space=account, **self.__client_kwargs)
+                self.__clients[account] = client
+                self.__locks[account] = threading.BoundedSemaphore(self.__per_account)
+                if account not in self.__accounts:
+                    self.__accounts.append(account)
+            return client
+
+    @staticmethod
+    def _interleave(work) -> list[tuple]:
+        by_account: dict = dict()
+        for account, item in work:
+            by_account.setdefault(account, list()).append((account, item))
+        return [task for tasks in itertools.zip_longest(*by_account.values()) for task in tasks if task is not None]
+
+    def map(self, func, work, ordered: bool = False):
+        """
+        this func defines the map method, runs func for every (account, item) of work on the account's client.
+
+        :param func: name of a client method 'string', or callable called as func(client, *args)
+        :param work: iterable of (account, item), a tuple item is passed as *args, a dict as **kwargs
+        :param ordered: yield results in submission order if True, as they complete if False 'bool'
+        :return: generator of (account, item, result) tuples
+        """
+        def call(account: str, item):
+            client: GccBase = self.client(account)
+            method = getattr(client, func) if isinstance(func, str) else (lambda *a, **kw: func(client, *a, **kw))
+            with self.__locks[account]:
+                client._ensure_worker()
+                if isinstance(item, tuple):
+                    return method(*item)
+                if isinstance(item, dict):
+                    return method(**item)
+                return method(item)
+
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='gcc-pool')
+        try:
+            futures: dict = {executor.submit(call, account, item): (account, item)
+                             for account, item in self._interleave(work)}
+            for future in (futures if ordered else as_completed(futures)):
+                account, item = futures[future]
+                yield account, item, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, func, accounts=None) -> dict:
+        """
+        this func defines the run method, runs func once per account.
+
+        :param func: name of a client method 'string', or callable called as func(client)
+        :param accounts: the accounts to run on, defaults to every account of the pool
+        :return: dict of account -> result
+        """
+        accounts = self.__accounts if accounts is None else accounts
+        return {account: result for account, _, result in self.map(func, [(account, ()) for account in accounts])}
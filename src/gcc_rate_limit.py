@@ -0,0 +1,143 @@
+import threading
+import time
+import weakref
+
+__all__ = [
+    'TokenBucket',
+    'RateLimiter',
+    'WRITE_SHARE'
+]
+
+
+class TokenBucket:
+    """
+    token bucket refilled at rate tokens per second up to capacity.
+    reserve() takes the tokens right away, possibly into debt, and returns how long the caller has to wait,
+    so waiting can be done with time.sleep or asyncio.sleep alike.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        :param rate: tokens added per second 'float'
+        :param capacity: maximum number of tokens, the allowed burst 'float'
+        """
+        self.__rate: float = rate
+        self.__capacity: float = capacity
+        self.__tokens: float = capacity
+        self.__updated: float = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self.__rate
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        :param tokens: number of tokens taken 'float'
+        :return: seconds to wait before the tokens may be used
+        """
+        with self.__lock:
+            now: float = time.monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            self.__tokens -= tokens
+            return 0 if self.__tokens >= 0 else -self.__tokens / self.__rate
+
+
+def _bucket(per_period, period: float) -> TokenBucket or None:
+    if not per_period:
+        return None
+    per_period = float(per_period)
+    return TokenBucket(per_period / period, per_period)
+
+
+# share of a per minute read limit granted to writes when the ini does not set the write limit
+WRITE_SHARE: float = 0.5
+
+
+def _write_limit(limits: dict, write_key: str, read_key: str) -> float or None:
+    if limits.get(write_key):
+        return limits[write_key]
+    if limits.get(read_key):
+        return float(limits[read_key]) * WRITE_SHARE
+    return None
+
+
+class RateLimiter:
+    """
+    client-side limiter of the classroom api quotas, every request takes a token from
+    the project buckets (per minute, per day) and from its user's per minute bucket,
+    writes (any method but GET) also from the write buckets when those limits are set.
+    users are told apart by the credentials object their request is authorized with.
+    """
+
+    def __init__(self, per_minute_project: float = None, per_minute_user: float = None,
+                 per_day_project: float = None, per_minute_project_write: float = None,
+                 per_minute_user_write: float = None):
+        """
+        :param per_minute_project: requests per minute of the whole project 'float'
+        :param per_minute_user: requests per minute of one user 'float'
+        :param per_day_project: requests per day of the whole project 'float'
+        :param per_minute_project_write: write requests per minute of the whole project 'float'
+        :param per_minute_user_write: write requests per minute of one user 'float'
+        """
+        self.__project: list = [bucket for bucket in (_bucket(per_minute_project, 60),
+                                                      _bucket(per_day_project, 24 * 60 * 60)) if bucket]
+        self.__project_write: TokenBucket or None = _bucket(per_minute_project_write, 60)
+        self.__per_minute_user: float = per_minute_user
+        self.__per_minute_user_write: float = per_minute_user_write
+        self.__users = weakref.WeakKeyDictionary()
+        self.__anonymous: tuple = self.__user_buckets()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_limits(cls, limits: dict):
+        """
+        this func defines the from_limits method, builds a limiter from the usage_limits ini section.
+        read keys: req_per_minute_client, req_per_minute_user, req_per_day,
+        req_per_minute_client_write, req_per_minute_user_write,
+        a missing write limit is WRITE_SHARE of the matching per minute limit.
+
+        :param limits: the usage_limits section as a dict 'dict'
+        :return: RateLimiter
+        """
+        return cls(per_minute_project=limits.get('req_per_minute_client'),
+                   per_minute_user=limits.get('req_per_minute_user'),
+                   per_day_project=limits.get('req_per_day'),
+                   per_minute_project_write=_write_limit(limits, 'req_per_minute_client_write',
+                                                         'req_per_minute_client'),
+                   per_minute_user_write=_write_limit(limits, 'req_per_minute_user_write', 'req_per_minute_user'))
+
+    def __user_buckets(self) -> tuple:
+        return _bucket(self.__per_minute_user, 60), _bucket(self.__per_minute_user_write, 60)
+
+    def __buckets_of(self, credentials) -> tuple:
+        if credentials is None:
+            return self.__anonymous
+        with self.__lock:
+            buckets: tuple = self.__users.get(credentials)
+            if buckets is None:
+                buckets = self.__user_buckets()
+                self.__users[credentials] = buckets
+            return buckets
+
+    def reserve(self, request) -> float:
+        """
+        this func defines the reserve method, takes the tokens of a request.
+
+        :param request: googleapiclient HttpRequest
+        :return: seconds to wait before sending the request
+        """
+        write: bool = request.method != 'GET'
+        user, user_write = self.__buckets_of(getattr(request.http, 'credentials', None))
+
+        buckets: list = list(self.__project)
+        if user:
+            buckets.append(user)
+        if write:
+            buckets.extend(bucket for bucket in (self.__project_write, user_write) if bucket)
+        return max((bucket.reserve() for bucket in buckets), default=0)
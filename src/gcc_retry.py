@@ -0,0 +1,164 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+
+from googleapiclient.errors import HttpError
+
+__all__ = [
+    'RetryBudget',
+    'RetryPolicy'
+]
+
+_logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES: tuple = (429, 500, 502, 503, 504)
+# a POST is not idempotent, it is only retried when the server says it was not processed
+NON_IDEMPOTENT_STATUSES: tuple = (429,)
+IDEMPOTENT_METHODS: tuple = ('GET', 'HEAD', 'PUT', 'PATCH', 'DELETE')
+TRANSIENT_ERRORS: tuple = (ConnectionError, TimeoutError)
+
+
+class RetryBudget:
+    """
+    limits retries to a share of the traffic so an outage is not multiplied by the retries.
+    every retry withdraws a token, every first attempt deposits token_ratio tokens, up to max_tokens.
+    """
+
+    def __init__(self, max_tokens: float = 100, token_ratio: float = 0.1):
+        """
+        :param max_tokens: the budget, and the number of retries allowed in a burst 'float'
+        :param token_ratio: tokens earned per request, 0.1 allows about one retry per ten requests 'float'
+        """
+        self.__max_tokens: float = max_tokens
+        self.__token_ratio: float = token_ratio
+        self.__tokens: float = max_tokens
+        self.__lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self.__tokens
+
+    def deposit(self):
+        with self.__lock:
+            self.__tokens = min(self.__max_tokens, self.__tokens + self.__token_ratio)
+
+    def withdraw(self) -> bool:
+        with self.__lock:
+            if self.__tokens < 1:
+                return False
+            self.__tokens -= 1
+            return True
+
+
+def _retry_after(error: HttpError) -> float or None:
+    value = error.resp.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    retries transient failures with jittered exponential backoff:
+    429 and 5xx responses and connection errors / timeouts, a POST only on 429.
+    a Retry-After header overrides the backoff, retries are bounded by max_attempts and by the shared budget.
+    methods overrides the policy per api method id (request.methodId), None disables retries for it, e.g.
+        RetryPolicy(methods={'classroom.courses.create': None,
+                             'classroom.courses.courseWork.studentSubmissions.patch': RetryPolicy(max_attempts=8)})
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 32,
+                 statuses: tuple = RETRYABLE_STATUSES, budget: RetryBudget = None, methods: dict = None):
+        """
+        :param max_attempts: attempts per request including the first one 'int'
+        :param base_delay: backoff of the first retry in seconds, doubled on every retry 'float'
+        :param max_delay: cap of the backoff in seconds 'float'
+        :param statuses: the http statuses that are retried 'tuple'
+        :param budget: RetryBudget, defaults to a new one, pass one budget to several policies to share it
+        :param methods: per method id overrides, RetryPolicy or None 'dict'
+        """
+        self.__max_attempts: int = max(1, max_attempts)
+        self.__base_delay: float = base_delay
+        self.__max_delay: float = max_delay
+        self.__statuses: tuple = tuple(statuses)
+        self.__budget: RetryBudget = budget or RetryBudget()
+        self.__methods: dict = dict(methods or {})
+
+    @property
+    def max_attempts(self):
+        return self.__max_attempts
+
+    @property
+    def budget(self):
+        return self.__budget
+
+    def for_method(self, method_id: str):
+        """
+        :param method_id: api method id, e.g. classroom.courses.get 'string'
+        :return: the RetryPolicy of the method, None when it is not retried
+        """
+        return self.__methods.get(method_id, self)
+
+    def delay(self, request, error: BaseException, attempt: int) -> float or None:
+        """
+        this func defines the delay method, decides whether a failed attempt is retried.
+
+        :param request: googleapiclient HttpRequest that failed
+        :param error: the raised exception
+        :param attempt: number of attempts made so far 'int'
+        :return: seconds to wait before the next attempt, None to give up
+        """
+        if attempt >= self.__max_attempts:
+            return None
+
+        idempotent: bool = request.method in IDEMPOTENT_METHODS
+        retry_after: float or None = None
+        if isinstance(error, HttpError):
+            status: int = error.resp.status
+            if status not in self.__statuses or (not idempotent and status not in NON_IDEMPOTENT_STATUSES):
+                return None
+            retry_after = _retry_after(error)
+        elif not (idempotent and isinstance(error, TRANSIENT_ERRORS)):
+            return None
+
+        if not self.__budget.withdraw():
+            return None
+
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.__max_delay, self.__base_delay * 2 ** (attempt - 1)))
+
+    def call(self, request, send):
+        """
+        this func defines the call method, runs send() with retries.
+
+        :param request: googleapiclient HttpRequest sent by send
+        :param send: callable sending the request and returning its response
+        :return: the response of the first successful attempt, raises the last error
+        """
+        policy = self.for_method(getattr(request, 'methodId', None))
+        if policy is None:
+            return send()
+
+        policy.budget.deposit()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                return send()
+            except (HttpError, *TRANSIENT_ERRORS) as error:
+                wait: float or None = policy.delay(request, error, attempt)
+                if wait is None:
+                    raise
+                _logger.warning('retrying %s %s in %.2fs (attempt %d): %s',
+                                request.method, request.uri, wait, attempt, error)
+                time.sleep(wait)
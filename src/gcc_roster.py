@@ -0,0 +1,214 @@
+import csv
+import json
+
+from src import gcc_exceptions, gcc_validators
+
+__all__ = [
+    'ROSTER_ROLES',
+    'RosterSync',
+    'read_roster'
+]
+
+# role -> (listing method, batch add method, batch delete method) of the client
+ROSTER_ROLES: dict = {
+    'students': ('iter_students', 'batch_add_students', 'batch_delete_students'),
+    'teachers': ('iter_teachers', 'batch_add_teachers', 'batch_delete_teachers')
+}
+
+# csv header -> field
+_COLUMNS: dict = {
+    'courseId': 'course_id',
+    'course_id': 'course_id',
+    'userId': 'user_id',
+    'user_id': 'user_id',
+    'email': 'user_id',
+    'user': 'user_id',
+    'role': 'role'
+}
+
+_ROLES: dict = {
+    'student': 'students',
+    'students': 'students',
+    'teacher': 'teachers',
+    'teachers': 'teachers'
+}
+
+
+def _member(user_id: str) -> str:
+    user_id = str(user_id).strip()
+    return user_id.lower() if gcc_validators.is_email(user_id) else user_id
+
+
+def read_roster(stream, course_id: str = None) -> dict:
+    """
+    this func defines the read_roster function, reads a desired roster, either
+        json: {"course id": {"students": [userId or email, ...], "teachers": [...]}, ...}
+        csv with a header row: courseId (optional), userId (or email), role (student / teacher, default student)
+    only the roles a course lists are synced, a course with "students": [] has every student removed.
+
+    :param stream: text file object of the roster
+    :param course_id: the course of csv rows without a courseId column 'string'
+    :return: {course_id: {role: set of userIds / lowercase emails}}
+    """
+    text: str = stream.read()
+    roster: dict = dict()
+    if text.lstrip().startswith('{'):
+        for course, roles in json.loads(text).items():
+            for role, members in roles.items():
+                if role not in _ROLES:
+                    raise ValueError(f'Invalid roster role: {role}')
+                roster.setdefault(str(course), dict())[_ROLES[role]] = {_member(member) for member in members}
+        return roster
+
+    reader = csv.DictReader(text.splitlines())
+    fields: dict = {header: _COLUMNS.get(header.strip(), header.strip()) for header in reader.fieldnames or []}
+    if 'user_id' not in fields.values():
+        raise ValueError('the roster csv needs a userId (or email) column')
+    for line, row in enumerate(reader, start=2):
+        values: dict = {fields[header]: (value or '').strip() for header, value in row.items() if header in fields}
+        course: str = values.get('course_id') or course_id
+        role: str = _ROLES.get((values.get('role') or 'student').lower())
+        if not course or not role or not values.get('user_id'):
+            raise ValueError(f'Invalid roster csv line {line}: {row}')
+        roster.setdefault(str(course), dict()).setdefault(role, set()).add(_member(values['user_id']))
+    return roster
+
+
+class RosterSync:
+    """
+    makes the rosters of courses match a desired roster (see read_roster) with as few requests as possible:
+    the current rosters are listed concurrently, diffed as sets and the adds / removes are sent as
+    batch requests, which wait for the rate limiter like every other request.
+    members are matched by userId, or by email when the listing returns profile emails, desired emails
+    the listing can not match are resolved to userIds with one batch of userProfiles.get, the plan fails
+    rather than guessing when that lookup fails.
+    students are synced with a Teacher, teachers with an Admin. teachers can only be added by email, the
+    same batch maps the userIds of teachers to add to their profile emails, the plan fails when one has none.
+    usage:
+        sync = RosterSync(teacher)
+        with open('roster.json') as file:
+            plan = sync.plan(read_roster(file))
+        result = sync.apply(plan)
+    """
+
+    def __init__(self, client, max_workers: int = 8):
+        """
+        :param client: Teacher for students, Admin for teachers
+        :param max_workers: number of threads the rosters are listed on 'int'
+        """
+        self.__client = client
+        self.__max_workers: int = max_workers
+
+    def __method(self, role: str, index: int):
+        name: str = ROSTER_ROLES[role][index]
+        if not hasattr(self.__client, name):
+            raise ValueError(f'{type(self.__client).__name__} can not sync {role}, it has no {name}')
+        return getattr(self.__client, name)
+
+    def plan(self, roster: dict) -> dict:
+        """
+        this func defines the plan method, diffs the desired roster against the current one, nothing is changed.
+
+        :param roster: {course_id: {role: set of userIds / emails}}, see read_roster 'dict'
+        :return: {course_id: {role: {'add': [userIds / emails], 'remove': [userIds]}}}
+        """
+        work: list = [(course_id, role) for course_id, roles in roster.items() for role in roles]
+        for _, role in work:
+            for index in range(len(ROSTER_ROLES[role])):
+                self.__method(role, index)
+
+        current: dict = dict(self.__client.map_concurrent(self.__members, work, max_workers=self.__max_workers))
+        # desired members the listing can not match: emails need their userId, teachers to add need an email
+        unmatched: set = {member for (course_id, role), members in current.items()
+                          for member in roster[course_id][role]
+                          if member not in members and (role == 'teachers' or gcc_validators.is_email(member))}
+        profiles: dict = self.__resolve(unmatched)
+
+        plan: dict = dict()
+        for (course_id, role), members in current.items():
+            desired: dict = {profiles[member]['id'] if member in profiles and gcc_validators.is_email(member)
+                             else member: member for member in roster[course_id][role]}
+            kept: set = {members[key] for key in desired if key in members}
+            adds: list = sorted(member for key, member in desired.items() if key not in members)
+            if role == 'teachers':
+                adds = sorted({self.__email(member, profiles) for member in adds})
+            plan.setdefault(course_id, dict())[role] = {
+                'add': adds,
+                'remove': sorted(set(members.values()) - kept)
+            }
+        return plan
+
+    @staticmethod
+    def __email(member: str, profiles: dict) -> str:
+        if gcc_validators.is_email(member):
+            return member
+        email: str or None = profiles.get(member, {}).get('emailAddress')
+        if not email:
+            raise ValueError(f'teacher {member} can only be added by email and has no visible profile email')
+        return email.lower()
+
+    def apply(self, plan: dict) -> dict:
+        """
+        this func defines the apply method, sends the adds and removes of a plan, removes first.
+        the adds of a course are checked before anything of it is sent, a course that fails is recorded
+        in the errors and the other courses are still synced.
+
+        :param plan: the result of plan() 'dict'
+        :return: {'added': int, 'removed': int, 'errors': {"course_id/role/user": error message}}
+        """
+        result: dict = {'added': 0, 'removed': 0, 'errors': dict()}
+        for course_id, roles in plan.items():
+            invalid: list = [member for member in roles.get('teachers', {}).get('add', [])
+                             if not gcc_validators.is_email(member)]
+            if invalid:
+                result['errors'].update({f'{course_id}/teachers/{user}': 'teachers can only be added by email'
+                                         for user in invalid})
+                continue
+            try:
+                self.__apply_course(course_id, roles, result)
+            except (gcc_exceptions.GccErrors, ValueError) as error:
+                result['errors'][f'{course_id}'] = f'{type(error).__name__}: {error}'
+        return result
+
+    def __apply_course(self, course_id: str, roles: dict, result: dict):
+        for role, changes in roles.items():
+            for action, index, count in (('remove', 2, 'removed'), ('add', 1, 'added')):
+                if not changes[action]:
+                    continue
+                response = self.__method(role, index)(course_id, list(changes[action]))
+                if response is False:
+                    result['errors'].update({f'{course_id}/{role}/{user}': f'{action} failed'
+                                             for user in changes[action]})
+                    continue
+                result[count] += len(response['responses'])
+                result['errors'].update({f'{course_id}/{role}/{user}': str(error)
+                                         for user, error in response['errors'].items()})
+
+    def __members(self, course_id: str, role: str) -> dict:
+        """
+        :return: {userId and lowercase profile email: userId} of the current members
+        """
+        members: dict = dict()
+        for member in self.__method(role, 0)(course_id, fields='userId,profile(emailAddress)'):
+            members[member['userId']] = member['userId']
+            email: str or None = member.get('profile', {}).get('emailAddress')
+            if email:
+                members[email.lower()] = member['userId']
+        return members
+
+    def __resolve(self, members: set) -> dict:
+        """
+        :return: {member: profile with id and emailAddress} of the userIds / emails that have a profile
+        """
+        if not members:
+            return {}
+        batch = self.__client.batch()
+        for member in sorted(members):
+            batch.add(self.__client.classroom.userProfiles().get(userId=member, fields='id,emailAddress'),
+                      request_id=member)
+        results: dict = self.__client._execute_batch(batch)
+        for error in results['errors'].values():
+            # an email that could not be looked up would have its member removed and added again
+            if error.resp.status != 404:
+                raise error
+        return results['responses']
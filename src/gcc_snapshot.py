@@ -0,0 +1,287 @@
+import json
+import logging
+import os
+import os.path
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from googleapiclient.errors import HttpError
+
+from src.gcc_fields import field_mask
+
+try:
+    import pyarrow.json
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+__all__ = [
+    'SNAPSHOT_RESOURCES',
+    'Snapshot',
+    'parquet_available'
+]
+
+_logger = logging.getLogger(__name__)
+
+# resource -> (collection of a course's classroom service, items key of the list response)
+SNAPSHOT_RESOURCES: dict = {
+    'teachers': (lambda classroom: classroom.courses().teachers(), 'teachers'),
+    'students': (lambda classroom: classroom.courses().students(), 'students'),
+    'topics': (lambda classroom: classroom.courses().topics(), 'topic'),
+    'announcements': (lambda classroom: classroom.courses().announcements(), 'announcements'),
+    'courseWork': (lambda classroom: classroom.courses().courseWork(), 'courseWork'),
+    'courseWorkMaterials': (lambda classroom: classroom.courses().courseWorkMaterials(), 'courseWorkMaterial'),
+    # courseWorkId '-' lists the submissions of every course work of the course
+    'studentSubmissions': (lambda classroom: classroom.courses().courseWork().studentSubmissions(),
+                           'studentSubmissions')
+}
+
+DEFAULT_RESOURCES: tuple = ('teachers', 'students', 'topics', 'courseWork')
+
+CHECKPOINT_FILE: str = 'checkpoint.jsonl'
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+class Snapshot:
+    """
+    crawls every course the client can list and the sub-collections of every course into directory,
+    one {resource}.jsonl file per resource type (courses.jsonl, students.jsonl, ...), one item per line.
+    the courses are listed on the calling thread while the sub-collections of the listed courses are
+    crawled concurrently, every worker thread with its own classroom service (see GccBase.map_concurrent).
+
+    every page is appended to checkpoint.jsonl together with its next page token and the size of the
+    file it was written to, an interrupted snapshot resumes from the last written page of every listing,
+    the files are truncated back to their checkpointed size so no item is written twice.
+    usage:
+        summary = Snapshot(admin, 'snapshots/2024-01-01', max_workers=16).run()
+    """
+
+    def __init__(self, client, directory: str, resources: tuple = DEFAULT_RESOURCES, max_workers: int = 8,
+                 page_size: int = None, fields: dict = None, course_params: dict = None):
+        """
+        :param client: Admin / Teacher / Student the snapshot is crawled with
+        :param directory: output directory, created if missing 'string'
+        :param resources: sub-collections crawled per course, keys of SNAPSHOT_RESOURCES 'tuple'
+        :param max_workers: number of worker threads 'int'
+        :param page_size: page size of every listing, None for the server default 'int'
+        :param fields: resource ('courses' or a resources key) -> preset name or field mask 'dict'
+        :param course_params: extra courses.list query parameters, e.g. {'teacherId': 'me'} 'dict'
+        """
+        unknown: set = set(resources) - set(SNAPSHOT_RESOURCES)
+        if unknown:
+            raise ValueError(f"Invalid snapshot resources: {', '.join(sorted(unknown))}")
+
+        self.__client = client
+        self.__directory: str = directory
+        self.__resources: tuple = tuple(resources)
+        self.__max_workers: int = max_workers
+        self.__page_size: int = page_size
+        self.__fields: dict = dict(fields or {})
+        self.__course_params: dict = dict(course_params or {})
+        self.__lock = threading.Lock()
+        self.__files: dict = dict()
+        self.__checkpoint = None
+        # listing key -> next page token, None when the listing is done
+        self.__state: dict = dict()
+        self.__counts: dict = dict()
+        self.__failed: list = list()
+
+    @property
+    def directory(self):
+        return self.__directory
+
+    @property
+    def resources(self):
+        return self.__resources
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.__directory, CHECKPOINT_FILE)
+
+    def path(self, resource: str, extension: str = 'jsonl') -> str:
+        """
+        :param resource: 'courses' or a resources key 'string'
+        :param extension: jsonl / parquet 'string'
+        :return: the path of the resource file 'string'
+        """
+        return os.path.join(self.__directory, f'{resource}.{extension}')
+
+    def run(self, parquet: bool = False) -> dict:
+        """
+        this func defines the run method, crawls the snapshot, resuming the previous run of the directory.
+        a listing that failed (e.g. 403 on one course) is logged and reported, running again retries it.
+
+        :param parquet: also write a {resource}.parquet file per resource, requires pyarrow 'bool'
+        :return: {'counts': {resource: items written by this run}, 'failed': [listing keys], 'done': bool}
+        """
+        if parquet and pyarrow is None:
+            raise ImportError('writing parquet files requires pyarrow')
+
+        os.makedirs(self.__directory, exist_ok=True)
+        self.__load_checkpoint()
+        self.__checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8')
+        try:
+            self.__crawl()
+        finally:
+            for file in self.__files.values():
+                file.close()
+            self.__files.clear()
+            self.__checkpoint.close()
+            self.__checkpoint = None
+
+        done: bool = not self.__failed and all(token is None for token in self.__state.values())
+        if parquet and done:
+            for resource in ('courses',) + self.__resources:
+                self.to_parquet(resource)
+        return {'counts': dict(self.__counts), 'failed': list(self.__failed), 'done': done}
+
+    def to_parquet(self, resource: str) -> str:
+        """
+        this func defines the to_parquet method, converts a resource file of the snapshot to parquet.
+
+        :param resource: 'courses' or a resources key 'string'
+        :return: the parquet path 'string'
+        """
+        if pyarrow is None:
+            raise ImportError('writing parquet files requires pyarrow')
+        path: str = self.path(resource, 'parquet')
+        if os.path.exists(self.path(resource)) and os.path.getsize(self.path(resource)):
+            pyarrow.parquet.write_table(pyarrow.json.read_json(self.path(resource)), path)
+        return path
+
+    def __load_checkpoint(self):
+        """
+        replays checkpoint.jsonl and truncates every resource file to the size of its last checkpointed page.
+        """
+        self.__state.clear()
+        self.__counts.clear()
+        self.__failed.clear()
+        sizes: dict = dict()
+        if os.path.exists(self.checkpoint_path):
+            valid: int = 0
+            with open(self.checkpoint_path, 'rb') as checkpoint:
+                for line in checkpoint:
+                    # a line cut short by the interruption, its page is written again
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        entry: dict = json.loads(line)
+                    except ValueError:
+                        break
+                    self.__state[entry['key']] = entry['next']
+                    sizes[entry['resource']] = entry['size']
+                    valid += len(line)
+            if os.path.getsize(self.checkpoint_path) > valid:
+                with open(self.checkpoint_path, 'r+b') as checkpoint:
+                    checkpoint.truncate(valid)
+
+        for resource in ('courses',) + self.__resources:
+            path: str = self.path(resource)
+            size: int = sizes.get(resource, 0)
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, 'r+b') as file:
+                    file.truncate(size)
+
+    def __write(self, key: str, resource: str, items: list, next_page_token: str or None):
+        """
+        appends a page to its resource file and checkpoints it, under one lock so the checkpointed
+        sizes always match the pages written.
+        """
+        with self.__lock:
+            file = self.__files.get(resource)
+            if file is None:
+                file = self.__files[resource] = open(self.path(resource), 'ab')
+            if items:
+                file.write(''.join(json.dumps(item, separators=(',', ':')) + '\n' for item in items).encode('utf-8'))
+                file.flush()
+            self.__state[key] = next_page_token
+            self.__counts[resource] = self.__counts.get(resource, 0) + len(items)
+            entry: dict = {'key': key, 'resource': resource, 'next': next_page_token, 'size': file.tell()}
+            self.__checkpoint.write(json.dumps(entry) + '\n')
+            self.__checkpoint.flush()
+
+    def __params(self, resource: str, page_token: str = None) -> dict:
+        params: dict = dict()
+        if self.__page_size:
+            params['pageSize'] = self.__page_size
+        if page_token:
+            params['pageToken'] = page_token
+        items_key: str = SNAPSHOT_RESOURCES[resource][1] if resource in SNAPSHOT_RESOURCES else resource
+        mask: str or None = field_mask(items_key, self.__fields.get(resource), listing=True)
+        if mask:
+            params['fields'] = mask
+        return params
+
+    def __list(self, key: str, resource: str, collection, items_key: str, params: dict, on_page=None):
+        """
+        pages through one listing from its checkpointed page token.
+        """
+        if key in self.__state and self.__state[key] is None:
+            return
+        request = collection.list(**params, **self.__params(resource, self.__state.get(key)))
+        while request is not None:
+            response: dict = request.execute()
+            items: list = response.get(items_key, [])
+            self.__write(key, resource, items, response.get('nextPageToken'))
+            if on_page is not None:
+                on_page(items)
+            request = collection.list_next(request, response)
+
+    def __crawl_course(self, course_id: str, resource: str):
+        key: str = f'{resource}:{course_id}'
+        collection_of, items_key = SNAPSHOT_RESOURCES[resource]
+        params: dict = {'courseId': course_id}
+        if resource == 'studentSubmissions':
+            params['courseWorkId'] = '-'
+        try:
+            self.__list(key, resource, collection_of(self.__client.classroom), items_key, params)
+        except HttpError as error:
+            _logger.error('An error occurred: %s' % error)
+            with self.__lock:
+                self.__failed.append(key)
+
+    def __listed_courses(self) -> list:
+        """
+        :return: the ids of the courses written by the previous runs
+        """
+        path: str = self.path('courses')
+        if not os.path.exists(path):
+            return []
+        with open(path, 'r', encoding='utf-8') as courses:
+            return [json.loads(line)['id'] for line in courses if line.strip()]
+
+    def __crawl(self):
+        if self.__fields.get('courses'):
+            # the course ids are needed for the sub-collections
+            mask: str = field_mask('courses', self.__fields['courses'])
+            if 'id' not in mask.split(','):
+                self.__fields['courses'] = f'id,{mask}'
+
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers, initializer=self.__client._init_worker,
+                                      thread_name_prefix='gcc-snapshot')
+        futures: set = set()
+
+        def submit(course_ids):
+            for course_id in course_ids:
+                for resource in self.__resources:
+                    futures.add(executor.submit(self.__crawl_course, course_id, resource))
+
+        try:
+            submit(self.__listed_courses())
+            try:
+                self.__list('courses', 'courses', self.__client.classroom.courses(), 'courses',
+                            self.__course_params,
+                            on_page=lambda items: submit(item['id'] for item in items))
+            except HttpError as error:
+                _logger.error('An error occurred: %s' % error)
+                self.__failed.append('courses')
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                futures.difference_update(finished)
+                for future in finished:
+                    future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from googleapiclient.errors import HttpError
 
 from src import gcc_validators
@@ -14,11 +16,12 @@ __all__ = [
 class Student(GccBase):
 
     def __init__(self, role: str = 'student', ref_cache_month: int = 12,
-                 email: str = None, work_space: str = None):
+                 email: str = None, work_space: str = None,
+                 cache_ttl: timedelta = None, cache_max_entries: int = 1000):
 
         if role != 'student':
             raise gcc_exceptions.InvalidRole()
-        super().__init__(role, ref_cache_month, work_space, email)
+        super().__init__(role, ref_cache_month, work_space, email, cache_ttl, cache_max_entries)
 
     @gcc_validators.validate_params(str, str, str)
     def reclaim_submission(self, course_id: str, course_work_id: str, submission_id: str) -> bool:
@@ -32,7 +35,7 @@ class Student(GccBase):
         :param submission_id: identifier of the student submission. 'string'
         :return: bool
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().courseWork().studentSubmissions().reclaim(
@@ -57,7 +60,7 @@ class Student(GccBase):
         :param submission_id: identifier of the student submission. 'string'
         :return: bool
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().courseWork().studentSubmissions().ternIn(
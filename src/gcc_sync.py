@@ -0,0 +1,276 @@
+import json
+import sqlite3
+import threading
+import time
+
+from src.gcc_fields import field_mask
+
+__all__ = [
+    'SyncStore',
+    'DeltaSync',
+    'normalize_time'
+]
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    account TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    update_time TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (account, course_id, resource)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS records (
+    account TEXT NOT NULL,
+    course_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    id TEXT NOT NULL,
+    update_time TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (account, course_id, resource, id)
+) WITHOUT ROWID;
+"""
+
+SYNC_RESOURCES: tuple = ('courseWork', 'studentSubmissions')
+
+
+def normalize_time(value: str) -> str:
+    """
+    this func defines the normalize_time function, pads the fraction of an rfc 3339 utc timestamp
+    ('2024-01-01T10:00:00.5Z') to nanoseconds, so timestamps compare correctly as strings.
+
+    :param value: updateTime of a resource 'string'
+    :return: the normalized timestamp, '' when value is empty 'string'
+    """
+    if not value:
+        return ''
+    value = value.rstrip('Z')
+    seconds, _, fraction = value.partition('.')
+    return f'{seconds}.{fraction.ljust(9, "0")}Z'
+
+
+class SyncStore:
+    """
+    sqlite backed local store of a delta sync, the synced records and an updateTime watermark per
+    (account, course, resource). a record is only written, and reported as changed, when its updateTime
+    differs from the stored one.
+    """
+
+    def __init__(self, path: str = 'data_endpoint/gcc_sync.sqlite3'):
+        self.__path: str = path
+        self.__lock = threading.RLock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__conn.execute('PRAGMA journal_mode=WAL')
+        self.__conn.execute('PRAGMA synchronous=NORMAL')
+        self.__conn.executescript(_SCHEMA)
+
+    @property
+    def path(self):
+        return self.__path
+
+    def close(self):
+        with self.__lock:
+            self.__conn.close()
+
+    def watermark(self, account: str, course_id: str, resource: str) -> str:
+        """
+        :return: the normalized updateTime of the newest synced record, '' before the first sync 'string'
+        """
+        with self.__lock:
+            row = self.__conn.execute('SELECT update_time FROM watermarks '
+                                      'WHERE account = ? AND course_id = ? AND resource = ?',
+                                      (account, course_id, resource)).fetchone()
+        return row[0] if row else ''
+
+    def get(self, account: str, course_id: str, resource: str, record_id: str = None) -> dict or list or None:
+        """
+        :param record_id: id of one record, None for every record of the course 'string'
+        :return: the record dict (None if unknown), or the list of records of the course
+        """
+        with self.__lock:
+            if record_id is not None:
+                row = self.__conn.execute('SELECT data FROM records WHERE account = ? AND course_id = ? '
+                                          'AND resource = ? AND id = ?',
+                                          (account, course_id, resource, str(record_id))).fetchone()
+                return json.loads(row[0]) if row else None
+            rows = self.__conn.execute('SELECT data FROM records WHERE account = ? AND course_id = ? '
+                                       'AND resource = ?', (account, course_id, resource)).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def commit(self, account: str, course_id: str, resource: str, records: list[dict], watermark: str) -> list[dict]:
+        """
+        this func defines the commit method, upserts the fetched records of a course and moves its watermark,
+        in one transaction.
+
+        :param records: fetched records, each with an id and an updateTime 'list'
+        :param watermark: the new normalized watermark 'string'
+        :return: the records that are new or changed since they were last stored
+        """
+        with self.__lock:
+            self.__conn.execute('BEGIN')
+            try:
+                changed: list = list()
+                for record in records:
+                    update_time: str = normalize_time(record.get('updateTime'))
+                    row = self.__conn.execute('SELECT update_time FROM records WHERE account = ? AND course_id = ? '
+                                              'AND resource = ? AND id = ?',
+                                              (account, course_id, resource, str(record['id']))).fetchone()
+                    if row and row[0] == update_time:
+                        continue
+                    self.__conn.execute('INSERT OR REPLACE INTO records '
+                                        '(account, course_id, resource, id, update_time, data) '
+                                        'VALUES (?, ?, ?, ?, ?, ?)',
+                                        (account, course_id, resource, str(record['id']), update_time,
+                                         json.dumps(record)))
+                    changed.append(record)
+                self.__conn.execute('INSERT OR REPLACE INTO watermarks '
+                                    '(account, course_id, resource, update_time, synced_at) VALUES (?, ?, ?, ?, ?)',
+                                    (account, course_id, resource, watermark, time.time()))
+                self.__conn.execute('COMMIT')
+            except BaseException:
+                self.__conn.execute('ROLLBACK')
+                raise
+        return changed
+
+    def reset(self, account: str, course_id: str = None):
+        """
+        drops the watermarks and records of an account (or one of its courses), the next sync is a full one.
+        """
+        where, args = ('account = ?', (account,)) if course_id is None else \
+            ('account = ? AND course_id = ?', (account, course_id))
+        with self.__lock:
+            self.__conn.execute(f'DELETE FROM watermarks WHERE {where}', args)
+            self.__conn.execute(f'DELETE FROM records WHERE {where}', args)
+
+
+class DeltaSync:
+    """
+    incremental sync of the course work and student submissions of a teacher's courses into a SyncStore.
+    course work is listed by updateTime desc and paging stops at the first item not newer than the
+    course's watermark, so a course without changes costs one request.
+    student submissions can not be ordered by the api, they are listed for the whole course at once
+    (courseWorkId '-') and filtered against their watermark on the client.
+    records deleted on the server are not detected, reset() the store now and then for a full sync.
+    usage:
+        sync = DeltaSync(teacher)
+        for course_id, changes in sync.sync(course_ids, max_workers=8):
+            changes['courseWork'], changes['studentSubmissions']
+    """
+
+    def __init__(self, teacher, store: SyncStore = None, resources: tuple = SYNC_RESOURCES,
+                 course_work_states: list[str] = None, page_size: int = None, fields: dict = None):
+        """
+        :param teacher: the Teacher the courses are synced with
+        :param store: the local store, defaults to data_endpoint/gcc_sync.sqlite3
+        :param resources: courseWork and / or studentSubmissions 'tuple'
+        :param course_work_states: courseWorkStates of the course work listing, None for the api default 'list'
+        :param page_size: page size of the listings, None lets the server pick the maximum 'int'
+        :param fields: resource -> preset name or field mask of the synced records, id and updateTime are
+                       always requested 'dict'
+        """
+        unknown: set = set(resources) - set(SYNC_RESOURCES)
+        if unknown:
+            raise ValueError(f"Invalid sync resources: {', '.join(sorted(unknown))}")
+
+        self.__teacher = teacher
+        self.__store: SyncStore = store or SyncStore()
+        self.__resources: tuple = tuple(resources)
+        self.__course_work_states: list[str] or None = course_work_states
+        self.__page_size: int or None = page_size
+        self.__fields: dict = {resource: self.__mask(resource, mask) for resource, mask in (fields or {}).items()}
+
+    @property
+    def store(self):
+        return self.__store
+
+    @property
+    def resources(self):
+        return self.__resources
+
+    @staticmethod
+    def __mask(resource: str, fields: str) -> str or None:
+        mask: str or None = field_mask(resource, fields)
+        if not mask:
+            return None
+        names: list = mask.split(',')
+        return ','.join([name for name in ('id', 'updateTime') if name not in names] + names)
+
+    def sync_course(self, course_id: str) -> dict or False:
+        """
+        this func defines the sync_course method, syncs one course and stores what changed.
+        a watermark only moves once its listing completed, a failed listing is retried from the same
+        watermark by the next sync.
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :return: {resource: list of new or changed records} | False
+        """
+        changes: dict = dict()
+        for resource in self.__resources:
+            if resource == 'courseWork':
+                records = self.__fetch_course_work(course_id)
+            else:
+                records = self.__fetch_submissions(course_id)
+            if records is False:
+                return False
+            fetched, watermark = records
+            changes[resource] = self.__store.commit(self.__teacher.check, course_id, resource, fetched, watermark)
+        return changes
+
+    def sync(self, course_ids: list[str] = None, max_workers: int = 8):
+        """
+        this func defines the sync method, syncs several courses concurrently (see GccBase.map_concurrent).
+
+        :param course_ids: the courses to sync, defaults to every cached course of the teacher 'list'
+        :param max_workers: number of worker threads 'int'
+        :return: generator of (course_id, changes dict | False) as the courses complete
+        """
+        if course_ids is None:
+            # refreshes the course cache when it expired
+            self.__teacher.course_keys
+            course_ids = [course['id'] for course in self.__teacher.cache.get_courses(self.__teacher.check)]
+        return self.__teacher.map_concurrent(self.sync_course, list(course_ids),
+                                             max_workers=max_workers, ordered=False)
+
+    def __fetch_course_work(self, course_id: str) -> tuple or False:
+        watermark: str = self.__store.watermark(self.__teacher.check, course_id, 'courseWork')
+        newest: str = watermark
+        fetched: list = list()
+        page_token: str or None = None
+        while True:
+            response = self.__teacher.list_course_work(course_id, states=self.__course_work_states,
+                                                       order_by='updateTime desc', page_size=self.__page_size,
+                                                       page_token=page_token,
+                                                       fields=self.__fields.get('courseWork'))
+            if response is False:
+                return False
+            for course_work in response['course_work_list']:
+                update_time: str = normalize_time(course_work.get('updateTime'))
+                # equal timestamps are fetched again, the store drops the ones it already has
+                if update_time < watermark:
+                    return fetched, newest
+                newest = max(newest, update_time)
+                fetched.append(course_work)
+            page_token = response['next_page_token']
+            if not page_token:
+                return fetched, newest
+
+    def __fetch_submissions(self, course_id: str) -> tuple or False:
+        watermark: str = self.__store.watermark(self.__teacher.check, course_id, 'studentSubmissions')
+        newest: str = watermark
+        fetched: list = list()
+        page_token: str or None = None
+        while True:
+            response = self.__teacher.list_student_submissions(course_id, '-', page_size=self.__page_size,
+                                                               sub_states=None, late=None, page_token=page_token,
+                                                               fields=self.__fields.get('studentSubmissions'))
+            if response is False:
+                return False
+            for submission in response['student_submissions']:
+                update_time: str = normalize_time(submission.get('updateTime'))
+                if update_time >= watermark:
+                    newest = max(newest, update_time)
+                    fetched.append(submission)
+            page_token = response['next_page_token']
+            if not page_token:
+                return fetched, newest
@@ -6,6 +6,9 @@ from src.gcc_base import GccBase
 from googleapiclient.errors import HttpError
 from src import gcc_exceptions
 from src import gcc_validators
+from src.gcc_fields import FIELD_PRESETS, field_mask
+from src.gcc_gradebook import Gradebook
+from src.gcc_sync import normalize_time
 
 __all__ = [
     'Teacher'
@@ -15,10 +18,11 @@ __all__ = [
 class Teacher(GccBase):
 
     def __init__(self, role: str = 'teacher', ref_cache_month: int = 12,
-                 email: str = None, work_space: str = None):
+                 email: str = None, work_space: str = None,
+                 cache_ttl: datetime.timedelta = None, cache_max_entries: int = 1000):
         if role != 'teacher':
             raise gcc_exceptions.InvalidRole()
-        super().__init__(role, ref_cache_month, work_space, email)
+        super().__init__(role, ref_cache_month, work_space, email, cache_ttl, cache_max_entries)
 
     def detailed_create_announcement(self, detailed_json: bool = False)-> dict or False:
         """
@@ -68,7 +72,7 @@ class Teacher(GccBase):
         :return: True
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if state not in ['ANNOUNCEMENT_STATE_UNSPECIFIED', 'PUBLISHED', 'DRAFT', 'DELETED']:
             raise gcc_exceptions.AnnouncementStateError()
@@ -113,7 +117,7 @@ class Teacher(GccBase):
         :return: True
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().announcements().delete(
@@ -127,7 +131,7 @@ class Teacher(GccBase):
             return False
 
     @gcc_validators.validate_params(str, str)
-    def get_announcement(self, course_id: str, announcement_id: str):
+    def get_announcement(self, course_id: str, announcement_id: str, fields: str = None):
         """
         this func defines the get_announcement method, get an announcement with the following params
         see https://developers.google.com/classroom/reference/rest/v1/courses.announcements/get
@@ -137,23 +141,25 @@ class Teacher(GccBase):
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param announcement_id: announcement's id 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response: dict = self.classroom.courses().announcements().get(
+            response: dict = self._execute_cached(self.classroom.courses().announcements().get(
                 courseId=course_id,
-                id=announcement_id
-            )
+                id=announcement_id,
+                fields=field_mask('announcements', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     def list_announcements(self, states: str, page_size: int = 10, order_by: str = None,
-                           page_token: str = None):
+                           page_token: str = None, course_id: str = None, fields: str = None):
         """
         this func defines the list_announcement method, get a list with all the announcements with the following params
         see https://developers.google.com/classroom/reference/rest/v1/courses.announcements/list
@@ -165,9 +171,15 @@ class Teacher(GccBase):
         :param page_size: Maximum number of items to return. Zero or unspecified indicates that the server may assign a maximum.
         :param order_by: Optional sort ordering for results
         :param page_token: https://developers.google.com/classroom/reference/rest/v1/courses.announcements/list#body.ListAnnouncementsResponse.FIELDS.next_page_token
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict | False
         """
-        query_params: dict = dict()
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = {'courseId': course_id}
+        query_params['fields'] = field_mask('announcements', fields, listing=True)
 
         if states:
             if states not in ['ANNOUNCEMENT_STATE_UNSPECIFIED', 'PUBLISHED', 'DRAFT', 'DELETED']:
@@ -186,11 +198,11 @@ class Teacher(GccBase):
 
         if page_token:
             gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+            query_params['pageToken'] = page_token
 
         try:
-            response = self.classroom.courses().announcements().list(**query_params)
-            announcements = response.get("courses", [])
+            response = self.classroom.courses().announcements().list(**query_params).execute()
+            announcements = response.get("announcements", [])
             next_page_token = response.get("nextPageToken", None)
 
             return {"announcements": announcements, "next_page_token": next_page_token}
@@ -217,7 +229,7 @@ class Teacher(GccBase):
         :return: response dict | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if assignee_mode not in ['ASSIGNEE_MODE_UNSPECIFIED', 'ALL_STUDENTS', 'INDIVIDUAL_STUDENTS']:
             raise gcc_exceptions.AssigneeModeError()
@@ -280,7 +292,7 @@ class Teacher(GccBase):
         :return: response dict | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = dict()
 
@@ -358,7 +370,7 @@ class Teacher(GccBase):
 
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if state not in ['COURSE_WORK_STATE_UNSPECIFIED', 'PUBLISHED', 'DRAFT', 'DELETED']:
             raise gcc_exceptions.CourseWorkStateError()
@@ -397,7 +409,7 @@ class Teacher(GccBase):
         :return: True or False 'bool'
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().courseWork().delete(
@@ -411,7 +423,7 @@ class Teacher(GccBase):
             return False
 
     @gcc_validators.validate_params(str, str)
-    def get_course_work(self, course_id: str, course_work_id: str) -> dict or False:
+    def get_course_work(self, course_id: str, course_work_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_course_work method, gets course work..
         see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork/get
@@ -419,16 +431,18 @@ class Teacher(GccBase):
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param course_work_id: identifier of the course work. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: True or False 'bool'
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response = self.classroom.courses().courseWork().get(
+            response = self._execute_cached(self.classroom.courses().courseWork().get(
                 courseId=course_id,
-                id=course_work_id
-            ).execute()
+                id=course_work_id,
+                fields=field_mask('courseWork', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -437,7 +451,7 @@ class Teacher(GccBase):
     @gcc_validators.validate_params(str)
     def list_course_work(self, course_id: str, states: list[str] = None,
                          order_by: str = 'updateTime desc', page_size: int = 10,
-                         page_token: str = None) -> tuple[list[dict], str] or False:
+                         page_token: str = None, fields: str = None) -> tuple[list[dict], str] or False:
         """
         this func defines the get_course_work method, Returns a list of course work that the requester is permitted to view.
         see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork/list
@@ -451,12 +465,54 @@ class Teacher(GccBase):
         :param page_size: Maximum number of items to return. Zero or unspecified indicates that the server may assign a maximum.
         :param order_by: Optional sort ordering for results
         :param page_token: Token identifying the next page of results to return. If empty, no further results are available 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: Tuple with a list of course work and nextPageToken value
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._course_work_query(course_id, states, order_by, page_size, page_token)
+        query_params['fields'] = field_mask('courseWork', fields, listing=True)
+
+        try:
+            response = self.classroom.courses().courseWork().list(**query_params).execute()
+            course_work_list = response.get("courseWork", [])
+            next_page_token = response.get("nextPageToken", None)
 
-        query_params = {'courseId': course_id}
+            return {"course_work_list": course_work_list, "next_page_token": next_page_token}
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    @gcc_validators.validate_params(str)
+    def iter_course_work(self, course_id: str, states: list[str] = None, order_by: str = 'updateTime desc',
+                         page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_course_work method, yields every course work of a course across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param states: Restriction on the work status to return. see list_course_work
+        :param order_by: Optional sort ordering for results
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of course work dicts
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._course_work_query(course_id, states, order_by, page_size)
+        query_params['fields'] = field_mask('courseWork', fields, listing=True)
+        collection = self.classroom.courses().courseWork()
+        return self._iter_pages(collection.list(**query_params), collection, 'courseWork', prefetch)
+
+    @staticmethod
+    def _course_work_query(course_id: str, states: list[str] = None, order_by: str = None,
+                           page_size: int = None, page_token: str = None) -> dict:
+        query_params: dict = {'courseId': course_id}
 
         if states:
             for state in states:
@@ -476,17 +532,9 @@ class Teacher(GccBase):
 
         if page_token:
             gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+            query_params['pageToken'] = page_token
 
-        try:
-            response = self.classroom.courses().courseWork().list(**query_params)
-            course_work_list = response.get("courseWork", [])
-            next_page_token = response.get("nextPageToken", None)
-
-            return {"course_work_list": course_work_list, "next_page_token": next_page_token}
-        except HttpError as error:
-            self.logger.error('An error occurred: %s' % error)
-            return False
+        return query_params
 
     @gcc_validators.validate_params(str, str, str)
     def modify_course_work_assignees(self, course_id: str, course_work_id: str, assignee_mode: str,
@@ -507,7 +555,7 @@ class Teacher(GccBase):
         :return: response dict | False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         if assignee_mode not in ['ASSIGNEE_MODE_UNSPECIFIED', 'ALL_STUDENTS', 'INDIVIDUAL_STUDENTS']:
             raise gcc_exceptions.AssigneeModeError()
@@ -591,7 +639,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = dict()
 
@@ -646,7 +694,7 @@ class Teacher(GccBase):
             return False
 
     @gcc_validators.validate_params(str, str, str)
-    def get_student_submissions(self, course_id: str, course_work_id: str, submission_id: str) -> dict or False:
+    def get_student_submissions(self, course_id: str, course_work_id: str, submission_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_student_submissions, returns a student submission.
         see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork.studentSubmissions/get
@@ -655,17 +703,19 @@ class Teacher(GccBase):
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param course_work_id: identifier of the course work. 'string'
         :param submission_id: identifier of the student submission. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response = self.classroom.courses().courseWork().studentSubmissions().get(
+            response = self._execute_cached(self.classroom.courses().courseWork().studentSubmissions().get(
                 courseId=course_id,
                 courseWorkId=course_work_id,
-                id=submission_id
-            ).execute()
+                id=submission_id,
+                fields=field_mask('studentSubmissions', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -674,7 +724,7 @@ class Teacher(GccBase):
     @gcc_validators.validate_params(str, str)
     def list_student_submissions(self, course_id: str, course_work_id: str, user_id: str = None,
                                  page_size: int = 10, sub_states: list[str] = 'SUBMISSION_STATE_UNSPECIFIED',
-                                 late: str = 'LATE_VALUES_UNSPECIFIED', page_token: str = None) -> dict or False:
+                                 late: str = 'LATE_VALUES_UNSPECIFIED', page_token: str = None, fields: str = None) -> dict or False:
         """
         this func defines the list_student_submissions, Returns a list of student submissions that the requester is permitted to view,
         factoring in the OAuth scopes of the response. - may be specified as the courseWorkId to include student submissions
@@ -701,19 +751,111 @@ class Teacher(GccBase):
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param course_work_id: identifier of the course work. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
+        query_params: dict = self._student_submissions_query(course_id, course_work_id, user_id, page_size,
+                                                             sub_states, late, page_token)
+        query_params['fields'] = field_mask('studentSubmissions', fields, listing=True)
 
-        query_params: dict = dict()
+        try:
+            response = self.classroom.courses().courseWork().studentSubmissions().list(**query_params).execute()
+            student_submissions = response.get("studentSubmissions", [])
+            next_page_token = response.get("nextPageToken", None)
+
+            return {"student_submissions": student_submissions, "next_page_token": next_page_token}
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    @gcc_validators.validate_params(str, str)
+    def iter_student_submissions(self, course_id: str, course_work_id: str, user_id: str = None,
+                                 page_size: int = None, sub_states: list[str] = None,
+                                 late: str = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_student_submissions method, yields every student submission across all pages.
+        - may be specified as the course_work_id to stream the submissions of every course work in the course.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork.studentSubmissions/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param course_work_id: identifier of the course work. 'string'
+        :param user_id: optional argument to restrict returned student work to the specified student.
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param sub_states: requested submission states. see list_student_submissions
+        :param late: requested lateness value. see list_student_submissions
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of student submission dicts
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._student_submissions_query(course_id, course_work_id, user_id, page_size,
+                                                             sub_states, late)
+        query_params['fields'] = field_mask('studentSubmissions', fields, listing=True)
+        collection = self.classroom.courses().courseWork().studentSubmissions()
+        return self._iter_pages(collection.list(**query_params), collection, 'studentSubmissions', prefetch)
+
+    @gcc_validators.validate_params(str)
+    def gradebook(self, course_id: str, course_work_states: list[str] = None, max_workers: int = 8) -> Gradebook or False:
+        """
+        this func defines the gradebook method, builds the students x course work grade matrix of a course.
+        the roster and the course work are listed concurrently, then the submissions of every course work
+        are listed on max_workers threads, only the fields a gradebook needs are requested.
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param course_work_states: the course work columns, see list_course_work, None for the published ones 'list'
+        :param max_workers: number of worker threads 'int'
+        :return: Gradebook | False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        try:
+            # results in input order, the items are not used as keys as course_work_states is a list
+            (_, course_work), (_, students) = self.map_concurrent(self._gradebook_listing,
+                                                                  [(course_id, 'courseWork', course_work_states),
+                                                                   (course_id, 'students', None)], max_workers=2)
+            # oldest course work first, by creationTime, so editing a course work does not move its column
+            course_work.sort(key=lambda work: (normalize_time(work.get('creationTime')), work['id']))
+            gradebook = Gradebook(course_id, students, course_work)
+
+            work: list = [(course_id, 'studentSubmissions', course_work_id) for course_work_id in gradebook.course_work_ids]
+            for _, submissions in self.map_concurrent(self._gradebook_listing, work, max_workers=max_workers,
+                                                      ordered=False):
+                for submission in submissions:
+                    gradebook.set_submission(submission)
+            return gradebook
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    def _gradebook_listing(self, course_id: str, resource: str, argument) -> list[dict]:
+        if resource == 'courseWork':
+            return list(self.iter_course_work(course_id, states=argument,
+                                              fields=f"{FIELD_PRESETS['courseWork']['grading']},creationTime"))
+        if resource == 'students':
+            return list(self.iter_students(course_id, fields='summary'))
+        return list(self.iter_student_submissions(course_id, argument, fields='grading'))
+
+    @staticmethod
+    def _student_submissions_query(course_id: str, course_work_id: str, user_id: str = None,
+                                   page_size: int = None, sub_states: list[str] = None,
+                                   late: str = None, page_token: str = None) -> dict:
+        query_params: dict = {'courseId': course_id, 'courseWorkId': course_work_id}
 
         if user_id:
             gcc_validators.are_params_string(user_id)
             query_params['userId'] = user_id
 
         if sub_states:
+            if isinstance(sub_states, str):
+                sub_states = [sub_states]
             for state in sub_states:
                 if state not in ['SUBMISSION_STATE_UNSPECIFIED', 'NEW', 'CREATED',
                                  'TURNED_IN', 'RETURNED', 'RECLAIMED_BY_STUDENT']:
@@ -722,9 +864,8 @@ class Teacher(GccBase):
 
         if late:
             gcc_validators.are_params_string(late)
-            for late_value in late:
-                if late_value not in ['LATE_VALUES_UNSPECIFIED', 'LATE_ONLY', 'NOT_LATE_ONLY']:
-                    raise gcc_exceptions.SubmissionLateValueError()
+            if late not in ['LATE_VALUES_UNSPECIFIED', 'LATE_ONLY', 'NOT_LATE_ONLY']:
+                raise gcc_exceptions.SubmissionLateValueError()
             query_params['late'] = late
 
         if page_size:
@@ -735,21 +876,9 @@ class Teacher(GccBase):
 
         if page_token:
             gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+            query_params['pageToken'] = page_token
 
-        try:
-            response = self.classroom.courses().studentSubmissions().list(
-                courseId=course_id,
-                courseWorkId=course_work_id,
-                **query_params
-            ).execute()
-            student_submissions = response.get("studentSubmissions", [])
-            next_page_token = response.get("nextPageToken", None)
-
-            return {"student_submissions": student_submissions, "next_page_token": next_page_token}
-        except HttpError as error:
-            self.logger.error('An error occurred: %s' % error)
-            return False
+        return query_params
 
     @gcc_validators.validate_params(str, str, str, dict)
     def modify_submissions_attachments(self, course_id: str, course_work_id: str, submission_id: str,
@@ -769,7 +898,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = {
             "addAttachments": [
@@ -847,7 +976,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = dict()
 
@@ -903,7 +1032,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             response = self.classroom.courses().courseWork().studentSubmissions().return_(
@@ -916,6 +1045,69 @@ class Teacher(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str, str, list)
+    def batch_return_student_submissions(self, course_id: str, course_work_id: str,
+                                         submission_ids: list[str]) -> dict or False:
+        """
+        this func defines the batch_return_student_submissions, returns many student submissions
+        with one batch http request per 50 submissions.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork.studentSubmissions/return
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param course_work_id: identifier of the course work. 'string'
+        :param submission_ids: identifiers of the student submissions. 'list[string]'
+        :return: {"responses": {submission_id: response}, "errors": {submission_id: HttpError}} or False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        batch = self.batch()
+        for submission_id in submission_ids:
+            batch.add(self.classroom.courses().courseWork().studentSubmissions().return_(
+                courseId=course_id,
+                courseWorkId=course_work_id,
+                id=submission_id
+            ), request_id=submission_id)
+        try:
+            return self._execute_batch(batch)
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    @gcc_validators.validate_params(str, list)
+    def batch_patch_grades(self, course_id: str, grades: list[dict]) -> dict or False:
+        """
+        this func defines the batch_patch_grades, sets the grades of many student submissions of a course
+        with one batch http request per 50 submissions.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.courseWork.studentSubmissions/patch
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param grades: dicts with courseWorkId, id (the submission) and assignedGrade and / or draftGrade 'list[dict]'
+        :return: {"responses": {"courseWorkId/id": response}, "errors": {"courseWorkId/id": HttpError}} or False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        batch = self.batch()
+        for grade in grades:
+            body: dict = {key: grade[key] for key in ('assignedGrade', 'draftGrade') if grade.get(key) is not None}
+            if not body:
+                raise ValueError(f"No grade to set for submission {grade.get('id')}")
+            batch.add(self.classroom.courses().courseWork().studentSubmissions().patch(
+                courseId=course_id,
+                courseWorkId=grade['courseWorkId'],
+                id=grade['id'],
+                updateMask=','.join(body.keys()),
+                body=body
+            ), request_id=f"{grade['courseWorkId']}/{grade['id']}")
+        try:
+            return self._execute_batch(batch)
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
     def detailed_create_course_work_materials(self, detailed_json: bool = False) -> dict or False:
         """
         this func defines the detailed_create_course_work_materials, creates a course work material.
@@ -962,7 +1154,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = {
             "title": title,
@@ -992,7 +1184,7 @@ class Teacher(GccBase):
         :return: bool
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().courseWorkMaterials().delete(
@@ -1006,7 +1198,7 @@ class Teacher(GccBase):
             return False
 
     @gcc_validators.validate_params(str, str)
-    def get_course_work_materials(self, course_id: str, c_w_m_id: str) -> dict or False:
+    def get_course_work_materials(self, course_id: str, c_w_m_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_course_work_materials, returns a course work material.
         see https://developers.google.com/classroom/reference/rest/v1/courses.courseWorkMaterials/get
@@ -1014,16 +1206,18 @@ class Teacher(GccBase):
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param c_w_m_id: identifier of the course work material to get. 'string'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response = self.classroom.courses().courseWorkMatirials().get(
+            response = self._execute_cached(self.classroom.courses().courseWorkMaterials().get(
                 courseId=course_id,
-                id=c_w_m_id
-            ).execute()
+                id=c_w_m_id,
+                fields=field_mask('courseWorkMaterial', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
@@ -1032,7 +1226,7 @@ class Teacher(GccBase):
     @gcc_validators.validate_params(str)
     def list_course_work_materials(self, course_id: str, c_w_m_states: list[str] = None, page_size: int = 10,
                                    page_token: str = None, order_by: str = None, material_link: str = None,
-                                   material_drive_id: str = None) -> dict or False:
+                                   material_drive_id: str = None, fields: str = None) -> dict or False:
         """
         this func defines the list_course_work_materials, returns a list of course work material that the
         requester is permitted to view.
@@ -1057,19 +1251,67 @@ class Teacher(GccBase):
         :param material_drive_id: optional filtering for course work material with at least one Drive material whose ID matches the provided string.
                                   if materialLink is also specified, course work material must have materials matching both filters.
 
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict or False
 
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
-        query_params: dict = dict()
+        query_params: dict = self._course_work_materials_query(course_id, c_w_m_states, page_size, page_token,
+                                                               order_by, material_link, material_drive_id)
+        query_params['fields'] = field_mask('courseWorkMaterial', fields, listing=True)
+
+        try:
+            response = self.classroom.courses().courseWorkMaterials().list(**query_params).execute()
+            course_work_material = response.get("courseWorkMaterial", [])
+            next_page_token = response.get("nextPageToken", None)
+
+            return {"course_work_material": course_work_material, "next_page_token": next_page_token}
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
+    @gcc_validators.validate_params(str)
+    def iter_course_work_materials(self, course_id: str, c_w_m_states: list[str] = None, page_size: int = None,
+                                   order_by: str = None, material_link: str = None,
+                                   material_drive_id: str = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_course_work_materials method, yields every course work material across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.courseWorkMaterials/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param c_w_m_states: status of the course work material. see list_course_work_materials
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param order_by: optional sort ordering for results. see list_course_work_materials
+        :param material_link: optional filtering by link material URL.
+        :param material_drive_id: optional filtering by Drive material ID.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of course work material dicts
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._course_work_materials_query(course_id, c_w_m_states, page_size, None,
+                                                               order_by, material_link, material_drive_id)
+        query_params['fields'] = field_mask('courseWorkMaterial', fields, listing=True)
+        collection = self.classroom.courses().courseWorkMaterials()
+        return self._iter_pages(collection.list(**query_params), collection, 'courseWorkMaterial', prefetch)
+
+    @staticmethod
+    def _course_work_materials_query(course_id: str, c_w_m_states: list[str] = None, page_size: int = None,
+                                     page_token: str = None, order_by: str = None, material_link: str = None,
+                                     material_drive_id: str = None) -> dict:
+        query_params: dict = {'courseId': course_id}
 
         if c_w_m_states:
             for state in c_w_m_states:
                 if state not in ['COURSEWORK_MATERIAL_STATE_UNSPECIFIED', 'PUBLISHED', 'DRAFT', 'DELETED']:
                     raise gcc_exceptions.CourseWorkMaterialStateError()
-            query_params['state'] = c_w_m_states
+            query_params['courseWorkMaterialStates'] = c_w_m_states
 
         if page_size:
             gcc_validators.are_params_int(page_size)
@@ -1079,10 +1321,10 @@ class Teacher(GccBase):
 
         if page_token:
             gcc_validators.are_params_string(page_token)
-            query_params['nextPageToken'] = page_token
+            query_params['pageToken'] = page_token
 
         if order_by:
-            gcc_validators.are_params_int(order_by)
+            gcc_validators.are_params_string(order_by)
             query_params['orderBy'] = order_by
 
         if material_link:
@@ -1093,18 +1335,7 @@ class Teacher(GccBase):
             gcc_validators.are_params_string(material_drive_id)
             query_params['materialDriveId'] = material_drive_id
 
-        try:
-            response = self.classroom.courses().courseWorkMatirials().list(
-                courseId=course_id,
-                **query_params
-            ).execute()
-            course_work_material = response.get("courseWorkMaterial", [])
-            next_page_token = response.get("nextPageToken", None)
-
-            return {"course_work_material": course_work_material, "next_page_token": next_page_token}
-        except HttpError as error:
-            self.logger.error('An error occurred: %s' % error)
-            return False
+        return query_params
 
     def detailed_patch_course_work_material(self, detailed_json: bool = False) -> dict or False:
         """
@@ -1168,7 +1399,7 @@ class Teacher(GccBase):
         :return: response dict or False
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = dict()
 
@@ -1236,7 +1467,7 @@ class Teacher(GccBase):
         :return: response dict | bool
         """
         # validation
-        gcc_validators.are_params_in_cache(course_id, enrollment_code)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = {
             "userId": user_id,
@@ -1253,6 +1484,43 @@ class Teacher(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str, list)
+    def batch_add_students(self, course_id: str, user_ids: list[str],
+                           enrollment_code: str = None) -> dict or False:
+        """
+        this func defines the batch_add_students, adds many users as students of a course
+        with one batch http request per 50 users.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.students/create
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param user_ids: numeric identifiers or email addresses of the users. 'list[string]'
+        :param enrollment_code: Enrollment code of the course, may be omitted with administrative permissions.
+        :return: {"responses": {user_id: response}, "errors": {user_id: HttpError}} or False
+        """
+        # validation
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = dict()
+        if enrollment_code:
+            gcc_validators.are_params_string(enrollment_code)
+            query_params['enrollmentCode'] = enrollment_code
+
+        batch = self.batch()
+        for user_id in user_ids:
+            batch.add(self.classroom.courses().students().create(
+                courseId=course_id,
+                body={"userId": user_id},
+                **query_params
+            ), request_id=user_id)
+        try:
+            results: dict = self._execute_batch(batch)
+            self._update_cache()
+            return results
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
     def detailed_add_student(self, detailed_json: bool = False) -> dict or False:
         """
         this func defines the detailed_add_student, adds a user as a student of a course.
@@ -1292,7 +1560,7 @@ class Teacher(GccBase):
                         }
         :return: bool
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().students().delete(
@@ -1305,8 +1573,36 @@ class Teacher(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str, list)
+    def batch_delete_students(self, course_id: str, user_ids: list[str]) -> dict or False:
+        """
+        this func defines the batch_delete_students, deletes many users as students of a course
+        with one batch http request per 50 users.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.students/delete
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param user_ids: numeric identifiers or email addresses of the users. 'list[string]'
+        :return: {"responses": {user_id: response}, "errors": {user_id: HttpError}} or False
+        """
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        batch = self.batch()
+        for user_id in user_ids:
+            batch.add(self.classroom.courses().students().delete(
+                courseId=course_id,
+                userId=user_id
+            ), request_id=user_id)
+        try:
+            results: dict = self._execute_batch(batch)
+            self._update_cache()
+            return results
+        except HttpError as error:
+            self.logger.error('An error occurred: %s' % error)
+            return False
+
     @gcc_validators.validate_params(str, str)
-    def get_student(self, course_id: str, user_id: str) -> dict or False:
+    def get_student(self, course_id: str, user_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_student, return a user as a student of a course.
         see https://developers.google.com/classroom/reference/rest/v1/courses.students/get
@@ -1319,22 +1615,24 @@ class Teacher(GccBase):
                             the email address of the user ,
                             the string literal "me" indicating the requesting user
 
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict or False
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response = self.classroom.courses().students().get(
+            response = self._execute_cached(self.classroom.courses().students().get(
                 courseId=course_id,
-                id=user_id
-            ).execute()
+                id=user_id,
+                fields=field_mask('students', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def list_students(self, course_id: str, page_size: int = 10, page_token: str = None) -> dict or False:
+    def list_students(self, course_id: str, page_size: int = 10, page_token: str = None, fields: str = None) -> dict or False:
         """
         this func defines the list_students, returns a list of students of this course that the requester is permitted to view.
         see https://developers.google.com/classroom/reference/rest/v1/courses.students/list
@@ -1347,21 +1645,13 @@ class Teacher(GccBase):
                            indicating that the subsequent page of results should be returned.
                            The list request must be otherwise identical to the one that resulted in this token.
 
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict or false
         """
-        gcc_validators.are_params_in_cache(course_id)
-
-        query_params: dict = dict()
-
-        if page_size:
-            gcc_validators.are_params_int(page_size)
-            if page_size >= 100:
-                raise ValueError("Page size cannot be more than 100.")
-            query_params["pageSize"] = page_size
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
-        if page_token:
-            gcc_validators.are_params_string(page_token)
-            query_params["pageToken"] = page_token
+        query_params: dict = self._page_query(page_size, page_token)
+        query_params['fields'] = field_mask('students', fields, listing=True)
 
         try:
             response = self.classroom.courses().students().list(
@@ -1377,6 +1667,28 @@ class Teacher(GccBase):
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str)
+    def iter_students(self, course_id: str, page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_students method, yields every student of a course across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.students/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param page_size: Maximum number of items per page. The default is 30 if unspecified or 0.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of student dicts
+        """
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
+
+        query_params: dict = self._page_query(page_size)
+        query_params['fields'] = field_mask('students', fields, listing=True)
+        collection = self.classroom.courses().students()
+        return self._iter_pages(collection.list(courseId=course_id, **query_params), collection,
+                                'students', prefetch)
+
     @gcc_validators.validate_params(str, str)
     def create_topic(self, course_id: str, topic_name: str) -> dict or False:
         """
@@ -1390,7 +1702,7 @@ class Teacher(GccBase):
         :param course_id: either identifier of the course or assigned alias. 'string'
         :return: response dict or False
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         body: dict = {
             "name": topic_name,
@@ -1419,7 +1731,7 @@ class Teacher(GccBase):
         :param topic_id: identifier of the topic.
         :return: bool
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             self.classroom.courses().topics().delete(
@@ -1432,30 +1744,32 @@ class Teacher(GccBase):
             return False
 
     @gcc_validators.validate_params(str, str)
-    def get_topic(self, course_id: str, topic_id: str) -> dict or False:
+    def get_topic(self, course_id: str, topic_id: str, fields: str = None) -> dict or False:
         """
         this func defines the get_topic, returns a topic.
-        see https://developers.google.com/classroom/reference/rest/v1/courses.topics/delete
+        see https://developers.google.com/classroom/reference/rest/v1/courses.topics/get
         for more info
 
         :param course_id: either identifier of the course or assigned alias. 'string'
         :param topic_id: identifier of the topic.
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the response 'string'
         :return: response dict or False
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
-            response = self.classroom.courses().topics().delete(
+            response = self._execute_cached(self.classroom.courses().topics().get(
                 courseId=course_id,
-                id=topic_id
-            ).execute()
+                id=topic_id,
+                fields=field_mask('topic', fields)
+            ))
             return response
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
     @gcc_validators.validate_params(str)
-    def list_topics(self, course_id: str, page_size: int = 10, page_token: str = None) -> dict or False:
+    def list_topics(self, course_id: str, page_size: int = 10, page_token: str = None, fields: str = None) -> dict or False:
         """
         this func defines the list_topics, returns the list of topics that the requester is permitted to view.
         see https://developers.google.com/classroom/reference/rest/v1/courses.topics/delete
@@ -1466,22 +1780,14 @@ class Teacher(GccBase):
                           The server may return fewer than the specified number of results.
         :param page_token: nextPageToken value returned from a previous list call, indicating that the subsequent
                           page of results should be returned. The list request must be otherwise identical to the one that resulted in this token.
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
         :return: response dict or False
 
         """
         gcc_validators.are_params_string(course_id)
 
-        query_params: dict = dict()
-
-        if page_size:
-            gcc_validators.are_params_int(page_size)
-            if page_size >= 100:
-                raise ValueError("Page size cannot be more than 100.")
-            query_params["pageSize"] = page_size
-
-        if page_token:
-            gcc_validators.are_params_string(page_token)
-            query_params["pageToken"] = page_token
+        query_params: dict = self._page_query(page_size, page_token)
+        query_params['fields'] = field_mask('topic', fields, listing=True)
 
         try:
             response = self.classroom.courses().topics().list(
@@ -1489,13 +1795,35 @@ class Teacher(GccBase):
                 **query_params
             ).execute()
 
-            topics = response.get("topics", [])
+            topics = response.get("topic", [])
             next_page_token = response.get("nextPageToken", None)
             return {"topics": topics, "nextPageToken": next_page_token}
         except HttpError as error:
             self.logger.error('An error occurred: %s' % error)
             return False
 
+    @gcc_validators.validate_params(str)
+    def iter_topics(self, course_id: str, page_size: int = None, prefetch: int = 1, fields: str = None):
+        """
+        this func defines the iter_topics method, yields every topic of a course across all pages.
+        the next page is fetched in the background while the current one is consumed.
+        see https://developers.google.com/classroom/reference/rest/v1/courses.topics/list
+        for more info
+
+        :param course_id: either identifier of the course or assigned alias. 'string'
+        :param page_size: Maximum number of items per page. Zero or unspecified lets the server pick the maximum.
+        :param prefetch: number of pages fetched ahead of the consumer 'int'
+        :param fields: preset name (see gcc_fields.FIELD_PRESETS) or field mask of the items 'string'
+        :return: generator of topic dicts
+        """
+        gcc_validators.are_params_string(course_id)
+
+        query_params: dict = self._page_query(page_size)
+        query_params['fields'] = field_mask('topic', fields, listing=True)
+        collection = self.classroom.courses().topics()
+        return self._iter_pages(collection.list(courseId=course_id, **query_params), collection,
+                                'topic', prefetch)
+
     @gcc_validators.validate_params(str, str, str)
     def patch_topic(self, course_id: str, topic_id: str, topic_name: str)-> dict or False:
         """
@@ -1511,7 +1839,7 @@ class Teacher(GccBase):
         :param topic_id: identifier of the topic
         :return: response dict or False
         """
-        gcc_validators.are_params_in_cache(course_id)
+        gcc_validators.are_params_in_cache(course_id, cache=self.course_keys)
 
         try:
             response: dict = self.classroom.courses().topics().patch(
@@ -0,0 +1,101 @@
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    import h2  # noqa: F401, httpx needs it for http/2
+except ImportError:
+    httpx = None
+
+__all__ = [
+    'PooledHttp',
+    'http2_available'
+]
+
+
+def http2_available() -> bool:
+    return httpx is not None
+
+
+class PooledHttp:
+    """
+    httplib2-compatible transport (the request() interface googleapiclient calls) over a pooled keep-alive session.
+    one instance is safe to share between threads, so every thread of a client reuses the same open
+    TLS connections instead of each httplib2.Http opening its own.
+    with http2=True and httpx[http2] installed requests are multiplexed over http/2,
+    otherwise an AuthorizedSession with a pool of pool_size connections is used.
+    """
+
+    def __init__(self, credentials, pool_size: int = 10, http2: bool = False, timeout: float = 60):
+        """
+        :param credentials: google auth credentials the requests are authorized with
+        :param pool_size: maximum number of kept-alive connections 'int'
+        :param http2: use http/2 when available 'bool'
+        :param timeout: seconds before a request times out 'float'
+        """
+        self.credentials = credentials
+        self.__pool_size: int = pool_size
+        self.__timeout: float = timeout
+        self.__http2: bool = bool(http2 and httpx is not None)
+
+        if self.__http2:
+            limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            self.__client = httpx.Client(http2=True, limits=limits, timeout=timeout)
+            self.__auth_request = Request()
+        else:
+            self.__client = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.__client.mount('https://', adapter)
+            self.__client.mount('http://', adapter)
+
+    @property
+    def pool_size(self):
+        return self.__pool_size
+
+    @property
+    def http2(self):
+        return self.__http2
+
+    def request(self, uri: str, method: str = 'GET', body=None, headers: dict = None,
+                redirections: int = 5, connection_type=None) -> tuple:
+        """
+        this func defines the request method, sends a request the way httplib2.Http.request does.
+
+        :return: (httplib2.Response, content bytes)
+        """
+        headers = dict(headers or {})
+        try:
+            if self.__http2:
+                self.credentials.before_request(self.__auth_request, method, uri, headers)
+                response = self.__client.request(method, uri, content=body, headers=headers,
+                                                 follow_redirects=redirections > 0)
+                status, reason = response.status_code, response.reason_phrase
+            else:
+                response = self.__client.request(method, uri, data=body, headers=headers,
+                                                 timeout=self.__timeout, allow_redirects=redirections > 0)
+                status, reason = response.status_code, response.reason
+            content: bytes = response.content
+        except requests.exceptions.Timeout as error:
+            raise TimeoutError(str(error)) from error
+        except requests.exceptions.ConnectionError as error:
+            raise ConnectionError(str(error)) from error
+        except Exception as error:
+            if httpx is not None and isinstance(error, httpx.TimeoutException):
+                raise TimeoutError(str(error)) from error
+            if httpx is not None and isinstance(error, httpx.TransportError):
+                raise ConnectionError(str(error)) from error
+            raise
+
+        info: dict = {key.lower(): value for key, value in response.headers.items()}
+        # the content is already decoded, like httplib2 does
+        if 'content-encoding' in info:
+            info['-content-encoding'] = info.pop('content-encoding')
+        info['status'] = str(status)
+        resp = httplib2.Response(info)
+        resp.reason = reason
+        return resp, content
+
+    def close(self):
+        self.__client.close()
@@ -1,4 +1,3 @@
-import json
 import re
 from src import gcc_exceptions
 
@@ -46,9 +45,7 @@ def are_params_int(*args, **kwargs):
         raise TypeError()
 
 
-def are_params_in_cache(*args, **kwargs):
-    with open(r'C:\Users\liavt\PycharmProjects\google_classroom_cli\src\data_endpoint\gcc_cache.json', 'r') as fh:
-        cache = json.load(fh)
+def are_params_in_cache(*args, cache=(), **kwargs):
     for param in args:
         if param not in cache:
             raise gcc_exceptions.NotInCache(param)